@@ -0,0 +1,441 @@
+"""benchmark.py
+
+Benchmarks of every stage of the normalizer over synthetic relations of
+parameterized sizes: the number of columns, functional dependencies, rows and
+distinct values per column, see objects.synthetic. Every benchmark records
+its time and peak memory, and can be saved as a baseline, or compared against
+one.
+
+    python benchmark.py --sizes small --save baseline.json
+    python benchmark.py --sizes small --compare baseline.json
+
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from functools import partial
+from itertools import product
+from typing import Any, Callable
+
+from objects.fd import MVD
+from objects.relation import Relation
+from objects.synthetic import generate_relation
+from rdbms_normalizer import (
+    Normalizer,
+    normalize_to_1NF,
+    normalize_to_2NF,
+    normalize_to_3NF,
+    normalize_to_4NF,
+    normalize_to_5NF,
+    normalize_to_BCNF,
+)
+
+
+class Size:
+    """The parameters of the synthetic relations of a benchmark.
+
+    Attributes:
+        columns (int): The number of columns.
+        fds (int): The number of functional dependencies.
+        rows (int): The number of rows.
+        distinct (int): The number of distinct values per column.
+    """
+
+    def __init__(self, columns: int, fds: int, rows: int, distinct: int):
+        """The constructor for the size of a benchmark.
+
+        Args:
+            columns (int): The number of columns, at least 4.
+            fds (int): The number of functional dependencies, at most the
+                number of columns minus 3.
+            rows (int): The number of rows.
+            distinct (int): The number of distinct values per column.
+        """
+        assert columns >= 4, "A relation needs at least 4 columns"
+        assert 0 <= fds <= columns - 3, f"Too many FDs for {columns} columns"
+        self.columns: int = columns
+        self.fds: int = fds
+        self.rows: int = rows
+        self.distinct: int = distinct
+
+    def __repr__(self) -> str:
+        """Representation method for the Size class.
+
+        Returns:
+            str: The name of the size, such as "c8-f3-r1000-d50".
+        """
+        return f"c{self.columns}-f{self.fds}-r{self.rows}-d{self.distinct}"
+
+    def to_dict(self) -> dict[str, int]:
+        """The parameters of the size.
+
+        Returns:
+            dict[str, int]: The parameters, by name.
+        """
+        return {
+            "columns": self.columns,
+            "fds": self.fds,
+            "rows": self.rows,
+            "distinct": self.distinct,
+        }
+
+
+SIZES: dict[str, list[Size]] = {
+    "small": [Size(6, 2, 200, 10), Size(8, 4, 1000, 20)],
+    "medium": [Size(8, 4, 10_000, 100), Size(10, 6, 10_000, 100)],
+    "large": [Size(10, 6, 100_000, 1000)],
+}
+
+
+def _fd_relation(size: Size, seed: int) -> Relation:
+    """Private function for a synthetic relation with functional
+    dependencies and a multi-valued column, see generate_relation().
+
+    Args:
+        size (Size): The size of the relation.
+        seed (int): The seed of the random values.
+
+    Returns:
+        Relation: The relation.
+    """
+    relation, _ = generate_relation(
+        columns=size.columns,
+        rows=size.rows,
+        fds=size.fds,
+        mvds=0,
+        non_atomic=1,
+        distinct=size.distinct,
+        seed=seed,
+        name="BenchmarkData",
+    )
+    return relation
+
+
+def _mvd_relation(
+    size: Size, seed: int, declare: bool = True
+) -> tuple[Relation, MVD]:
+    """Private function for a synthetic relation with a multivalued
+    dependency, see generate_relation().
+
+    Args:
+        size (Size): The size of the relation. Its FDs are not used.
+        seed (int): The seed of the random values.
+        declare (bool, optional): Whether the relation declares the MVD.
+            Defaults to True.
+
+    Returns:
+        tuple[Relation, MVD]: The relation, and its MVD.
+    """
+    relation, truth = generate_relation(
+        columns=size.columns,
+        rows=size.rows,
+        fds=0,
+        mvds=1,
+        distinct=size.distinct,
+        fanout=3,
+        declare=declare,
+        seed=seed,
+        name="BenchmarkMVDData",
+    )
+    return relation, next(iter(truth.mvds))
+
+
+def _stages(
+    relation: Relation, stages: list[Callable[[Relation], list[Relation]]]
+) -> list[Relation]:
+    """Private function for the decomposition of a relation by some stages
+    of the normalization, in order.
+
+    Args:
+        relation (Relation): The relation.
+        stages (list[Callable[[Relation], list[Relation]]]): The stages.
+
+    Returns:
+        list[Relation]: The decomposition.
+    """
+    relations: list[Relation] = [relation]
+    for stage in stages:
+        relations = [
+            decomposed for part in relations for decomposed in stage(part)
+        ]
+    _resolve(relations)
+    return relations
+
+
+def _benchmark_1NF(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of normalize_to_1NF()."""
+    return partial(_each, normalize_to_1NF, [_fd_relation(size, seed)])
+
+
+def _benchmark_2NF(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of normalize_to_2NF() over the
+    1NF decomposition."""
+    return partial(
+        _each,
+        normalize_to_2NF,
+        _stages(_fd_relation(size, seed), [normalize_to_1NF]),
+    )
+
+
+def _benchmark_3NF(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of normalize_to_3NF() over the
+    2NF decomposition."""
+    return partial(
+        _each,
+        normalize_to_3NF,
+        _stages(
+            _fd_relation(size, seed), [normalize_to_1NF, normalize_to_2NF]
+        ),
+    )
+
+
+def _benchmark_BCNF(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of normalize_to_BCNF() over the
+    3NF decomposition."""
+    return partial(
+        _each,
+        normalize_to_BCNF,
+        _stages(
+            _fd_relation(size, seed),
+            [normalize_to_1NF, normalize_to_2NF, normalize_to_3NF],
+        ),
+    )
+
+
+def _benchmark_4NF(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of normalize_to_4NF()."""
+    return partial(_each, normalize_to_4NF, [_mvd_relation(size, seed)[0]])
+
+
+def _benchmark_5NF(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of normalize_to_5NF()."""
+    return partial(_each, normalize_to_5NF, [_mvd_relation(size, seed)[0]])
+
+
+def _benchmark_verify_mvd(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of Relation.verify_mvd()."""
+    relation, mvd = _mvd_relation(size, seed)
+    return partial(relation.verify_mvd, mvd)
+
+
+def _benchmark_determine_mvds(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of Relation.determine_mvds()."""
+    relation, _ = _mvd_relation(size, seed, declare=False)
+    return relation.determine_mvds
+
+
+def _benchmark_Normalizer(size: Size, seed: int) -> Callable[[], Any]:
+    """Private function for the benchmark of Normalizer() to 5NF."""
+    return partial(Normalizer, _fd_relation(size, seed), "5NF")
+
+
+def _each(
+    stage: Callable[[Relation], list[Relation]], relations: list[Relation]
+) -> None:
+    """Private function for running a stage over every relation of a
+    decomposition, taking the data of every relation it returns, as
+    Normalizer() does.
+
+    Args:
+        stage (Callable[[Relation], list[Relation]]): The stage.
+        relations (list[Relation]): The decomposition.
+    """
+    for relation in relations:
+        _resolve(stage(relation))
+
+
+def _resolve(relations: list[Relation]) -> None:
+    """Private function for taking the lazy projections of some relations,
+    so that a stage is timed with the data of its decomposition, and not
+    just its projections.
+
+    Args:
+        relations (list[Relation]): The relations.
+    """
+    for relation in relations:
+        relation.data  # Resolves the lazy projection of the relation.
+
+
+# Every benchmark builds its input, untimed, and returns the timed call. The
+# stages change their input, so every run builds a new one.
+BENCHMARKS: dict[str, Callable[[Size, int], Callable[[], Any]]] = {
+    "normalize_to_1NF": _benchmark_1NF,
+    "normalize_to_2NF": _benchmark_2NF,
+    "normalize_to_3NF": _benchmark_3NF,
+    "normalize_to_BCNF": _benchmark_BCNF,
+    "normalize_to_4NF": _benchmark_4NF,
+    "normalize_to_5NF": _benchmark_5NF,
+    "verify_mvd": _benchmark_verify_mvd,
+    "determine_mvds": _benchmark_determine_mvds,
+    "Normalizer": _benchmark_Normalizer,
+}
+
+
+def run_benchmark(
+    name: str, size: Size, repeat: int = 5, seed: int = 0
+) -> dict[str, Any]:
+    """Run a benchmark.
+
+    The call is timed repeat times, every time on a new input, and then run
+    once more to trace its peak memory, as tracing slows it down.
+
+    Args:
+        name (str): The name of the benchmark, see BENCHMARKS.
+        size (Size): The size of its input.
+        repeat (int, optional): The number of timed runs. Defaults to 5.
+        seed (int, optional): The seed of the input. Defaults to 0.
+
+    Returns:
+        dict[str, Any]: The fastest and median time of the runs, in seconds,
+            and the peak memory of the traced run, in bytes.
+    """
+    times: list[float] = []
+    for _ in range(repeat):
+        call: Callable[[], Any] = BENCHMARKS[name](size, seed)
+        gc.collect()
+        start: float = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+
+    call = BENCHMARKS[name](size, seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "benchmark": name,
+        "size": str(size),
+        "parameters": size.to_dict(),
+        "time": min(times),
+        "median_time": statistics.median(times),
+        "peak_memory": peak,
+    }
+
+
+def compare(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    tolerance: float = 0.25,
+) -> list[str]:
+    """Compare the results of the benchmarks against a baseline.
+
+    Args:
+        results (list[dict[str, Any]]): The results, see run_benchmark().
+        baseline (list[dict[str, Any]]): The saved results of the baseline.
+        tolerance (float, optional): The fraction by which the time or the
+            peak memory of a benchmark can exceed the baseline. Defaults to
+            0.25.
+
+    Returns:
+        list[str]: A description of every regression.
+    """
+    saved: dict[tuple[str, str], dict[str, Any]] = {
+        (result["benchmark"], result["size"]): result for result in baseline
+    }
+    regressions: list[str] = []
+    for result in results:
+        before: dict[str, Any] | None = saved.get(
+            (result["benchmark"], result["size"])
+        )
+        if before is None:
+            continue
+        for metric in ("time", "peak_memory"):
+            if result[metric] > before[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{result['benchmark']}[{result['size']}] {metric}: "
+                    f"{before[metric]:.6g} -> {result[metric]:.6g} "
+                    f"({result[metric] / before[metric]:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the normalizer on synthetic relations."
+    )
+    parser.add_argument(
+        "--sizes",
+        choices=sorted(SIZES),
+        default="small",
+        help="The preset sizes of the relations.",
+    )
+    for parameter in ("columns", "fds", "rows", "distinct"):
+        parser.add_argument(
+            f"--{parameter}",
+            type=int,
+            nargs="+",
+            help=f"The {parameter} of the relations, instead of the preset "
+            "sizes. Every combination of the given parameters is run.",
+        )
+    parser.add_argument(
+        "--benchmarks",
+        choices=list(BENCHMARKS),
+        nargs="+",
+        default=list(BENCHMARKS),
+        help="The benchmarks to run. Defaults to every benchmark.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--save", metavar="PATH", help="Save the results as a baseline."
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Compare the results against a saved baseline, and fail on a "
+        "regression.",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    sizes: list[Size] = SIZES[args.sizes]
+    if args.columns or args.fds or args.rows or args.distinct:
+        default: Size = sizes[0]
+        sizes = [
+            Size(*parameters)
+            for parameters in product(
+                args.columns or [default.columns],
+                args.fds or [default.fds],
+                args.rows or [default.rows],
+                args.distinct or [default.distinct],
+            )
+        ]
+
+    results: list[dict[str, Any]] = []
+    for size in sizes:
+        for name in args.benchmarks:
+            result: dict[str, Any] = run_benchmark(
+                name, size, repeat=args.repeat, seed=args.seed
+            )
+            results.append(result)
+            print(
+                f"{name:<20}{str(size):<28}{result['time'] * 1000:>12.3f} ms"
+                f"{result['peak_memory'] / 2**20:>12.3f} MiB"
+            )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions: list[str] = compare(
+                results, json.load(file), tolerance=args.tolerance
+            )
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
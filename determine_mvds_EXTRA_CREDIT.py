@@ -1,6 +1,12 @@
+import logging
+
+from objects.logs import configure_logging, log_event
+from objects.policies import DecisionPolicy, PromptPolicy
 from objects.relation import Relation
 from rdbms_normalizer import normalize_to_4NF
 
+logger = logging.getLogger(__name__)
+
 Emp_no_MVDs_provided = Relation(
     name="EMP",
     columns={
@@ -173,6 +179,7 @@ CoffeeShopOrderSummaryData = Relation(
 
 def determine_multivalued_dependencies(
     relation: Relation = Emp_no_MVDs_provided,
+    policy: DecisionPolicy | None = None,
 ) -> list[Relation]:
     """Recursively decomposes a relation into 4NF by determining a set of
     valid multivalue dependencies that is selected by the user.
@@ -195,61 +202,80 @@ def determine_multivalued_dependencies(
         the dependency is added to the set that is returned via
         determine_mvds().
 
-        For each step in the decomposition the user is prompted to choose from
-        the set of verified multivalued dependencies. That multivalued
-        dependency is added to the relation and used to decompose the relation.
+        For each step in the decomposition the policy chooses from the set of
+        verified multivalued dependencies, by the decomposition each one
+        gives. That multivalued dependency is added to the relation and used
+        to decompose the relation.
 
         The final result is a fully 4NF set of relations from the original
         relation, only using the data instances of the relation.
 
     Args:
         relation (Relation): The Relation being decomposed.
+        policy (DecisionPolicy | None, optional): Chooses the multivalued
+            dependency when there is more than one. Defaults to None, which
+            chooses the first one with the fewest columns.
 
     Returns:
         list[Relation]: A list of relations that makes up the decomposition.
     """
-    print()
-    print("INPUT Relation:")
-    print("-" * 40)
-    print(relation)
-    print()
-    print("#" * 40)
-    print()
+    log_event(
+        logger,
+        logging.INFO,
+        "input_relation",
+        "\nINPUT Relation:\n%s\n%s\n\n%s\n",
+        "-" * 40,
+        relation,
+        "#" * 40,
+        relation=relation.name,
+    )
 
     available_mvds = list(relation.determine_mvds())
 
     if not available_mvds:
         return [relation]
 
-    print("\nPOSSIBLE DECOMPOSITIONS:")
+    log_event(logger, logging.DEBUG, "mvd_options", "\nPOSSIBLE MVDS:")
     for i, available_mvd in enumerate(available_mvds):
-        print(f"\t#{i}\t{available_mvd}")
+        log_event(
+            logger, logging.DEBUG, "mvd_option", "\t#%d\t%s", i, available_mvd
+        )
 
-    mvd_selection_number: int = (
-        int(input(f"Choose a MVD (0-{len(available_mvds) - 1}): "))
-        if len(available_mvds) > 1
-        else 0
+    # The decomposition of normalize_to_4NF(), a relation per attribute of
+    # the right-hand side.
+    mvd_selection_number: int = (policy or DecisionPolicy()).choose(
+        relation,
+        [
+            [mvd.lhs | {attribute} for attribute in mvd.rhs[0] | mvd.rhs[1]]
+            for mvd in available_mvds
+        ],
     )
 
-    assert mvd_selection_number < len(available_mvds)
-
     selected_mvd = available_mvds[mvd_selection_number]
-    relation.multivalued_dependencies.add(selected_mvd)
+    relation.add_multivalued_dependency(selected_mvd)
 
     decomposition: list[Relation] = normalize_to_4NF(relation)
     for decomposed_relation in decomposition:
-        print(decomposed_relation)
-        print("-" * 40)
-    print("=" * 40)
+        log_event(
+            logger,
+            logging.INFO,
+            "relation",
+            "%s\n%s",
+            decomposed_relation,
+            "-" * 40,
+            relation=decomposed_relation.name,
+        )
+    log_event(logger, logging.INFO, "decomposition", "=" * 40)
 
     all_decomposed_relations = []
     for decomposed_relation in decomposition:
         all_decomposed_relations.extend(
-            determine_multivalued_dependencies(decomposed_relation)
+            determine_multivalued_dependencies(decomposed_relation, policy)
         )
 
     return all_decomposed_relations
 
 
 if __name__ == "__main__":
-    determine_multivalued_dependencies()
+    configure_logging(verbosity=1)
+    determine_multivalued_dependencies(policy=PromptPolicy())
@@ -1,6 +1,12 @@
+import argparse
+
+from objects.ddl import DIALECTS, write_ddl
 from objects.fd import FD, MVD, NonAtomic
+from objects.logs import configure_logging
+from objects.metrics import NormalizationReport
+from objects.policies import PromptPolicy
 from objects.relation import Relation
-from rdbms_normalizer import Normalizer
+from rdbms_normalizer import NORMAL_FORMS, Normalizer
 
 CoffeeShopDataSpecial = Relation(
     name="CoffeeShopData",
@@ -424,9 +430,72 @@ CoffeeShop5NFViolation = Relation(
 )  # Join Dependency: (R = R1(DrinkID, Milk) * R2(OrderID, CustomerID, DrinkID)
 
 
-def main() -> None:
-    normalize_to: str = input("Desired Normal Form: ")
-    Normalizer(CoffeeShopDataStandard, normalize_to)
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Normalize the CoffeeShop relation."
+    )
+    parser.add_argument(
+        "normal_form",
+        nargs="?",
+        choices=NORMAL_FORMS,
+        help="The desired normal form. Asked for when omitted.",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Also log every dependency the normalization acts on.",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Only log warnings.",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=("text", "json"),
+        default="text",
+        help="Log the messages, or a JSON object per event.",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write the timing and operation counts of every stage as JSON.",
+    )
+    parser.add_argument(
+        "--ddl",
+        metavar="PATH",
+        help="Write the CREATE TABLE statements of the decomposition.",
+    )
+    parser.add_argument(
+        "--dialect",
+        choices=DIALECTS,
+        default="sqlite",
+        help="The SQL dialect of the CREATE TABLE statements.",
+    )
+    args = parser.parse_args(argv)
+    configure_logging(
+        verbosity=-1 if args.quiet else args.verbose,
+        json_format=args.log_format == "json",
+    )
+
+    normalize_to: str = args.normal_form or input("Desired Normal Form: ")
+    report: NormalizationReport | None = (
+        NormalizationReport() if args.report else None
+    )
+    relations: list[Relation] = Normalizer(
+        CoffeeShopDataStandard,
+        normalize_to,
+        policy=PromptPolicy(),
+        report=report,
+    )
+    if args.ddl:
+        write_ddl(relations, args.ddl, dialect=args.dialect)
+    if report is not None:
+        with open(args.report, "w", encoding="utf-8") as file:
+            report.to_json(file)
 
 
 if __name__ == "__main__":
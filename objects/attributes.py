@@ -0,0 +1,119 @@
+from typing import Iterable, Iterator
+
+
+class AttributeUniverse:
+    """An interned mapping of attribute names to bit positions.
+
+    Every attribute of a relation is assigned a single bit, so a set of
+    attributes can be represented as an integer bitmask. Subset, union,
+    intersection and difference tests then become single integer operations
+    instead of hashing every attribute name.
+
+    A universe is immutable once built. Relations derived from a relation
+    (decompositions) share the universe of their parent, so that the
+    bitmasks cached on dependencies stay valid across the whole
+    normalization.
+    """
+
+    __slots__ = ("_names", "_positions")
+
+    def __init__(self, attributes: Iterable[str]):
+        """The constructor for an attribute universe.
+
+        Args:
+            attributes (Iterable[str]): The attributes of the universe. The
+                bit positions are assigned in sorted order, so equal sets of
+                attributes always produce the same universe.
+        """
+        self._names: tuple[str, ...] = tuple(sorted(set(attributes)))
+        self._positions: dict[str, int] = {
+            attribute: position
+            for position, attribute in enumerate(self._names)
+        }
+
+    def __repr__(self) -> str:
+        """Representation method for the AttributeUniverse class.
+
+        Returns:
+            str: The string representation of an attribute universe.
+        """
+        return f"AttributeUniverse({list(self._names)})"
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, attribute: object) -> bool:
+        return attribute in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    @property
+    def full_mask(self) -> int:
+        """The bitmask holding every attribute of the universe."""
+        return (1 << len(self._names)) - 1
+
+    def bit(self, attribute: str) -> int:
+        """The single-bit mask of an attribute.
+
+        Args:
+            attribute (str): The attribute name.
+
+        Raises:
+            KeyError: If the attribute is not part of the universe.
+
+        Returns:
+            int: The bitmask with only the bit of the attribute set.
+        """
+        try:
+            return 1 << self._positions[attribute]
+        except KeyError:
+            raise KeyError(
+                f"Attribute '{attribute}' not in the attribute universe."
+            ) from None
+
+    def mask(self, attributes: Iterable[str]) -> int:
+        """The bitmask of a set of attributes.
+
+        Args:
+            attributes (Iterable[str]): The attribute names.
+
+        Raises:
+            KeyError: If an attribute is not part of the universe.
+
+        Returns:
+            int: The bitmask with the bit of every attribute set.
+        """
+        mask: int = 0
+        for attribute in attributes:
+            mask |= self.bit(attribute)
+        return mask
+
+    def attributes(self, mask: int) -> set[str]:
+        """The set of attribute names represented by a bitmask.
+
+        Args:
+            mask (int): A bitmask of attributes in the universe.
+
+        Returns:
+            set[str]: The attribute names whose bits are set in the mask.
+        """
+        attributes: set[str] = set()
+        while mask:
+            low_bit: int = mask & -mask
+            attributes.add(self._names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return attributes
+
+
+def is_subset(mask: int, other: int) -> bool:
+    """Test if the attributes of one bitmask are a subset of another.
+
+    Args:
+        mask (int): The bitmask that may be the subset.
+        other (int): The bitmask that may be the superset.
+
+    Returns:
+        bool: True if every bit set in mask is also set in other.
+    """
+    return mask & ~other == 0
@@ -0,0 +1,160 @@
+from typing import Iterable
+
+import numpy as np
+
+from .attributes import is_subset
+
+
+def _positions(mask: int, columns: dict[int, int]) -> list[int]:
+    """Private function for the tableau columns of the bits of a bitmask.
+
+    Args:
+        mask (int): A bitmask of attributes.
+        columns (dict[int, int]): The tableau column of every bit.
+
+    Returns:
+        list[int]: The tableau columns of the attributes, in bit order.
+    """
+    return [column for bit, column in columns.items() if mask & bit]
+
+
+def _groups(tableau: np.ndarray, positions: list[int]) -> np.ndarray:
+    """Private function for labels of the rows of a tableau by their symbols
+    in some columns.
+
+    Args:
+        tableau (np.ndarray): The tableau.
+        positions (list[int]): The tableau columns.
+
+    Returns:
+        np.ndarray: The label of every row. Two rows have the same label
+            exactly when they agree on every column.
+    """
+    if not positions:
+        return np.zeros(len(tableau), dtype=np.int64)
+    _, labels = np.unique(tableau[:, positions], axis=0, return_inverse=True)
+    groups: np.ndarray = labels.reshape(-1)
+    return groups
+
+
+def chase_lossless(
+    components: Iterable[int],
+    fds: Iterable[tuple[int, int]],
+    mvds: Iterable[tuple[int, int]],
+    columns_mask: int,
+) -> bool:
+    """Test if the decomposition of a relation into some components has a
+    lossless (nonadditive) join under its dependencies, without any data.
+
+    The tableau has a row per component and a column per attribute. A row
+    holds the distinguished symbol 0 in the columns of its component and a
+    symbol of its own elsewhere. The dependencies are applied until nothing
+    changes:
+
+        -   X → Y: rows that agree on X are made to agree on Y, by renaming
+            the larger symbol of every column of Y to the smaller one, so
+            the distinguished symbol wins.
+        -   X →→ Y: for every two rows that agree on X, the row with the
+            symbols of the first on X ∪ Y and of the second elsewhere is
+            added.
+
+    The join is lossless exactly when a row becomes all distinguished, and
+    the chase stops as soon as one does. The tableau is an integer array,
+    with the symbols of a column numbered by the row they started in.
+
+    Algorithm:
+        Aho, A. V., Beeri, C., Ullman, J. D. (1979). The Theory of Joins in
+        Relational Databases.
+
+    Args:
+        components (Iterable[int]): The bitmask of every component.
+        fds (Iterable[tuple[int, int]]): The bitmasks of the left-hand side
+            and right-hand side of every functional dependency.
+        mvds (Iterable[tuple[int, int]]): The bitmasks of the left-hand side
+            and one side of the right-hand side of every multivalued
+            dependency over every column, X →→ Y | R - XY.
+        columns_mask (int): The bitmask of the columns of the relation.
+
+    Returns:
+        bool: True if the join of the projections on the components is every
+            relation state that satisfies the dependencies.
+    """
+    columns: dict[int, int] = {}
+    mask: int = columns_mask
+    while mask:
+        low_bit: int = mask & -mask
+        columns[low_bit] = len(columns)
+        mask ^= low_bit
+
+    masks: list[int] = list(components)
+    tableau: np.ndarray = np.repeat(
+        np.arange(1, len(masks) + 1, dtype=np.int32)[:, None],
+        len(columns),
+        axis=1,
+    )
+    for row, component in enumerate(masks):
+        tableau[row, _positions(component, columns)] = 0
+
+    fd_rules: list[tuple[list[int], list[int]]] = [
+        (
+            _positions(lhs, columns),
+            _positions(rhs & ~lhs & columns_mask, columns),
+        )
+        for lhs, rhs in fds
+        if is_subset(lhs, columns_mask)
+    ]
+    mvd_rules: list[tuple[list[int], list[int]]] = [
+        (
+            _positions(lhs, columns),
+            _positions(columns_mask & ~(lhs | rhs), columns),
+        )
+        for lhs, rhs in mvds
+        if is_subset(lhs | rhs, columns_mask)
+    ]
+
+    changed: bool = True
+    while changed:
+        changed = False
+        if not tableau.any(axis=1).all():
+            return True
+
+        for lhs_positions, rhs_positions in fd_rules:
+            groups: np.ndarray = _groups(tableau, lhs_positions)
+            for position in rhs_positions:
+                values: np.ndarray = tableau[:, position]
+                while True:
+                    lowest: np.ndarray = np.full(
+                        int(groups.max()) + 1, len(masks), dtype=np.int32
+                    )
+                    np.minimum.at(lowest, groups, values)
+                    targets: np.ndarray = lowest[groups]
+                    moved: np.ndarray = targets < values
+                    if not moved.any():
+                        break
+                    # Rename every occurrence of the symbols, not only the
+                    # ones in the rows that agree on X.
+                    rename: np.ndarray = np.arange(
+                        len(masks) + 1, dtype=np.int32
+                    )
+                    np.minimum.at(rename, values[moved], targets[moved])
+                    values = rename[values]
+                    tableau[:, position] = values
+                    changed = True
+            if changed and not tableau.any(axis=1).all():
+                return True
+        tableau = np.unique(tableau, axis=0)
+
+        for lhs_positions, z_positions in mvd_rules:
+            groups = _groups(tableau, lhs_positions)
+            first, second = np.nonzero(groups[:, None] == groups[None, :])
+            added: np.ndarray = tableau[first]
+            added[:, z_positions] = tableau[second][:, z_positions]
+            grown: np.ndarray = np.unique(
+                np.concatenate([tableau, added]), axis=0
+            )
+            if len(grown) > len(tableau):
+                changed = True
+                tableau = grown
+                if not tableau.any(axis=1).all():
+                    return True
+    return False
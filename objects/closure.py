@@ -0,0 +1,131 @@
+from typing import Iterable
+
+from .metrics import count
+
+
+class ClosureEngine:
+    """Linear-time attribute closure over a set of functional dependencies.
+
+    The functional dependencies are given in their bitmask form. Every
+    dependency keeps a counter of the attributes of its left-hand side that
+    are not yet part of the closure, and an inverted index maps each
+    attribute to the dependencies whose left-hand side contains it. Each
+    attribute that enters the closure is processed exactly once, so a closure
+    costs O(|F|) in the total size of the dependencies instead of repeated
+    scans over every dependency.
+
+    Algorithm:
+        Beeri, C., Bernstein, P. A. (1979). Computational Problems Related
+        to the Design of Normal Form Relational Schemas.
+    """
+
+    def __init__(self, dependencies: Iterable[tuple[int, int]]):
+        """The constructor for the closure engine.
+
+        Args:
+            dependencies (Iterable[tuple[int, int]]): The bitmasks of the
+                left-hand side and right-hand side of every functional
+                dependency.
+        """
+        self._lhs: list[int] = []
+        self._rhs: list[int] = []
+        self._lhs_sizes: list[int] = []
+        self._unconditional: list[int] = []  # Dependencies with empty LHS.
+        self._index: dict[int, list[int]] = {}
+        self._active: list[bool] = []
+
+        for lhs_mask, rhs_mask in dependencies:
+            dependency: int = len(self._lhs)
+            self._lhs.append(lhs_mask)
+            self._rhs.append(rhs_mask)
+            self._lhs_sizes.append(lhs_mask.bit_count())
+            self._active.append(True)
+            if not lhs_mask:
+                self._unconditional.append(dependency)
+
+            while lhs_mask:
+                low_bit: int = lhs_mask & -lhs_mask
+                self._index.setdefault(low_bit, []).append(dependency)
+                lhs_mask ^= low_bit
+
+    def __len__(self) -> int:
+        return len(self._lhs)
+
+    def set_active(self, dependency: int, active: bool) -> None:
+        """Include or exclude a dependency from later closures.
+
+        Args:
+            dependency (int): The position of the dependency in the order the
+                dependencies were given to the engine.
+            active (bool): Whether the dependency is used by closures.
+        """
+        self._active[dependency] = active
+
+    def closure(self, mask: int, target: int = 0) -> int:
+        """The closure X+ of a set of attributes.
+
+        Args:
+            mask (int): The bitmask of the attributes X.
+            target (int, optional): The bitmask of attributes being tested
+                for. The computation stops as soon as all of them are in the
+                closure, in which case the returned closure may be partial.
+                Defaults to 0, which computes the full closure.
+
+        Returns:
+            int: The bitmask of every attribute functionally determined by X.
+        """
+        count("closures")
+        counters: list[int] = self._lhs_sizes.copy()
+        result: int = mask
+        for dependency in self._unconditional:
+            if self._active[dependency]:
+                result |= self._rhs[dependency]
+
+        pending: int = result
+        while pending:
+            if target and target & ~result == 0:
+                break
+            low_bit: int = pending & -pending
+            pending ^= low_bit
+            for dependency in self._index.get(low_bit, ()):
+                counters[dependency] -= 1
+                if counters[dependency] or not self._active[dependency]:
+                    continue
+                added: int = self._rhs[dependency] & ~result
+                if added:
+                    result |= added
+                    pending |= added
+        return result
+
+    def closures(self, masks: Iterable[int]) -> list[int]:
+        """The closures of many sets of attributes.
+
+        The index is shared by every closure and repeated sets of attributes
+        are only computed once.
+
+        Args:
+            masks (Iterable[int]): The bitmasks of the sets of attributes.
+
+        Returns:
+            list[int]: The closure of each set of attributes, in the order of
+                the input.
+        """
+        computed: dict[int, int] = {}
+        results: list[int] = []
+        for mask in masks:
+            if mask not in computed:
+                computed[mask] = self.closure(mask)
+            results.append(computed[mask])
+        return results
+
+    def implies(self, lhs_mask: int, rhs_mask: int) -> bool:
+        """Test if the functional dependencies imply X → Y.
+
+        Args:
+            lhs_mask (int): The bitmask of the left-hand side X.
+            rhs_mask (int): The bitmask of the right-hand side Y.
+
+        Returns:
+            bool: True if Y is a subset of X+.
+        """
+        return rhs_mask & ~self.closure(lhs_mask, target=rhs_mask) == 0
@@ -0,0 +1,82 @@
+from .closure import ClosureEngine
+
+
+def minimal_cover(
+    dependencies: list[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """Compute a minimal cover of a set of functional dependencies.
+
+    Steps:
+        1.  Split every dependency X → Y into X → A for each A in Y - X.
+        2.  Remove every extraneous attribute B from each left-hand side,
+            where B is extraneous in X → A if A is in (X - {B})+.
+        3.  Remove every redundant dependency X → A, where X → A is
+            redundant if A is in X+ under the remaining dependencies.
+
+    Every test is a closure on a single closure engine, so no step rescans
+    the dependencies. Replacing X → A by (X - {B}) → A keeps the set
+    equivalent, which lets step 2 use the closures of the original set.
+
+    Args:
+        dependencies (list[tuple[int, int]]): The bitmasks of the left-hand
+            side and right-hand side of every functional dependency.
+
+    Returns:
+        list[tuple[int, int]]: The bitmasks of the dependencies of the
+            minimal cover, each with a single attribute on the right-hand
+            side.
+    """
+    # Step 1
+    split: dict[tuple[int, int], None] = {}  # Ordered set of dependencies.
+    for lhs_mask, rhs_mask in dependencies:
+        rhs_mask &= ~lhs_mask
+        while rhs_mask:
+            low_bit: int = rhs_mask & -rhs_mask
+            split[(lhs_mask, low_bit)] = None
+            rhs_mask ^= low_bit
+
+    # Step 2
+    engine = ClosureEngine(split)
+    reduced: dict[tuple[int, int], None] = {}
+    for lhs_mask, rhs_mask in split:
+        candidates: int = lhs_mask
+        while candidates:
+            low_bit = candidates & -candidates
+            candidates ^= low_bit
+            if engine.implies(lhs_mask ^ low_bit, rhs_mask):
+                lhs_mask ^= low_bit
+        reduced[(lhs_mask, rhs_mask)] = None
+
+    # Step 3
+    minimal: list[tuple[int, int]] = list(reduced)
+    engine = ClosureEngine(minimal)
+    cover: list[tuple[int, int]] = []
+    for dependency, (lhs_mask, rhs_mask) in enumerate(minimal):
+        engine.set_active(dependency, False)
+        if engine.implies(lhs_mask, rhs_mask):
+            continue  # Redundant, stays excluded from the later closures.
+        engine.set_active(dependency, True)
+        cover.append((lhs_mask, rhs_mask))
+    return cover
+
+
+def canonical_cover(
+    dependencies: list[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """Compute a canonical cover of a set of functional dependencies.
+
+    The canonical cover is the minimal cover with the dependencies that share
+    a left-hand side merged into a single dependency.
+
+    Args:
+        dependencies (list[tuple[int, int]]): The bitmasks of the left-hand
+            side and right-hand side of every functional dependency.
+
+    Returns:
+        list[tuple[int, int]]: The bitmasks of the dependencies of the
+            canonical cover, one per distinct left-hand side.
+    """
+    merged: dict[int, int] = {}
+    for lhs_mask, rhs_mask in minimal_cover(dependencies):
+        merged[lhs_mask] = merged.get(lhs_mask, 0) | rhs_mask
+    return list(merged.items())
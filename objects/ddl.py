@@ -0,0 +1,324 @@
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+import numpy as np
+import pandas as pd
+
+from .attributes import AttributeUniverse, is_subset
+from .relation import Relation
+
+DIALECTS: tuple[str, ...] = ("sqlite", "postgresql")
+
+_TYPES: dict[str, dict[str, str]] = {
+    "sqlite": {"integer": "INTEGER", "real": "REAL", "text": "TEXT"},
+    "postgresql": {
+        "integer": "BIGINT",
+        "real": "DOUBLE PRECISION",
+        "text": "TEXT",
+    },
+}
+_INTEGER = re.compile(r"^-?[1-9][0-9]{0,17}$|^0$")
+_REAL = re.compile(r"^-?[0-9]+\.[0-9]+$")
+
+
+def quote(identifier: str) -> str:
+    """Quote an identifier, valid in both dialects.
+
+    Args:
+        identifier (str): The name of a table or a column.
+
+    Returns:
+        str: The quoted identifier.
+    """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _kind(values: np.ndarray) -> str:
+    """Private function for the kind of SQL type that holds every value of a
+    column. Strings only count as numbers if they print back the same, so
+    that codes with leading zeros stay text.
+
+    Args:
+        values (np.ndarray): The distinct values of the column.
+
+    Returns:
+        str: "integer", "real" or "text".
+    """
+    kind: str = "integer"
+    for value in values:
+        if (
+            value is None
+            or value is pd.NA
+            or (isinstance(value, float) and np.isnan(value))
+        ):
+            continue
+        if isinstance(value, (bool, np.bool_)):
+            return "text"
+        if isinstance(value, (int, np.integer)):
+            continue
+        if isinstance(value, (float, np.floating)):
+            kind = "real"
+        elif isinstance(value, str) and _INTEGER.match(value):
+            continue
+        elif isinstance(value, str) and _REAL.match(value):
+            kind = "real"
+        else:
+            return "text"
+    return kind
+
+
+def _columns(relation: Relation) -> list[str]:
+    """Private function for the order of the columns of a table: the primary
+    key first, then the other columns, each in the order of the data
+    instances, or sorted without them.
+
+    Args:
+        relation (Relation): The relation.
+
+    Returns:
+        list[str]: The columns, in order.
+    """
+    order: list[str] = (
+        list(relation.data.columns)
+        if relation.data is not None
+        else sorted(relation.columns)
+    )
+    return [column for column in order if column in relation.primary_key] + [
+        column for column in order if column not in relation.primary_key
+    ]
+
+
+def _table_names(relations: list[Relation]) -> list[str]:
+    """Private function for a distinct table name per relation. Repeated or
+    missing names get a number, such as "R1_2".
+
+    Args:
+        relations (list[Relation]): The relations.
+
+    Returns:
+        list[str]: The table names, in the order of the relations.
+    """
+    names: list[str] = []
+    taken: set[str] = set()
+    for relation in relations:
+        name: str = relation.name or "Relation"
+        candidate: str = name
+        number: int = 1
+        while candidate.lower() in taken:
+            number += 1
+            candidate = f"{name}_{number}"
+        taken.add(candidate.lower())
+        names.append(candidate)
+    return names
+
+
+def foreign_keys(relations: list[Relation]) -> list[list[int]]:
+    """The tables every relation of a decomposition references. A relation
+    references another one if it holds its primary key. Of the relations
+    with the same primary key, the others reference the first one.
+
+    Args:
+        relations (list[Relation]): The relations of a decomposition.
+
+    Returns:
+        list[list[int]]: The positions of the relations every relation
+            references, by its primary key.
+    """
+    universe = AttributeUniverse(
+        column for relation in relations for column in relation.columns
+    )
+    # Every primary key is indexed under its smallest attribute, so that a
+    # relation only tests the keys of the attributes it holds.
+    keys: dict[str, dict[int, int]] = {}
+    for position, relation in enumerate(relations):
+        if relation.primary_key:
+            keys.setdefault(min(relation.primary_key), {}).setdefault(
+                universe.mask(relation.primary_key), position
+            )
+
+    references: list[list[int]] = []
+    for position, relation in enumerate(relations):
+        columns_mask: int = universe.mask(relation.columns)
+        references.append(
+            sorted(
+                target
+                for column in relation.columns
+                for key_mask, target in keys.get(column, {}).items()
+                if target != position and is_subset(key_mask, columns_mask)
+            )
+        )
+    return references
+
+
+def _creation_order(references: list[list[int]]) -> list[int]:
+    """Private function for an order of the tables where every referenced
+    table comes before the tables that reference it, as far as there are no
+    cycles.
+
+    Args:
+        references (list[list[int]]): The tables every table references.
+
+    Returns:
+        list[int]: The positions of the tables, in creation order.
+    """
+    order: list[int] = []
+    state: list[int] = [0] * len(references)  # New, visiting, or done.
+    for root in range(len(references)):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack: list[tuple[int, Iterator[int]]] = [
+            (root, iter(references[root]))
+        ]
+        while stack:
+            node, targets = stack[-1]
+            target: int | None = next(targets, None)
+            if target is None:
+                stack.pop()
+                state[node] = 2
+                order.append(node)
+            elif state[target] == 0:
+                state[target] = 1
+                stack.append((target, iter(references[target])))
+    return order
+
+
+def iter_ddl(
+    relations: Iterable[Relation], dialect: str = "sqlite"
+) -> Iterator[str]:
+    """The CREATE TABLE statement of every relation of a decomposition, one
+    at a time, with its primary key, a UNIQUE constraint per candidate key,
+    and its foreign keys, see foreign_keys().
+
+    The referenced tables are created first. PostgreSQL needs them to exist,
+    so a foreign key of a cycle of references is added with ALTER TABLE
+    after every table is created. SQLite allows forward references, but not
+    ALTER TABLE constraints, so its foreign keys are always inline.
+
+    The column types are inferred from the data instances, TEXT without
+    them.
+
+    Args:
+        relations (Iterable[Relation]): The relations, as returned by
+            Normalizer().
+        dialect (str, optional): "sqlite" or "postgresql". Defaults to
+            "sqlite".
+
+    Raises:
+        ValueError: If the dialect is unknown.
+
+    Yields:
+        Iterator[str]: The statements, each ending with ";".
+    """
+    if dialect not in DIALECTS:
+        raise ValueError(f"Invalid SQL Dialect: {dialect}")
+    types: dict[str, str] = _TYPES[dialect]
+    relations = list(relations)
+    names: list[str] = _table_names(relations)
+    references: list[list[int]] = foreign_keys(relations)
+
+    created: set[int] = set()
+    deferred: list[str] = []
+    for position in _creation_order(references):
+        relation: Relation = relations[position]
+        columns: list[str] = _columns(relation)
+        lines: list[str] = [
+            f"    {quote(column)} "
+            + types[
+                (
+                    _kind(relation.data.dictionaries[column])
+                    if relation.data is not None
+                    else "text"
+                )
+            ]
+            + (" NOT NULL" if column in relation.primary_key else "")
+            for column in columns
+        ]
+        if relation.primary_key:
+            lines.append(
+                "    PRIMARY KEY ("
+                + ", ".join(
+                    quote(column)
+                    for column in columns
+                    if column in relation.primary_key
+                )
+                + ")"
+            )
+        for candidate_key in sorted(
+            [column for column in columns if column in key]
+            for key in relation.candidate_keys
+            if key != relation.primary_key
+        ):
+            lines.append(
+                f"    UNIQUE ({', '.join(quote(c) for c in candidate_key)})"
+            )
+        for target in references[position]:
+            key: list[str] = [
+                column
+                for column in _columns(relations[target])
+                if column in relations[target].primary_key
+            ]
+            constraint: str = (
+                f"FOREIGN KEY ({', '.join(quote(c) for c in key)}) "
+                f"REFERENCES {quote(names[target])} "
+                f"({', '.join(quote(c) for c in key)})"
+            )
+            if dialect == "postgresql" and target not in created:
+                deferred.append(
+                    f"ALTER TABLE {quote(names[position])} "
+                    f"ADD {constraint};"
+                )
+            else:
+                lines.append(f"    {constraint}")
+        created.add(position)
+        yield (
+            f"CREATE TABLE {quote(names[position])} (\n"
+            + ",\n".join(lines)
+            + "\n);"
+        )
+    yield from deferred
+
+
+def write_ddl(
+    relations: Iterable[Relation],
+    file: TextIO | str | Path,
+    dialect: str = "sqlite",
+) -> int:
+    """Write the DDL of a decomposition, see iter_ddl(), statement by
+    statement, so that thousands of tables never build one string.
+
+    Args:
+        relations (Iterable[Relation]): The relations, as returned by
+            Normalizer().
+        file (TextIO | str | Path): A stream, or the path of the file to
+            write.
+        dialect (str, optional): "sqlite" or "postgresql". Defaults to
+            "sqlite".
+
+    Returns:
+        int: The number of statements written.
+    """
+    if not isinstance(file, (str, Path)):
+        return _write(relations, file, dialect)
+    with open(file, "w", encoding="utf-8") as stream:
+        return _write(relations, stream, dialect)
+
+
+def _write(relations: Iterable[Relation], stream: TextIO, dialect: str) -> int:
+    """Private function for writing the DDL of a decomposition to a stream,
+    see write_ddl().
+
+    Args:
+        relations (Iterable[Relation]): The relations.
+        stream (TextIO): The stream.
+        dialect (str): "sqlite" or "postgresql".
+
+    Returns:
+        int: The number of statements written.
+    """
+    statements: int = 0
+    for statement in iter_ddl(relations, dialect):
+        stream.write(statement + "\n\n")
+        statements += 1
+    return statements
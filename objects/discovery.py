@@ -0,0 +1,496 @@
+from functools import partial
+from itertools import combinations
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from .executor import Executor, SerialExecutor
+from .metrics import count
+from .partitions import PartitionCache
+
+
+def discover_dependencies(
+    attributes: dict[int, np.ndarray],
+    rows: int,
+    max_partition_bytes: int,
+    max_lhs_size: int | None = None,
+) -> list[tuple[int, int]]:
+    """Discover every minimal, non-trivial functional dependency that holds
+    on a relation instance.
+
+    The attribute sets are searched level by level, from the single
+    attributes upward. Every attribute set X keeps the candidates C+(X), the
+    right-hand sides A for which X - {A} → A could still be minimal, and the
+    validity of a dependency is decided by comparing the errors of stripped
+    partitions. Attribute sets with no candidates left, and superkeys, are
+    pruned with all of their supersets. With a bound on the left-hand side,
+    the partitions of the last level are never built: its dependencies are
+    checked against the classes of the left-hand side instead, see
+    StrippedPartition.determines().
+
+    Algorithm:
+        Huhtala, Y., Kärkkäinen, J., Porkka, P., Toivonen, H. (1999). TANE:
+        An Efficient Algorithm for Discovering Functional and Approximate
+        Dependencies.
+
+    Args:
+        attributes (dict[int, np.ndarray]): The codes of every row for every
+            attribute, keyed by the attribute's bitmask.
+        rows (int): The number of rows of the relation instance.
+        max_partition_bytes (int): The budget of bytes for the cached
+            partitions. Evicted partitions are recomputed when needed.
+        max_lhs_size (int | None, optional): The largest left-hand side
+            searched for. Defaults to None, which searches the whole
+            lattice.
+
+    Returns:
+        list[tuple[int, int]]: The bitmasks of the left-hand side and of the
+            single right-hand side attribute of every minimal dependency, in
+            the order they were found. Constant attributes are determined by
+            the empty set.
+    """
+    partitions = PartitionCache(attributes, rows, max_partition_bytes)
+    full_mask: int = 0
+    for bit in attributes:
+        full_mask |= bit
+
+    errors: dict[int, int] = {}
+
+    def error(mask: int) -> int:
+        if mask not in errors:
+            errors[mask] = partitions.get(mask).error
+        return errors[mask]
+
+    def holds(lhs_mask: int, rhs_bit: int) -> bool:
+        count("fd_checks")
+        if lhs_mask | rhs_bit in errors:
+            return error(lhs_mask) == error(lhs_mask | rhs_bit)
+        return partitions.get(lhs_mask).determines(attributes[rhs_bit])
+
+    dependencies: list[tuple[int, int]] = []
+    candidates: dict[int, int] = {0: full_mask}  # C+ of every attribute set
+    level: list[int] = list(attributes)
+    size: int = 1  # The number of attributes of the sets of the level.
+    while level:
+        # Compute the candidates of the level, from the previous level only,
+        # and the right-hand sides A to check X - {A} → A for, keyed by the
+        # left-hand side, so that every partition is fetched once.
+        checks: dict[int, int] = {}
+        for mask in level:
+            candidate: int = full_mask
+            remaining: int = mask
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                candidate &= candidates[mask ^ bit]
+            candidates[mask] = candidate
+
+            remaining = mask & candidate
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                checks[mask ^ bit] = checks.get(mask ^ bit, 0) | bit
+
+        # Compute the dependencies X - {A} → A of the level. A partition
+        # that is not cached is built from the one without its lowest
+        # attribute, so the left-hand sides that share it go together.
+        for lhs_mask, rhs_mask in sorted(
+            checks.items(), key=lambda check: check[0] & (check[0] - 1)
+        ):
+            remaining = rhs_mask
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                if holds(lhs_mask, bit):
+                    dependencies.append((lhs_mask, bit))
+                    candidates[lhs_mask | bit] &= lhs_mask
+
+        if max_lhs_size is not None and size > max_lhs_size:
+            break
+
+        # Prune the attribute sets without candidates, and the superkeys.
+        kept: list[int] = []
+        for mask in level:
+            if not candidates[mask]:
+                continue
+            if error(mask):
+                kept.append(mask)
+                continue
+
+            remaining = candidates[mask] & ~mask
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                subsets: int = mask
+                minimal: bool = True
+                while subsets and minimal:
+                    subset_bit: int = subsets & -subsets
+                    subsets ^= subset_bit
+                    minimal = not holds(mask ^ subset_bit, bit)
+                if minimal:
+                    dependencies.append((mask, bit))
+
+        # Generate the next level from the pairs of attribute sets that only
+        # differ in their highest attribute.
+        prefix_blocks: dict[int, list[int]] = {}
+        for mask in kept:
+            prefix_blocks.setdefault(
+                mask & ~(1 << (mask.bit_length() - 1)), []
+            ).append(mask)
+
+        # The next level is the last one when the left-hand sides are
+        # bounded. Its partitions are never built: its dependencies are
+        # checked on the partitions of this level, which are kept for it.
+        last: bool = max_lhs_size is not None and size >= max_lhs_size
+        kept_masks: set[int] = set(kept)
+        next_level: list[int] = []
+        for block in prefix_blocks.values():
+            for first, second in combinations(block, 2):
+                mask = first | second
+                remaining = mask
+                generated: bool = True
+                while remaining and generated:
+                    bit = remaining & -remaining
+                    remaining ^= bit
+                    generated = mask ^ bit in kept_masks
+                if generated:
+                    if not last:
+                        errors[mask] = partitions.product(first, second).error
+                    next_level.append(mask)
+
+        if not last:
+            for mask in level:
+                partitions.discard(mask)
+        level = next_level
+        size += 1
+
+    return dependencies
+
+
+def _bits(mask: int) -> list[int]:
+    """Private function for the single-bit masks of the bits of a bitmask.
+
+    Args:
+        mask (int): The bitmask.
+
+    Returns:
+        list[int]: The bitmask of every set bit, lowest first.
+    """
+    bits: list[int] = []
+    while mask:
+        low_bit: int = mask & -mask
+        bits.append(low_bit)
+        mask ^= low_bit
+    return bits
+
+
+def _pair_keys(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Private function for a single key per row for its pair of labels.
+
+    Args:
+        x (np.ndarray): The non-negative first label of every row.
+        y (np.ndarray): The non-negative second label of every row.
+
+    Returns:
+        np.ndarray: The int64 key of every row, x * (max(y) + 1) + y.
+    """
+    keys: np.ndarray = (
+        x.astype(np.int64) * (int(y.max()) + 1 if len(y) else 1) + y
+    )
+    return keys
+
+
+def _combine(x: np.ndarray | None, y: np.ndarray) -> np.ndarray:
+    """Private function for the dense labels of the rows by a pair of
+    labels.
+
+    Args:
+        x (np.ndarray | None): The first label of every row, or None for no
+            attributes.
+        y (np.ndarray): The second label of every row.
+
+    Returns:
+        np.ndarray: The label of every row. Two rows have the same label
+            exactly when they agree on both labels.
+    """
+    if x is None:
+        return y
+    labels: np.ndarray
+    labels, _ = pd.factorize(_pair_keys(x, y))
+    return labels
+
+
+def _multivalued(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> bool:
+    """Private function for testing X →→ Y | Z on the rows projected onto
+    X ∪ Y ∪ Z.
+
+    Within a group of X, the distinct (Y, Z) pairs are at most every
+    combination of the group's distinct Y values and distinct Z values. So
+    the dependency holds exactly when the number of distinct (X, Y, Z) rows
+    equals the sum over the groups of X of their distinct Y values times
+    their distinct Z values.
+
+    Args:
+        x (np.ndarray): The label of every row for X.
+        y (np.ndarray): The label of every row for Y.
+        z (np.ndarray): The label of every row for Z.
+
+    Returns:
+        bool: True if the multivalued dependency holds.
+    """
+    if not len(x):
+        return True
+    groups: int = int(x.max()) + 1
+    y_size: int = int(y.max()) + 1
+    z_size: int = int(z.max()) + 1
+    x_y, x_y_pairs = pd.factorize(_pair_keys(x, y))
+    distinct_y: np.ndarray = np.bincount(x_y_pairs // y_size, minlength=groups)
+    distinct_z: np.ndarray = np.bincount(
+        pd.unique(_pair_keys(x, z)) // z_size, minlength=groups
+    )
+    rows: int = len(pd.unique(_pair_keys(x_y, z)))
+    return rows == int(np.dot(distinct_y, distinct_z))
+
+
+def _block_atoms(
+    attributes: dict[int, np.ndarray], x: np.ndarray, block: int
+) -> list[int]:
+    """Private function for splitting a block of the dependency basis of X
+    into its finest parts Y, for which X →→ Y | R - X - Y holds.
+
+    Since X →→ block holds, a part of the block is only tested against the
+    rest of the block, on the projection onto X ∪ block. The attributes are
+    added one at a time. A multivalued dependency on a projection still
+    holds on any smaller projection, so adding an attribute A never splits
+    the parts found so far. It can only merge them: a part that is still
+    independent of everything else stays, and every other part is merged
+    with A. This takes a quadratic number of tests, instead of trying every
+    subset of the block.
+
+    Args:
+        attributes (dict[int, np.ndarray]): The codes of every row for every
+            attribute, keyed by the attribute's bitmask.
+        x (np.ndarray): The label of every row for X.
+        block (int): The bitmask of the block.
+
+    Returns:
+        list[int]: The bitmask of every part of the block.
+    """
+    parts: list[tuple[int, np.ndarray]] = []
+    remaining: int = block
+    while remaining:
+        bit: int = remaining & -remaining
+        remaining ^= bit
+        units: list[tuple[int, np.ndarray]] = parts + [(bit, attributes[bit])]
+
+        # The labels of the units before and after every part.
+        prefixes: list[np.ndarray | None] = [None]
+        for _, labels in parts:
+            prefixes.append(_combine(prefixes[-1], labels))
+        suffixes: list[np.ndarray] = [units[-1][1]]
+        for _, labels in reversed(units[1:-1]):
+            suffixes.append(_combine(suffixes[-1], labels))
+        suffixes.reverse()
+
+        merged_mask: int = bit
+        merged_labels: np.ndarray = attributes[bit]
+        parts = []
+        for i, (mask, labels) in enumerate(units[:-1]):
+            others: np.ndarray = _combine(prefixes[i], suffixes[i])
+            if _multivalued(x, labels, others):
+                parts.append((mask, labels))
+            else:
+                merged_mask |= mask
+                merged_labels = _combine(merged_labels, labels)
+        parts.append((merged_mask, merged_labels))
+
+    return [mask for mask, _ in parts]
+
+
+# The bitmask of X, the labels of X without its lowest attribute, the bases
+# and numbers of groups of the subsets X - {A}, and the bitmask of X+ - X.
+_LeftHandSide = tuple[int, np.ndarray, list[set[int]], list[int], int]
+
+
+def _left_hand_side(
+    attributes: dict[int, np.ndarray],
+    full_mask: int,
+    task: _LeftHandSide,
+) -> tuple[np.ndarray, int, set[int], set[int]] | None:
+    """Private function for the dependency basis of a left-hand side X, see
+    discover_multivalued_dependencies(). A module-level function, so that it
+    can run on a process pool.
+
+    Args:
+        attributes (dict[int, np.ndarray]): The codes of every row for every
+            attribute, keyed by the attribute's bitmask.
+        full_mask (int): The bitmask of every attribute.
+        task (_LeftHandSide): The bitmask of X, the labels of the rows for X
+            without its lowest attribute, the bases and the numbers of groups
+            of every subset X - {A}, and the bitmask of X+ - X.
+
+    Returns:
+        tuple[np.ndarray, int, set[int], set[int]] | None: The labels of the
+            rows for X, the number of groups of X, the basis of X and its
+            blocks that are not implied. None if X is pruned.
+    """
+    mask, subset_labels, subset_bases, subset_groups, implied = task
+    rows: int = len(subset_labels)
+
+    low_bit: int = mask & -mask
+    x: np.ndarray
+    x, _ = pd.factorize(_pair_keys(subset_labels, attributes[low_bit]))
+    x_groups: int = int(x.max(initial=-1)) + 1
+    if x_groups == rows:  # Unique in the instance.
+        return None
+    if mask != low_bit and x_groups in subset_groups:
+        return None  # X - {A} → A holds in the instance.
+
+    basis: set[int] = {full_mask & ~mask}
+    for other_basis in subset_bases:
+        basis = {
+            block & other & ~mask for block in basis for other in other_basis
+        } - {0}
+
+    while implied:
+        bit: int = implied & -implied
+        implied ^= bit
+        basis = {
+            part
+            for block in basis
+            for part in (block & ~bit, block & bit)
+            if part
+        }
+
+    known: set[int] = basis.copy()
+    basis = {
+        part
+        for block in known
+        for part in (
+            _block_atoms(attributes, x, block)
+            if block & (block - 1)
+            else [block]
+        )
+    }
+    return x, x_groups, basis, basis - known
+
+
+def discover_multivalued_dependencies(
+    attributes: dict[int, np.ndarray],
+    closure: Callable[[int], int],
+    is_superkey: Callable[[int], bool],
+    executor: Executor | None = None,
+) -> list[tuple[int, int]]:
+    """Discover the multivalued dependencies that hold on a relation
+    instance, without the ones implied by the functional dependencies or by
+    the multivalued dependencies of a smaller left-hand side.
+
+    The multivalued dependencies X →→ Y that hold for a fixed X are closed
+    under union, intersection and difference of their right-hand sides, so
+    they are the unions of the blocks of a partition of R - X, the
+    dependency basis of X. The left-hand sides are searched level by level,
+    from the single attributes upward, and the basis of every X starts as:
+
+        -   The common refinement of the bases of the subsets X - {A}, since
+            W →→ Y implies X →→ Y - X for W ⊆ X.
+        -   With every attribute A of X+ - X as a block of its own, since
+            X → A implies X →→ A.
+
+    The blocks with more than one attribute are then split on the data, see
+    _block_atoms(). The left-hand sides of a level are independent of each
+    other, so they are checked on the executor. Superkeys, by the functional
+    dependencies or because their values are unique in the instance, only
+    have trivial multivalued dependencies and are pruned with all of their
+    supersets. So is an X
+    whose basis only has single attributes, as the bases of its supersets
+    cannot be any finer, and an X with an attribute A such that X - {A} → A
+    holds in the instance: then X - {A} →→ X, and X has the same basis as
+    X - {A}, up to A.
+
+    Algorithm:
+        Beeri, C. (1980). On the Membership Problem for Functional and
+        Multivalued Dependencies in Relational Databases.
+
+    Args:
+        attributes (dict[int, np.ndarray]): The codes of every row for every
+            attribute, keyed by the attribute's bitmask.
+        closure (Callable[[int], int]): The closure of a bitmask under the
+            known functional dependencies.
+        is_superkey (Callable[[int], bool]): The superkey test of a bitmask
+            under the known functional dependencies and keys.
+        executor (Executor | None, optional): The executor the left-hand
+            sides of a level are checked on. Defaults to None, which checks
+            them serially.
+
+    Returns:
+        list[tuple[int, int]]: The bitmasks of the left-hand side X and of
+            the block Y of every new multivalued dependency X →→ Y | Z, where
+            Z is R - X - Y, in the order they were found.
+    """
+    executor = executor or SerialExecutor()
+    full_mask: int = 0
+    for bit in attributes:
+        full_mask |= bit
+    rows: int = len(next(iter(attributes.values()))) if attributes else 0
+
+    dependencies: list[tuple[int, int]] = []
+    bases: dict[int, set[int]] = {0: {full_mask}}
+    labels: dict[int, np.ndarray] = {0: np.zeros(rows, dtype=np.int64)}
+    groups: dict[int, int] = {0: min(rows, 1)}
+    level: list[int] = list(attributes)
+    while level:
+        next_bases: dict[int, set[int]] = {}
+        next_labels: dict[int, np.ndarray] = {}
+        next_groups: dict[int, int] = {}
+        tasks: list[_LeftHandSide] = [
+            (
+                mask,
+                labels[mask ^ (mask & -mask)],
+                [bases[mask ^ bit] for bit in _bits(mask)],
+                [groups[mask ^ bit] for bit in _bits(mask)],
+                closure(mask) & full_mask & ~mask,
+            )
+            for mask in level
+            if not is_superkey(mask)
+        ]
+        for task, result in zip(
+            tasks,
+            executor.map(
+                partial(_left_hand_side, attributes, full_mask), tasks
+            ),
+        ):
+            if result is None:
+                continue
+            mask: int = task[0]
+            x, x_groups, basis, new_blocks = result
+            dependencies.extend((mask, block) for block in sorted(new_blocks))
+            if any(block & (block - 1) for block in basis):
+                next_bases[mask] = basis
+                next_labels[mask] = x
+                next_groups[mask] = x_groups
+
+        # Generate the next level from the pairs of kept attribute sets that
+        # only differ in their highest attribute, leaving at least two
+        # attributes outside of the set.
+        prefix_blocks: dict[int, list[int]] = {}
+        for mask in next_bases:
+            prefix_blocks.setdefault(
+                mask & ~(1 << (mask.bit_length() - 1)), []
+            ).append(mask)
+
+        level = []
+        for prefix_block in prefix_blocks.values():
+            for first, second in combinations(prefix_block, 2):
+                mask = first | second
+                outside: int = full_mask & ~mask
+                if not outside & (outside - 1):
+                    continue
+                generated: bool = all(
+                    mask ^ bit in next_bases for bit in _bits(mask)
+                )
+                if generated:
+                    level.append(mask)
+        bases, labels, groups = next_bases, next_labels, next_groups
+
+    return dependencies
@@ -0,0 +1,426 @@
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .metrics import count
+
+CODE_DTYPE = np.int32
+
+_KEY_LIMIT: int = 1 << 62  # Keeps the combined row keys within an int64.
+
+
+def _hashable(value: Any) -> Any:
+    """Private function for making a multi-valued cell hashable.
+
+    Args:
+        value (Any): The value of a cell.
+
+    Returns:
+        Any: A frozenset for set and list cells, otherwise the value itself.
+    """
+    if isinstance(value, (set, list)):
+        return frozenset(value)
+    return value
+
+
+def _decodable(dictionary: np.ndarray) -> np.ndarray:
+    """Private function for turning the frozenset values of a dictionary back
+    into sets, as they were given to the relation.
+
+    Args:
+        dictionary (np.ndarray): The distinct values of a column.
+
+    Returns:
+        np.ndarray: The distinct values with every frozenset as a set.
+    """
+    if dictionary.dtype != object or not any(
+        isinstance(value, frozenset) for value in dictionary
+    ):
+        return dictionary
+    values: np.ndarray = np.empty(len(dictionary), dtype=object)
+    values[:] = [
+        set(value) if isinstance(value, frozenset) else value
+        for value in dictionary
+    ]
+    return values
+
+
+class EncodedData:
+    """Dictionary-encoded columnar storage of the data instances of a
+    relation.
+
+    Every column keeps a dictionary of its distinct values and an int32 code
+    per row, the position of the row's value in the dictionary. Projections,
+    duplicate removal and grouping then work on integer arrays instead of
+    hashing Python objects, and the values are only decoded on output.
+
+    Projections share the dictionaries of the data they were taken from, so
+    the codes of two projections of the same data can be compared (or
+    joined) directly.
+
+    Set cells are stored as frozensets, so that multi-valued columns can be
+    encoded like any other column before they are exploded.
+    """
+
+    __slots__ = ("columns", "dictionaries", "codes", "index")
+
+    def __init__(
+        self,
+        columns: list[str],
+        dictionaries: dict[str, np.ndarray],
+        codes: dict[str, np.ndarray],
+        index: np.ndarray,
+    ):
+        """The constructor for encoded data. See from_frame() for encoding a
+        DataFrame.
+
+        Args:
+            columns (list[str]): The column names, in order.
+            dictionaries (dict[str, np.ndarray]): The distinct values of every
+                column.
+            codes (dict[str, np.ndarray]): The code of every row for every
+                column.
+            index (np.ndarray): The label of every row.
+        """
+        for column in columns:
+            assert len(codes[column]) == len(
+                index
+            ), f"Column {column} does not have {len(index)} rows"
+
+        self.columns: list[str] = columns
+        self.dictionaries: dict[str, np.ndarray] = dictionaries
+        self.codes: dict[str, np.ndarray] = codes
+        self.index: np.ndarray = index
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "EncodedData":
+        """Encode the columns of a DataFrame.
+
+        Args:
+            frame (pd.DataFrame): The data instances.
+
+        Returns:
+            EncodedData: The encoded data instances.
+        """
+        dictionaries: dict[str, np.ndarray] = {}
+        codes: dict[str, np.ndarray] = {}
+        for column in frame.columns:
+            values: pd.Series = frame[column]
+            try:
+                column_codes, uniques = pd.factorize(
+                    values, use_na_sentinel=False
+                )
+            except TypeError:  # Unhashable set or list cells.
+                column_codes, uniques = pd.factorize(
+                    values.map(_hashable), use_na_sentinel=False
+                )
+            dictionaries[column] = np.asarray(uniques)
+            codes[column] = column_codes.astype(CODE_DTYPE, copy=False)
+        return cls(
+            list(frame.columns), dictionaries, codes, frame.index.to_numpy()
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the code arrays."""
+        return sum(codes.nbytes for codes in self.codes.values())
+
+    def to_frame(self) -> pd.DataFrame:
+        """Decode the data instances.
+
+        Returns:
+            pd.DataFrame: The data instances with their original values.
+        """
+        return pd.DataFrame(
+            {
+                column: _decodable(self.dictionaries[column])[
+                    self.codes[column]
+                ]
+                for column in self.columns
+            },
+            columns=self.columns,
+            index=pd.Index(self.index),
+        )
+
+    def codes_frame(
+        self, columns: Iterable[str] | None = None
+    ) -> pd.DataFrame:
+        """The codes of the data instances, without decoding them.
+
+        Args:
+            columns (Iterable[str] | None, optional): The columns. Defaults
+                to None, which takes every column.
+
+        Returns:
+            pd.DataFrame: The int32 code of every row for every column.
+        """
+        columns = self.columns if columns is None else list(columns)
+        return pd.DataFrame(
+            {column: self.codes[column] for column in columns},
+            columns=columns,
+            index=pd.Index(self.index),
+        )
+
+    def row_keys(self, columns: Iterable[str]) -> np.ndarray:
+        """A single integer key per row for its combination of values in the
+        given columns.
+
+        The codes are combined in mixed radix with the dictionary sizes. When
+        the product of the sizes would overflow, the keys are first
+        renumbered to the distinct keys so far, which are at most the number
+        of rows.
+
+        Args:
+            columns (Iterable[str]): The columns. If empty, every row gets the
+                same key.
+
+        Returns:
+            np.ndarray: The int64 key of every row. Two rows have the same key
+                exactly when they agree on every given column.
+        """
+        keys: np.ndarray = np.zeros(len(self), dtype=np.int64)
+        radix: int = 1
+        for column in columns:
+            size: int = max(len(self.dictionaries[column]), 1)
+            if radix * size >= _KEY_LIMIT:
+                distinct, keys = np.unique(keys, return_inverse=True)
+                radix = len(distinct)
+            keys = keys * size + self.codes[column]
+            radix *= size
+        return keys
+
+    def group_codes(self, columns: Iterable[str]) -> np.ndarray:
+        """Dense integer labels of the rows for their combination of values
+        in the given columns, numbered in order of first appearance.
+
+        Args:
+            columns (Iterable[str]): The columns. If empty, every row is given
+                the same label.
+
+        Returns:
+            np.ndarray: The label of every row.
+        """
+        labels: np.ndarray
+        labels, _ = pd.factorize(self.row_keys(columns))
+        return labels
+
+    def take(self, rows: np.ndarray) -> "EncodedData":
+        """The data instances at the given positions or boolean mask.
+
+        Args:
+            rows (np.ndarray): Row positions, or a boolean mask of the rows.
+
+        Returns:
+            EncodedData: The selected rows, sharing the dictionaries.
+        """
+        return EncodedData(
+            self.columns.copy(),
+            self.dictionaries,
+            {column: self.codes[column][rows] for column in self.columns},
+            self.index[rows],
+        )
+
+    def project(
+        self, columns: Iterable[str], distinct: bool = True
+    ) -> "EncodedData":
+        """The projection of the data instances onto some columns.
+
+        Args:
+            columns (Iterable[str]): The columns of the projection.
+            distinct (bool, optional): Whether duplicate rows are removed,
+                keeping the first occurrence. Defaults to True.
+
+        Returns:
+            EncodedData: The projection, sharing the dictionaries.
+        """
+        count("projections")
+        columns = list(columns)
+        projection = EncodedData(
+            columns,
+            {column: self.dictionaries[column] for column in columns},
+            {column: self.codes[column] for column in columns},
+            self.index,
+        )
+        return projection.drop_duplicates() if distinct else projection
+
+    def drop_duplicates(self) -> "EncodedData":
+        """The data instances without duplicate rows, keeping the first
+        occurrence of every row.
+
+        Returns:
+            EncodedData: The distinct rows.
+        """
+        count("drop_duplicates")
+        duplicated: np.ndarray = (
+            pd.Series(self.row_keys(self.columns)).duplicated().to_numpy()
+        )
+        if not duplicated.any():
+            return self
+        return self.take(~duplicated)
+
+    def drop(self, column: str) -> "EncodedData":
+        """The data instances without a column.
+
+        Args:
+            column (str): The column to remove.
+
+        Returns:
+            EncodedData: The data instances without the column.
+        """
+        return self.project(
+            [other for other in self.columns if other != column],
+            distinct=False,
+        )
+
+    def explode(self, column: str) -> "EncodedData":
+        """Split every multi-valued cell of a column into one row per value.
+
+        The column gets a new dictionary of the single values, like
+        pd.DataFrame.explode, and the rows are relabelled from zero. Empty
+        sets become a missing value.
+
+        Args:
+            column (str): The multi-valued column.
+
+        Returns:
+            EncodedData: The exploded data instances, sharing the
+                dictionaries of every other column.
+        """
+        elements: list[list[Any]] = [
+            (
+                (list(value) if value else [np.nan])
+                if isinstance(value, frozenset)
+                else [value]
+            )
+            for value in self.dictionaries[column]
+        ]
+        lengths: np.ndarray = np.array(
+            [len(values) for values in elements], dtype=np.int64
+        )[self.codes[column]]
+        rows: np.ndarray = np.repeat(np.arange(len(self)), lengths)
+        count("rows_exploded", len(rows))
+
+        exploded: pd.Series = pd.Series(
+            [
+                element
+                for code in self.codes[column]
+                for element in elements[code]
+            ],
+            dtype=object,
+        )
+        column_codes, uniques = pd.factorize(exploded, use_na_sentinel=False)
+
+        codes: dict[str, np.ndarray] = {
+            other: self.codes[other][rows]
+            for other in self.columns
+            if other != column
+        }
+        codes[column] = column_codes.astype(CODE_DTYPE, copy=False)
+        dictionaries: dict[str, np.ndarray] = self.dictionaries.copy()
+        dictionaries[column] = np.asarray(uniques)
+        return EncodedData(
+            self.columns.copy(),
+            dictionaries,
+            codes,
+            np.arange(len(rows)),
+        )
+
+
+class LazyProjection:
+    """A projection of encoded data that is only taken when it is read, see
+    resolve(). A decomposed relation holds one until its data instances are
+    needed, so a relation that is later discarded never copies or
+    deduplicates its rows.
+
+    A projection of a lazy projection is taken from the same parent data,
+    since the distinct rows of a projection of a projection are those of the
+    projection of the parent. Only an exploded column of a different
+    projection needs the parent to be resolved first.
+
+    Attributes:
+        data (EncodedData): The parent data instances.
+        columns (list[str]): The columns of the projection.
+        exploded (str | None): The multi-valued column whose cells are split
+            into one row per value, see EncodedData.explode().
+    """
+
+    __slots__ = ("data", "columns", "exploded")
+
+    def __init__(
+        self,
+        data: EncodedData,
+        columns: Iterable[str],
+        exploded: str | None = None,
+    ):
+        """The constructor for a lazy projection.
+
+        Args:
+            data (EncodedData): The parent data instances.
+            columns (Iterable[str]): The columns of the projection.
+            exploded (str | None, optional): The multi-valued column to
+                explode. Defaults to None.
+        """
+        self.columns: list[str] = list(columns)
+        assert set(self.columns) <= set(
+            data.columns
+        ), f"Columns {set(self.columns) - set(data.columns)} not in the data"
+        assert exploded is None or exploded in self.columns
+
+        self.data: EncodedData = data
+        self.exploded: str | None = exploded
+
+    def __repr__(self) -> str:
+        """Representation method for the LazyProjection class.
+
+        Returns:
+            str: The string representation of the lazy projection.
+        """
+        return f"π{self.columns} of {len(self.data)} rows" + (
+            f", exploding {self.exploded}" if self.exploded else ""
+        )
+
+    def project(self, columns: Iterable[str]) -> "LazyProjection":
+        """The lazy projection of the projection onto some of its columns.
+
+        Args:
+            columns (Iterable[str]): The columns.
+
+        Returns:
+            LazyProjection: The projection, taken from the same parent data.
+        """
+        columns = list(columns)
+        return LazyProjection(
+            self.data,
+            columns,
+            self.exploded if self.exploded in columns else None,
+        )
+
+    def explode(self, column: str) -> "LazyProjection":
+        """The lazy projection with the cells of a column split into one row
+        per value.
+
+        Args:
+            column (str): The multi-valued column.
+
+        Returns:
+            LazyProjection: The exploded projection.
+        """
+        if self.exploded not in (None, column):
+            return LazyProjection(self.resolve(), self.columns, column)
+        return LazyProjection(self.data, self.columns, column)
+
+    def resolve(self) -> EncodedData:
+        """Take the projection of the parent data, without duplicate rows.
+
+        Returns:
+            EncodedData: The projection, sharing the dictionaries of the
+                parent data except for an exploded column.
+        """
+        projection: EncodedData = self.data.project(self.columns)
+        if self.exploded is None:
+            return projection
+        return projection.explode(self.exploded).drop_duplicates()
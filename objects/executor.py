@@ -0,0 +1,237 @@
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+)
+from concurrent.futures import Executor as FuturesExecutor
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
+from os import cpu_count
+from types import TracebackType
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Executor:
+    """Runs the data checks of a loop, where every item is checked
+    independently of the others.
+
+    The results always come back in the order of the items, whatever the
+    backend, so the normalization does not depend on which worker finishes
+    first. This base class runs every item serially in the calling thread;
+    see ThreadExecutor and ProcessExecutor for the pooled backends.
+
+    An executor is a context manager that shuts its pool down on exit:
+
+        with make_executor("process", workers=32) as executor:
+            relation.determine_mvds(executor=executor)
+    """
+
+    workers: int = 1
+
+    def __enter__(self) -> "Executor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Release the workers of the executor, if any."""
+
+    def map(self, function: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Apply a function to every item.
+
+        Args:
+            function (Callable[[T], R]): The function. For ProcessExecutor it
+                must be picklable, e.g. a module-level function or a
+                functools.partial of one.
+            items (Iterable[T]): The items.
+
+        Returns:
+            list[R]: The result for every item, in the order of the items.
+        """
+        return [function(item) for item in items]
+
+    def map_unordered(
+        self,
+        function: Callable[[T], R],
+        items: Iterable[T],
+        on_error: Callable[[T, Exception], R] | None = None,
+    ) -> Iterator[R]:
+        """Apply a function to every item, yielding every result as soon as
+        it is ready.
+
+        The items are taken from the iterable as workers free up, so that
+        only a few of them are in flight at once.
+
+        Args:
+            function (Callable[[T], R]): The function, see map().
+            items (Iterable[T]): The items.
+            on_error (Callable[[T, Exception], R] | None, optional): Builds
+                the result of an item whose call failed, from the item and
+                the exception, which includes the crash of the worker that
+                ran it. Defaults to None, which raises the exception.
+
+        Returns:
+            Iterator[R]: The result for every item, in the order they finish,
+                which is the order of the items when run serially.
+        """
+        for item in items:
+            try:
+                result: R = function(item)
+            except Exception as error:
+                if on_error is None:
+                    raise
+                result = on_error(item, error)
+            yield result
+
+
+class SerialExecutor(Executor):
+    """The default executor, which checks every item in the calling
+    thread."""
+
+
+class _PoolExecutor(Executor):
+    """Private base class of the executors backed by a
+    concurrent.futures pool, which is started on first use."""
+
+    def __init__(
+        self,
+        pool_factory: Callable[[int], FuturesExecutor],
+        workers: int | None = None,
+    ):
+        """The constructor for a pooled executor.
+
+        Args:
+            pool_factory (Callable[[int], FuturesExecutor]): Builds the pool
+                from the number of workers.
+            workers (int | None, optional): The number of workers. Defaults to
+                None, which uses every CPU.
+        """
+        assert workers is None or workers >= 1, "Workers must be at least 1"
+
+        self.workers: int = workers or cpu_count() or 1
+        self._pool_factory: Callable[[int], FuturesExecutor] = pool_factory
+        self._pool: FuturesExecutor | None = None
+
+    @property
+    def pool(self) -> FuturesExecutor:
+        """The pool of workers, started on first use."""
+        if self._pool is None:
+            self._pool = self._pool_factory(self.workers)
+        return self._pool
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def map(self, function: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        items = list(items)
+        if len(items) <= 1:
+            return [function(item) for item in items]
+        return list(
+            self.pool.map(
+                function,
+                items,
+                chunksize=max(1, len(items) // (4 * self.workers)),
+            )
+        )
+
+    def map_unordered(
+        self,
+        function: Callable[[T], R],
+        items: Iterable[T],
+        on_error: Callable[[T, Exception], R] | None = None,
+    ) -> Iterator[R]:
+        items = iter(items)
+        window: int = 2 * self.workers
+        # Every future in flight, with its item and whether it runs alone.
+        pending: dict[Future[R], tuple[T, bool]] = {}
+        # The items in flight when a worker crashed, which are run again one
+        # at a time to find the one that crashed it.
+        suspects: deque[T] = deque()
+        while True:
+            if suspects:
+                if not pending:
+                    item: T = suspects.popleft()
+                    pending[self.pool.submit(function, item)] = (item, True)
+            else:
+                for item in islice(items, window - len(pending)):
+                    pending[self.pool.submit(function, item)] = (item, False)
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            if any(isinstance(f.exception(), BrokenExecutor) for f in done):
+                # Every other future of the broken pool fails with it.
+                done = set(pending)
+                wait(done)
+                self.shutdown()
+            for future in done:
+                item, alone = pending.pop(future)
+                error: BaseException | None = future.exception()
+                if isinstance(error, BrokenExecutor) and not alone:
+                    suspects.append(item)
+                elif isinstance(error, Exception):
+                    if on_error is None:
+                        raise error
+                    yield on_error(item, error)
+                elif error is not None:
+                    raise error
+                else:
+                    yield future.result()
+
+
+class ThreadExecutor(_PoolExecutor):
+    """Checks the items on a pool of threads. Most of the time of a check is
+    spent in numpy and pandas, which release the GIL."""
+
+    def __init__(self, workers: int | None = None):
+        super().__init__(ThreadPoolExecutor, workers)
+
+
+class ProcessExecutor(_PoolExecutor):
+    """Checks the items on a pool of processes. The function and the items
+    are pickled to the workers."""
+
+    def __init__(self, workers: int | None = None):
+        super().__init__(ProcessPoolExecutor, workers)
+
+
+def make_executor(
+    kind: str = "serial", workers: int | None = None
+) -> Executor:
+    """Build an executor by name.
+
+    Args:
+        kind (str, optional): "serial", "thread" or "process". Defaults to
+            "serial".
+        workers (int | None, optional): The number of workers of a pooled
+            executor. Defaults to None, which uses every CPU.
+
+    Raises:
+        ValueError: If the kind of executor is unknown.
+
+    Returns:
+        Executor: The executor.
+    """
+    if kind == "serial":
+        return SerialExecutor()
+    if kind == "thread":
+        return ThreadExecutor(workers)
+    if kind == "process":
+        return ProcessExecutor(workers)
+    raise ValueError(f"Invalid Executor Selection: {kind}")
@@ -1,3 +1,6 @@
+from .attributes import AttributeUniverse
+
+
 class FD:
     """Representation of a functional dependency"""
 
@@ -13,6 +16,9 @@ class FD:
         self.lhs: set[str] = lhs.copy()
         self.rhs: set[str] = rhs.copy()
 
+        self._hash: int | None = None
+        self._masks: tuple[AttributeUniverse, int, int] | None = None
+
     def __repr__(self) -> str:
         """Representation method for the FD class.
 
@@ -27,7 +33,31 @@ class FD:
         return self.lhs == other.lhs and self.rhs == other.rhs
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.lhs), frozenset(self.rhs)))
+        if self._hash is None:
+            self._hash = hash((frozenset(self.lhs), frozenset(self.rhs)))
+        return self._hash
+
+    def masks(self, universe: AttributeUniverse) -> tuple[int, int]:
+        """The bitmask form of the functional dependency.
+
+        The masks of the most recently used universe are cached, since the
+        relations of a decomposition share the universe of their parent.
+
+        Args:
+            universe (AttributeUniverse): The attribute universe the masks
+                are built from.
+
+        Returns:
+            tuple[int, int]: The bitmasks of the left-hand side and the
+                right-hand side of the dependency.
+        """
+        if self._masks is None or self._masks[0] is not universe:
+            self._masks = (
+                universe,
+                universe.mask(self.lhs),
+                universe.mask(self.rhs),
+            )
+        return self._masks[1], self._masks[2]
 
 
 class MVD:
@@ -67,6 +97,9 @@ class MVD:
         self.lhs: set[str] = lhs.copy()
         self.rhs: tuple[set[str], set[str]] = (rhs[0].copy(), rhs[1].copy())
 
+        self._hash: int | None = None
+        self._masks: tuple[AttributeUniverse, int, int, int] | None = None
+
     def __repr__(self) -> str:
         """Representation method for the MVD class.
 
@@ -90,12 +123,34 @@ class MVD:
         )
 
     def __hash__(self) -> int:
-        return hash(
-            (
-                frozenset(self.lhs),
-                (frozenset(self.rhs[0]), frozenset(self.rhs[1])),
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    frozenset(self.lhs),
+                    (frozenset(self.rhs[0]), frozenset(self.rhs[1])),
+                )
             )
-        )
+        return self._hash
+
+    def masks(self, universe: AttributeUniverse) -> tuple[int, int, int]:
+        """The bitmask form of the multivalued dependency.
+
+        Args:
+            universe (AttributeUniverse): The attribute universe the masks
+                are built from.
+
+        Returns:
+            tuple[int, int, int]: The bitmasks of the left-hand side and of
+                the two sets of attributes on the right-hand side.
+        """
+        if self._masks is None or self._masks[0] is not universe:
+            self._masks = (
+                universe,
+                universe.mask(self.lhs),
+                universe.mask(self.rhs[0]),
+                universe.mask(self.rhs[1]),
+            )
+        return self._masks[1], self._masks[2], self._masks[3]
 
 
 class NonAtomic:
@@ -113,6 +168,9 @@ class NonAtomic:
         self.lhs: set[str] = lhs.copy()
         self.rhs: set[str] = rhs.copy()
 
+        self._hash: int | None = None
+        self._masks: tuple[AttributeUniverse, int, int] | None = None
+
     def __repr__(self) -> str:
         """Representation method for the NonAtomic class.
 
@@ -131,4 +189,25 @@ class NonAtomic:
         return self.lhs == other.lhs and self.rhs == other.rhs
 
     def __hash__(self) -> int:
-        return hash((frozenset(self.lhs), frozenset(self.rhs)))
+        if self._hash is None:
+            self._hash = hash((frozenset(self.lhs), frozenset(self.rhs)))
+        return self._hash
+
+    def masks(self, universe: AttributeUniverse) -> tuple[int, int]:
+        """The bitmask form of the non-atomic value dependency.
+
+        Args:
+            universe (AttributeUniverse): The attribute universe the masks
+                are built from.
+
+        Returns:
+            tuple[int, int]: The bitmasks of the left-hand side and the
+                right-hand side of the dependency.
+        """
+        if self._masks is None or self._masks[0] is not universe:
+            self._masks = (
+                universe,
+                universe.mask(self.lhs),
+                universe.mask(self.rhs),
+            )
+        return self._masks[1], self._masks[2]
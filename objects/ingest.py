@@ -0,0 +1,698 @@
+import re
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .encoding import CODE_DTYPE, EncodedData, _hashable
+from .fd import FD, MVD, NonAtomic
+from .relation import Relation
+
+_KEYS = re.compile(
+    r"^(primary|candidate|unique)\s+keys?\s*:\s*(.*)$", re.IGNORECASE
+)
+_LABEL = re.compile(r"^FD\s*\d+\s*\)\s*", re.IGNORECASE)
+_NOTE = re.compile(r"\s*\(\s*an?\s+([^)]*)\)\s*$", re.IGNORECASE)
+_MULTIVALUED_ARROW = re.compile(r"\s*-+>>\s*")
+_ARROW = re.compile(r"\s*-+>\s*")
+_BRACES = re.compile(r"\{([^}]*)\}")
+
+PathLike = str | Path
+
+
+def _attributes(text: str) -> set[str]:
+    """Private function for parsing an attribute list, "{A, B}" or "A".
+
+    Args:
+        text (str): The attribute list.
+
+    Returns:
+        set[str]: The attribute names.
+    """
+    return {
+        attribute.strip()
+        for attribute in text.strip().strip("{}").split(",")
+        if attribute.strip()
+    }
+
+
+def _is_statement(text: str) -> bool:
+    """Private function for telling a schema statement from a data value.
+
+    Args:
+        text (str): The text of a row.
+
+    Returns:
+        bool: Whether the text declares keys or a dependency.
+    """
+    text = _LABEL.sub("", text.strip())
+    return bool(_KEYS.match(text) or _ARROW.search(text))
+
+
+class Schema:
+    """The schema metadata of a relation, read from the statements of a
+    sidecar sheet or file, one per line, in the notation of the repository:
+
+        Primary Key: {OrderID, DrinkID}
+        Candidate Keys: {CustomerID, OrderDate}, {InvoiceID}
+        FD1) OrderID --> {Date, CustomerID}
+        OrderID -->> DrinkID | FoodID (a MVD)
+        DrinkID --> DrinkIngredient (a non-atomic attribute)
+
+    Arrows may be written "-->" or "->", and "-->>" or "->>". "FDn)" labels
+    and lines that are not statements, such as headings and notes, are
+    ignored. "Unique Keys" is read as "Candidate Keys".
+
+    Attributes:
+        primary_key (set[str]): The primary key.
+        candidate_keys (set[frozenset[str]]): The candidate keys.
+        functional_dependencies (set[FD]): The functional dependencies.
+        multivalued_dependencies (set[MVD]): The multivalued dependencies.
+        non_atomic_columns (set[NonAtomic]): The multi-valued columns.
+    """
+
+    def __init__(
+        self,
+        primary_key: set[str] = set(),
+        candidate_keys: set[frozenset[str]] = set(),
+        functional_dependencies: set[FD] = set(),
+        multivalued_dependencies: set[MVD] = set(),
+        non_atomic_columns: set[NonAtomic] = set(),
+    ):
+        """The constructor for the schema metadata of a relation.
+
+        Args:
+            primary_key (set[str], optional): The primary key. Defaults to
+                set().
+            candidate_keys (set[frozenset[str]], optional): The candidate
+                keys. Defaults to set().
+            functional_dependencies (set[FD], optional): The functional
+                dependencies. Defaults to set().
+            multivalued_dependencies (set[MVD], optional): The multivalued
+                dependencies. Defaults to set().
+            non_atomic_columns (set[NonAtomic], optional): The multi-valued
+                columns. Defaults to set().
+        """
+        self.primary_key: set[str] = primary_key.copy()
+        self.candidate_keys: set[frozenset[str]] = candidate_keys.copy()
+        self.functional_dependencies: set[FD] = functional_dependencies.copy()
+        self.multivalued_dependencies: set[MVD] = (
+            multivalued_dependencies.copy()
+        )
+        self.non_atomic_columns: set[NonAtomic] = non_atomic_columns.copy()
+
+    def __repr__(self) -> str:
+        """Representation method for the Schema class.
+
+        Returns:
+            str: The string representation of the schema.
+        """
+        return "\n".join(
+            [f"Primary Key: {self.primary_key}"]
+            + [f"Candidate Key: {set(key)}" for key in self.candidate_keys]
+            + [
+                str(dependency)
+                for dependency in (
+                    list(self.functional_dependencies)
+                    + list(self.multivalued_dependencies)
+                    + list(self.non_atomic_columns)
+                )
+            ]
+        )
+
+    @classmethod
+    def from_statements(cls, statements: Iterable[str]) -> "Schema":
+        """Parse the schema statements.
+
+        Args:
+            statements (Iterable[str]): The statements, one per item.
+
+        Returns:
+            Schema: The schema metadata.
+        """
+        schema = cls()
+        for statement in statements:
+            text: str = _LABEL.sub("", statement.strip())
+            keys: re.Match[str] | None = _KEYS.match(text)
+            if keys is not None:
+                kind: str = keys.group(1).lower()
+                value: str = keys.group(2).strip()
+                if kind == "primary":
+                    schema.primary_key = _attributes(value)
+                elif value.lower() != "none":
+                    groups: list[str] = _BRACES.findall(value) or value.split(
+                        ","
+                    )
+                    schema.candidate_keys |= {
+                        frozenset(_attributes(group))
+                        for group in groups
+                        if _attributes(group)
+                    }
+                continue
+
+            note: re.Match[str] | None = _NOTE.search(text)
+            kind = note.group(1).strip().lower() if note is not None else ""
+            if note is not None:
+                text = text[: note.start()]
+            if _MULTIVALUED_ARROW.search(text):
+                lhs, rhs = _MULTIVALUED_ARROW.split(text, maxsplit=1)
+                sides: list[str] = rhs.split("|")
+                assert (
+                    len(sides) == 2
+                ), f"RHS of MVD must be == 2 items, got {statement}"
+                schema.multivalued_dependencies.add(
+                    MVD(
+                        lhs=_attributes(lhs),
+                        rhs=(_attributes(sides[0]), _attributes(sides[1])),
+                    )
+                )
+            elif _ARROW.search(text):
+                lhs, rhs = _ARROW.split(text, maxsplit=1)
+                if kind == "non-atomic attribute":
+                    schema.non_atomic_columns.add(
+                        NonAtomic(lhs=_attributes(lhs), rhs=_attributes(rhs))
+                    )
+                else:
+                    schema.functional_dependencies.add(
+                        FD(lhs=_attributes(lhs), rhs=_attributes(rhs))
+                    )
+        return schema
+
+    @classmethod
+    def from_file(cls, path: PathLike) -> "Schema":
+        """Read the schema statements of a sidecar text file.
+
+        Args:
+            path (PathLike): The path of the file.
+
+        Returns:
+            Schema: The schema metadata.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls.from_statements(file)
+
+
+class _Encoder:
+    """Private class for dictionary-encoding the chunks of a relation as they
+    are read, into the global dictionaries of every column. Only the distinct
+    values of a chunk are parsed and looked up, the rest is integer work on
+    the codes.
+    """
+
+    def __init__(
+        self, columns: list[str], non_atomic: set[str], separator: str
+    ):
+        """The constructor for a chunk encoder.
+
+        Args:
+            columns (list[str]): The column names, in order.
+            non_atomic (set[str]): The columns declared multi-valued.
+            separator (str): The separator of the values of a multi-valued
+                cell.
+        """
+        self.columns: list[str] = columns
+        self.non_atomic: set[str] = non_atomic
+        self.separator: str = separator
+        self.multivalued: set[str] = set()
+        self.rows: int = 0
+        self._lookups: dict[str, dict[Any, int]] = {c: {} for c in columns}
+        self._values: dict[str, list[Any]] = {c: [] for c in columns}
+        self._codes: dict[str, list[np.ndarray]] = {c: [] for c in columns}
+
+    def _parse(self, column: str, value: Any) -> Any:
+        """Private method for parsing a distinct value of a column. Strings
+        are stripped, and "{a, b}" cells, or separated cells of a declared
+        multi-valued column, become frozensets of their values.
+
+        Args:
+            column (str): The column of the value.
+            value (Any): The value.
+
+        Returns:
+            Any: The parsed value, None if it is missing.
+        """
+        if (
+            value is None
+            or value is pd.NA
+            or (isinstance(value, float) and np.isnan(value))
+        ):
+            return None
+        if isinstance(value, frozenset):
+            self.multivalued.add(column)
+            return value
+        if not isinstance(value, str):
+            return value
+        value = value.strip()
+        if value.startswith("{") and value.endswith("}"):
+            value = value[1:-1]
+        elif column not in self.non_atomic or self.separator not in value:
+            return value
+        self.multivalued.add(column)
+        return frozenset(
+            item.strip() for item in value.split(self.separator)
+        ) - {""}
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """Encode a chunk of rows.
+
+        Args:
+            chunk (pd.DataFrame): The rows, with the columns of the encoder.
+        """
+        for column in self.columns:
+            values: pd.Series = chunk[column]
+            try:
+                codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            except TypeError:  # Unhashable set or list cells.
+                codes, uniques = pd.factorize(
+                    values.map(_hashable), use_na_sentinel=False
+                )
+            lookup: dict[Any, int] = self._lookups[column]
+            dictionary: list[Any] = self._values[column]
+            positions: np.ndarray = np.empty(len(uniques), dtype=CODE_DTYPE)
+            for position, value in enumerate(uniques):
+                value = self._parse(column, value)
+                code: int | None = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(dictionary)
+                    dictionary.append(value)
+                positions[position] = code
+            self._codes[column].append(positions[codes])
+        self.rows += len(chunk)
+
+    def encoded(self) -> EncodedData:
+        """The encoded data instances of every chunk.
+
+        Returns:
+            EncodedData: The encoded data instances.
+        """
+        dictionaries: dict[str, np.ndarray] = {}
+        codes: dict[str, np.ndarray] = {}
+        for column in self.columns:
+            dictionary: np.ndarray = np.empty(
+                len(self._values[column]), dtype=object
+            )
+            dictionary[:] = self._values[column]
+            dictionaries[column] = dictionary
+            codes[column] = (
+                np.concatenate(self._codes[column])
+                if self._codes[column]
+                else np.empty(0, dtype=CODE_DTYPE)
+            )
+        return EncodedData(
+            list(self.columns),
+            dictionaries,
+            codes,
+            np.arange(self.rows),
+        )
+
+    def relation(self, name: str, schema: Schema) -> Relation:
+        """Build the relation of the encoded chunks. Multi-valued columns
+        that the schema does not declare are declared dependent on the
+        primary key, as in standard 1NF processing.
+
+        Args:
+            name (str): The name of the relation.
+            schema (Schema): The schema metadata.
+
+        Returns:
+            Relation: The relation.
+        """
+        primary_key: set[str] = schema.primary_key or set(self.columns)
+        declared: set[str] = _non_atomic(schema)
+        return Relation(
+            name=name,
+            columns=set(self.columns),
+            primary_key=primary_key,
+            candidate_keys=schema.candidate_keys,
+            non_atomic_columns=schema.non_atomic_columns
+            | {
+                NonAtomic(lhs=primary_key - {column}, rhs={column})
+                for column in self.multivalued - declared
+            },
+            functional_dependencies=schema.functional_dependencies,
+            multivalued_dependencies=schema.multivalued_dependencies,
+            data_instances=self.encoded(),
+        )
+
+
+def _text(value: Any) -> Any:
+    """Private function for turning a scalar cell into a string, keeping
+    missing values and list cells as they are.
+
+    Args:
+        value (Any): The cell.
+
+    Returns:
+        Any: The string of the cell.
+    """
+    if value is None or isinstance(value, (str, list, dict)):
+        return value
+    if isinstance(value, float) and np.isnan(value):
+        return value
+    return str(value)
+
+
+def _typed(chunk: pd.DataFrame, dtypes: dict[str, Any]) -> pd.DataFrame:
+    """Private function for applying the dtypes to a chunk of rows. Columns
+    without a dtype are read as strings.
+
+    Args:
+        chunk (pd.DataFrame): The rows.
+        dtypes (dict[str, Any]): The dtype of every column that is not a
+            string.
+
+    Returns:
+        pd.DataFrame: The typed rows.
+    """
+    for column in chunk.columns:
+        dtype: Any = dtypes.get(column, str)
+        if dtype is str or dtype == "str":
+            chunk[column] = chunk[column].map(_text).astype(object)
+        else:
+            chunk[column] = chunk[column].astype(dtype)
+    return chunk
+
+
+def _schema(schema: Schema | PathLike | None, path: Path) -> Schema:
+    """Private function for resolving the schema of a file, given as a
+    Schema, as the path of a sidecar file, or found next to the file as
+    "<name>.schema".
+
+    Args:
+        schema (Schema | PathLike | None): The schema, or its path.
+        path (Path): The path of the data file.
+
+    Returns:
+        Schema: The schema metadata, empty if there is none.
+    """
+    if isinstance(schema, Schema):
+        return schema
+    if schema is not None:
+        return Schema.from_file(schema)
+    sidecar: Path = path.with_suffix(".schema")
+    return Schema.from_file(sidecar) if sidecar.exists() else Schema()
+
+
+def _non_atomic(schema: Schema) -> set[str]:
+    """Private function for the columns a schema declares multi-valued.
+
+    Args:
+        schema (Schema): The schema metadata.
+
+    Returns:
+        set[str]: The multi-valued columns.
+    """
+    return {
+        column
+        for non_atomic in schema.non_atomic_columns
+        for column in non_atomic.rhs
+    }
+
+
+def read_csv(
+    path: PathLike,
+    name: str | None = None,
+    schema: Schema | PathLike | None = None,
+    dtypes: dict[str, Any] | None = None,
+    separator: str = ",",
+    chunk_size: int = 100_000,
+    **options: Any,
+) -> Relation:
+    """Stream a CSV file into a relation, chunk by chunk, without building
+    the rows in memory. Only the int32 codes and the distinct values of
+    every column are kept.
+
+    Args:
+        path (PathLike): The path of the CSV file.
+        name (str | None, optional): The name of the relation. Defaults to
+            None, which takes the name of the file.
+        schema (Schema | PathLike | None, optional): The schema, or the path
+            of its sidecar file. Defaults to None, which reads
+            "<name>.schema" next to the file if it exists.
+        dtypes (dict[str, Any] | None, optional): The dtype of the columns
+            that are not strings. Defaults to None, which reads every column
+            as strings.
+        separator (str, optional): The separator of the values of a
+            multi-valued cell. Defaults to ",".
+        chunk_size (int, optional): The number of rows of a chunk. Defaults
+            to 100_000.
+        **options (Any): Options of pd.read_csv(), such as sep.
+
+    Returns:
+        Relation: The relation.
+    """
+    path = Path(path)
+    metadata: Schema = _schema(schema, path)
+    columns: list[str] = list(pd.read_csv(path, nrows=0, **options).columns)
+    encoder = _Encoder(columns, _non_atomic(metadata), separator)
+    dtypes = dtypes or {}
+    with pd.read_csv(
+        path,
+        chunksize=chunk_size,
+        dtype={column: dtypes.get(column, str) for column in columns},
+        **options,
+    ) as reader:
+        for chunk in reader:
+            encoder.add(chunk)
+    return encoder.relation(name or path.stem, metadata)
+
+
+def read_jsonl(
+    path: PathLike,
+    name: str | None = None,
+    schema: Schema | PathLike | None = None,
+    dtypes: dict[str, Any] | None = None,
+    separator: str = ",",
+    chunk_size: int = 100_000,
+) -> Relation:
+    """Stream a JSON Lines file, one object per row, into a relation, chunk
+    by chunk. The keys of the first chunk are the columns, and array values
+    are read as multi-valued cells.
+
+    Args:
+        path (PathLike): The path of the JSON Lines file.
+        name (str | None, optional): The name of the relation. Defaults to
+            None, which takes the name of the file.
+        schema (Schema | PathLike | None, optional): The schema, or the path
+            of its sidecar file. Defaults to None, which reads
+            "<name>.schema" next to the file if it exists.
+        dtypes (dict[str, Any] | None, optional): The dtype of the columns
+            that are not strings. Defaults to None, which reads every column
+            as strings.
+        separator (str, optional): The separator of the values of a
+            multi-valued cell. Defaults to ",".
+        chunk_size (int, optional): The number of rows of a chunk. Defaults
+            to 100_000.
+
+    Returns:
+        Relation: The relation.
+    """
+    path = Path(path)
+    metadata: Schema = _schema(schema, path)
+    encoder: _Encoder | None = None
+    with pd.read_json(
+        path,
+        lines=True,
+        chunksize=chunk_size,
+        dtype=False,
+        convert_dates=False,
+    ) as reader:
+        for chunk in reader:
+            if encoder is None:
+                encoder = _Encoder(
+                    list(chunk.columns), _non_atomic(metadata), separator
+                )
+            unknown: set[str] = set(chunk.columns) - set(encoder.columns)
+            assert not unknown, f"Keys {unknown} not in columns"
+            encoder.add(
+                _typed(chunk.reindex(columns=encoder.columns), dtypes or {})
+            )
+    assert encoder is not None, f"No rows in {path}"
+    return encoder.relation(name or path.stem, metadata)
+
+
+def _cells(row: tuple[Any, ...]) -> list[Any]:
+    """Private function for the non-empty cells of a sheet row.
+
+    Args:
+        row (tuple[Any, ...]): The values of the row.
+
+    Returns:
+        list[Any]: The values that are not empty.
+    """
+    return [
+        cell
+        for cell in row
+        if cell is not None
+        and not (isinstance(cell, str) and not cell.strip())
+    ]
+
+
+def _statement(row: tuple[Any, ...]) -> str:
+    """Private function for the text of a sheet row, its cells joined.
+
+    Args:
+        row (tuple[Any, ...]): The values of the row.
+
+    Returns:
+        str: The text of the row.
+    """
+    return " ".join(str(cell).strip() for cell in _cells(row))
+
+
+def read_xlsx(
+    path: PathLike,
+    sheet: str | None = None,
+    name: str | None = None,
+    header_row: int | None = None,
+    schema: Schema | PathLike | None = None,
+    schema_sheet: str | None = None,
+    dtypes: dict[str, Any] | None = None,
+    separator: str = ",",
+    chunk_size: int = 10_000,
+) -> Relation:
+    """Stream a sheet of an Excel workbook into a relation, row by row in
+    read-only mode, as laid out in the TestingData workbooks:
+
+        CoffeeShopData                       <- the name of the relation
+        OrderID | Date | PromocodeUsed ...   <- the header row
+        1001    | ...  | {SUMMERFUN, ...}    <- the data, up to an empty row
+                                                or a statement
+        Primary Key: {OrderID, DrinkID}      <- the schema statements
+        FD1) OrderID --> CustomerID
+
+    The header row is the first row with two or more cells, unless it is
+    given, and the columns are its cells up to the first empty one. Unless a
+    schema is given, the statements are read from the schema sheet, or else
+    from the block of rows that follows the data, see Schema. Cells after
+    that block, such as worked results, are never read.
+
+    Args:
+        path (PathLike): The path of the workbook.
+        sheet (str | None, optional): The name of the sheet. Defaults to
+            None, which takes the active sheet.
+        name (str | None, optional): The name of the relation. Defaults to
+            None, which takes the first word of the row above the header,
+            or the name of the sheet.
+        header_row (int | None, optional): The 0-based position of the
+            header row. Defaults to None, which detects it.
+        schema (Schema | PathLike | None, optional): The schema, or the path
+            of its sidecar file. Defaults to None.
+        schema_sheet (str | None, optional): The name of a sidecar sheet of
+            schema statements, one per row. Defaults to None.
+        dtypes (dict[str, Any] | None, optional): The dtype of the columns
+            that are not strings. Defaults to None, which reads every column
+            as strings.
+        separator (str, optional): The separator of the values of a
+            multi-valued cell. Defaults to ",".
+        chunk_size (int, optional): The number of rows of a chunk. Defaults
+            to 10_000.
+
+    Returns:
+        Relation: The relation.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet is not None else workbook.active
+        metadata: Schema | None = (
+            _schema(schema, Path(path)) if schema is not None else None
+        )
+        if metadata is None and schema_sheet is not None:
+            metadata = Schema.from_statements(
+                _statement(row)
+                for row in workbook[schema_sheet].iter_rows(values_only=True)
+            )
+        rows: Iterator[tuple[Any, ...]] = worksheet.iter_rows(values_only=True)
+
+        title: str = worksheet.title
+        header: tuple[Any, ...] = ()
+        for position, row in enumerate(rows):
+            cells: list[Any] = _cells(row)
+            if position == header_row or (
+                header_row is None and len(cells) >= 2
+            ):
+                header = row
+                break
+            if cells:
+                title = str(cells[0])
+        width: int = next(
+            (i for i, cell in enumerate(header) if cell is None), len(header)
+        )
+        columns: list[str] = [str(cell).strip() for cell in header[:width]]
+        assert columns, f"No header row in {path}"
+
+        encoder = _Encoder(
+            columns,
+            _non_atomic(metadata) if metadata is not None else set(),
+            separator,
+        )
+        statements: list[str] = []
+        buffer: list[tuple[Any, ...]] = []
+        for row in rows:
+            cells = _cells(row)
+            if not cells:
+                break
+            if isinstance(cells[0], str) and _is_statement(_statement(row)):
+                statements.append(_statement(row))
+                break
+            buffer.append(tuple(row[:width]) + (None,) * (width - len(row)))
+            if len(buffer) == chunk_size:
+                encoder.add(
+                    _typed(
+                        pd.DataFrame(buffer, columns=columns, dtype=object),
+                        dtypes or {},
+                    )
+                )
+                buffer = []
+        if buffer:
+            encoder.add(
+                _typed(
+                    pd.DataFrame(buffer, columns=columns, dtype=object),
+                    dtypes or {},
+                )
+            )
+
+        if metadata is None:
+            for row in rows:
+                text: str = _statement(row)
+                if text:
+                    statements.append(text)
+                elif statements:
+                    break
+            metadata = Schema.from_statements(statements)
+    finally:
+        workbook.close()
+
+    word: re.Match[str] | None = re.match(r"\w+", title.strip())
+    return encoder.relation(
+        name or (word.group(0) if word is not None else title), metadata
+    )
+
+
+def load_relation(path: PathLike, **options: Any) -> Relation:
+    """Stream a file into a relation, by the suffix of the file: ".xlsx",
+    ".csv", ".tsv", ".jsonl" or ".ndjson".
+
+    Args:
+        path (PathLike): The path of the file.
+        **options (Any): Options of read_xlsx(), read_csv() or read_jsonl().
+
+    Raises:
+        ValueError: If the kind of file is unknown.
+
+    Returns:
+        Relation: The relation.
+    """
+    suffix: str = Path(path).suffix.lower()
+    if suffix in (".xlsx", ".xlsm"):
+        return read_xlsx(path, **options)
+    if suffix == ".csv":
+        return read_csv(path, **options)
+    if suffix == ".tsv":
+        return read_csv(path, sep="\t", **options)
+    if suffix in (".jsonl", ".ndjson"):
+        return read_jsonl(path, **options)
+    raise ValueError(f"Invalid File Type: {suffix}")
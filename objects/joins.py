@@ -0,0 +1,683 @@
+from collections import OrderedDict
+from itertools import combinations, islice
+from threading import Lock
+from typing import Any, Callable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .attributes import AttributeUniverse, is_subset
+from .encoding import EncodedData
+from .executor import Executor, SerialExecutor
+from .metrics import count
+
+
+def _joint_labels(
+    frames: list[pd.DataFrame], columns: list[str]
+) -> list[np.ndarray]:
+    """Private function for labels of the rows of several tables by their
+    values in some shared columns, comparable across the tables.
+
+    Args:
+        frames (list[pd.DataFrame]): The codes of the tables.
+        columns (list[str]): The shared columns.
+
+    Returns:
+        list[np.ndarray]: The label of every row of every table. Two rows have
+            the same label exactly when they agree on every shared column.
+    """
+    lengths: list[int] = [len(frame) for frame in frames]
+    labels: np.ndarray = np.zeros(sum(lengths), dtype=np.int64)
+    for column in columns:
+        codes: np.ndarray = np.concatenate(
+            [frame[column].to_numpy() for frame in frames]
+        )
+        labels, _ = pd.factorize(labels * (int(codes.max()) + 1) + codes)
+    return np.split(labels, np.cumsum(lengths)[:-1])
+
+
+def _connected(masks: list[int]) -> bool:
+    """Private function for testing if some components form a connected join,
+    in which every component shares a column with another.
+
+    Args:
+        masks (list[int]): The bitmasks of the components.
+
+    Returns:
+        bool: True if the join is connected.
+    """
+    reached: int = masks[0]
+    remaining: list[int] = masks[1:]
+    while remaining:
+        linked: list[int] = [mask for mask in remaining if mask & reached]
+        if not linked:
+            return False
+        for mask in linked:
+            reached |= mask
+        remaining = [mask for mask in remaining if not mask & reached]
+    return True
+
+
+class JoinCache:
+    """A memory-capped cache of the joins of sets of components, keyed by the
+    bitmask of the components' indices.
+
+    The join of a set of components does not depend on the order they are
+    joined in, so combinations that share components share their
+    intermediate joins. Joins are evicted in least recently used order once
+    the cache holds more than its budget of bytes.
+
+    The cache is shared by the threads of a ThreadExecutor. It is not sent to
+    the workers of a ProcessExecutor: every worker starts with an empty cache
+    of the same budget, rather than receiving the intermediate joins with
+    every batch.
+    """
+
+    def __init__(self, max_bytes: int):
+        """The constructor for a join cache.
+
+        Args:
+            max_bytes (int): The budget of bytes for the cached joins.
+        """
+        self.max_bytes: int = max_bytes
+        self._cache: OrderedDict[int, pd.DataFrame] = OrderedDict()
+        self._bytes: int = 0
+        self._lock = Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.max_bytes = state["max_bytes"]
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, key: int) -> pd.DataFrame | None:
+        """The join of a set of components, if it is cached.
+
+        Args:
+            key (int): The bitmask of the indices of the components.
+
+        Returns:
+            pd.DataFrame | None: The join, or None if it is not cached.
+        """
+        with self._lock:
+            join_df: pd.DataFrame | None = self._cache.get(key)
+            if join_df is not None:
+                self._cache.move_to_end(key)
+            return join_df
+
+    def put(self, key: int, join_df: pd.DataFrame) -> None:
+        """Cache the join of a set of components, evicting the least recently
+        used joins over the budget. A join larger than the budget is not
+        cached.
+
+        Args:
+            key (int): The bitmask of the indices of the components.
+            join_df (pd.DataFrame): The join.
+        """
+        size: int = int(join_df.memory_usage(index=True).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = join_df
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= int(evicted.memory_usage(index=True).sum())
+
+
+class JoinDependencyChecker:
+    """Tests join dependencies *(R1, ..., Rn) on the data instances of a
+    relation.
+
+    Every component is a projection π_Ri(r) of the instance r, so every
+    tuple of r is in the join of the components, and the join dependency
+    holds exactly when the join has no more rows than r. The rows of the
+    join are counted, rather than sorting and comparing the join with r:
+
+        -   Merging components can only shrink their join, so if the
+            join dependency holds, so does *(Ri, R - Pi) for every component
+            Ri with columns Pi in no other component. These two-component
+            splits are counted on r once each and cached, which rejects
+            most combinations before any of their components are joined.
+        -   If the components form an acyclic join, their join size is
+            counted exactly along a join tree, without building the join.
+        -   Otherwise an upper bound from the largest number of matches per
+            row of every component is tried first, and the join is only
+            built if the bound is above the rows of r. It is built in chunks
+            and stops at the first spurious row.
+
+    Algorithm:
+        Yannakakis, M. (1981). Algorithms for Acyclic Database Schemes.
+    """
+
+    # The rows of the first chunk of a join, see join_size().
+    chunk_rows: int = 1 << 12
+
+    def __init__(
+        self,
+        data: EncodedData,
+        components: list[tuple[str, ...]],
+        max_join_bytes: int = 1 << 28,
+    ):
+        """The constructor for a join dependency checker.
+
+        Args:
+            data (EncodedData): The data instances of the relation.
+            components (list[tuple[str, ...]]): The columns of every
+                projection that may be a component of a join dependency.
+            max_join_bytes (int, optional): The budget of bytes for the
+                intermediate joins kept in memory, see JoinCache. Defaults to
+                256 MiB.
+        """
+        self.universe = AttributeUniverse(data.columns)
+        self.columns_mask: int = self.universe.full_mask
+        self.data: EncodedData = data.drop_duplicates()
+        self.rows: int = len(self.data)
+        self.components: list[tuple[str, ...]] = components
+        self.masks: list[int] = [
+            self.universe.mask(columns) for columns in components
+        ]
+        self.frames: list[pd.DataFrame] = [
+            data.project(columns).codes_frame().reset_index(drop=True)
+            for columns in components
+        ]
+        self.codes: pd.DataFrame = self.data.codes_frame()
+        self._degrees: dict[tuple[int, int], int] = {}
+        self._splits: dict[tuple[int, int], bool] = {}
+        self.joins = JoinCache(max_join_bytes)
+
+    def _columns(self, mask: int) -> list[str]:
+        """Private method for the sorted columns of a bitmask."""
+        return sorted(self.universe.attributes(mask))
+
+    def connected(self, combination: tuple[int, ...]) -> bool:
+        """Test if the components of a combination form a connected join, see
+        _connected().
+
+        Args:
+            combination (tuple[int, ...]): The indices of the components.
+
+        Returns:
+            bool: True if the join is connected.
+        """
+        return _connected([self.masks[i] for i in combination])
+
+    def splits(self, first: int, second: int) -> bool:
+        """Test the join dependency *(X, Y) of two sets of columns that cover
+        every column. It is cached.
+
+        The rows of the join are the sum, over the values of the shared
+        columns X ∩ Y, of the distinct rows of π_X(r) times those of π_Y(r)
+        with that value, so it is counted on r without building either
+        projection.
+
+        Args:
+            first (int): The bitmask of the columns X.
+            second (int): The bitmask of the columns Y.
+
+        Returns:
+            bool: True if the join of π_X(r) and π_Y(r) is r.
+        """
+        key: tuple[int, int] = (min(first, second), max(first, second))
+        if key not in self._splits:
+            separator: np.ndarray = self.data.group_codes(
+                self._columns(first & second)
+            )
+            size: int = int(separator.max(initial=-1)) + 1
+            counts: list[np.ndarray] = []
+            for mask in key:
+                keys: np.ndarray = self.data.group_codes(self._columns(mask))
+                _, rows = np.unique(keys, return_index=True)
+                counts.append(np.bincount(separator[rows], minlength=size))
+            self._splits[key] = (
+                int(np.dot(counts[0].astype(np.int64), counts[1])) == self.rows
+            )
+        return self._splits[key]
+
+    def screen(self, combination: tuple[int, ...]) -> bool:
+        """Test the two-component join dependencies a combination implies,
+        see splits(). Every split of the components into two groups gives
+        one, from the columns of each group, unless a group has every column.
+
+        Args:
+            combination (tuple[int, ...]): The indices of the components of a
+                combination that covers every column.
+
+        Returns:
+            bool: False if a split fails, so the join dependency does not
+                hold.
+        """
+        masks: list[int] = [self.masks[i] for i in combination]
+        for i, j in combinations(range(len(masks) + 1), 2):
+            group: int = masks[i] | (masks[j] if j < len(masks) else 0)
+            rest: int = 0
+            for k, mask in enumerate(masks):
+                if k not in (i, j):
+                    rest |= mask
+            if self.columns_mask in (group, rest):
+                continue
+            if not self.splits(group, rest):
+                return False
+        return True
+
+    def _degree(self, component: int, separator: int) -> int:
+        """Private method for the largest number of rows of a component that
+        agree on some of its columns.
+
+        Args:
+            component (int): The index of the component.
+            separator (int): The bitmask of the columns.
+
+        Returns:
+            int: The largest group size of the component on the columns.
+        """
+        key: tuple[int, int] = (component, separator)
+        if key not in self._degrees:
+            frame: pd.DataFrame = self.frames[component]
+            self._degrees[key] = (
+                int(frame.groupby(self._columns(separator)).size().max())
+                if separator and len(frame)
+                else len(frame)
+            )
+        return self._degrees[key]
+
+    def _join_order(self, combination: tuple[int, ...]) -> list[int]:
+        """Private method for an order of the components of a connected
+        combination in which every component shares a column with the ones
+        before it.
+
+        Args:
+            combination (tuple[int, ...]): The indices of the components.
+
+        Returns:
+            list[int]: The indices of the components in join order.
+        """
+        order: list[int] = [combination[0]]
+        joined: int = self.masks[combination[0]]
+        remaining: list[int] = list(combination[1:])
+        while remaining:
+            component: int = next(
+                i for i in remaining if self.masks[i] & joined
+            )
+            remaining.remove(component)
+            order.append(component)
+            joined |= self.masks[component]
+        return order
+
+    def join_size_bound(self, combination: tuple[int, ...]) -> int:
+        """An upper bound on the join size of a connected combination: every
+        row joined so far matches at most the largest group of the next
+        component on the shared columns.
+
+        Args:
+            combination (tuple[int, ...]): The indices of the components.
+
+        Returns:
+            int: The upper bound, capped just above the rows of r.
+        """
+        order: list[int] = self._join_order(combination)
+        bound: int = len(self.frames[order[0]])
+        joined: int = self.masks[order[0]]
+        for component in order[1:]:
+            bound = min(
+                bound
+                * self._degree(component, self.masks[component] & joined),
+                self.rows + 1,
+            )
+            joined |= self.masks[component]
+        return bound
+
+    def acyclic_join_size(self, combination: tuple[int, ...]) -> int | None:
+        """The exact join size of a combination if its join is acyclic,
+        counted without building the join.
+
+        Components are removed one at a time while one of them (an ear) only
+        shares columns with the others through a single other component (its
+        witness). The count of the ear's rows per shared value is then
+        multiplied into the rows of the witness. The join is acyclic exactly
+        when every component but one can be removed this way.
+
+        Args:
+            combination (tuple[int, ...]): The indices of the components.
+
+        Returns:
+            int | None: The number of rows of the join, capped just above the
+                rows of r, or None if the join is cyclic.
+        """
+        cap: float = float(self.rows + 1)
+        weights: dict[int, np.ndarray] = {
+            i: np.ones(len(self.frames[i])) for i in combination
+        }
+        remaining: list[int] = list(combination)
+        while len(remaining) > 1:
+            ear: tuple[int, int] | None = None
+            for i in remaining:
+                others: int = 0
+                for j in remaining:
+                    if j != i:
+                        others |= self.masks[j]
+                shared: int = self.masks[i] & others
+                witness: int | None = next(
+                    (
+                        j
+                        for j in remaining
+                        if j != i and is_subset(shared, self.masks[j])
+                    ),
+                    None,
+                )
+                if witness is not None:
+                    ear = (i, witness)
+                    break
+            if ear is None:
+                return None
+
+            i, witness = ear
+            separator: list[str] = self._columns(
+                self.masks[i] & self.masks[witness]
+            )
+            ear_labels, witness_labels = _joint_labels(
+                [self.frames[i], self.frames[witness]], separator
+            )
+            matches: np.ndarray = np.bincount(
+                ear_labels,
+                weights=weights[i],
+                minlength=int(witness_labels.max(initial=-1)) + 1,
+            )
+            weights[witness] = np.minimum(
+                weights[witness] * matches[witness_labels], cap
+            )
+            remaining.remove(i)
+
+        size: int = int(min(weights[remaining[0]].sum(), cap))
+        count("join_rows", size)
+        return size
+
+    def _rows_of_r(self, join_df: pd.DataFrame) -> np.ndarray:
+        """Private method for the number of rows of r that agree with every
+        row of a join on the join's columns.
+
+        Args:
+            join_df (pd.DataFrame): The codes of the join.
+
+        Returns:
+            np.ndarray: The number of rows of r per row of the join.
+        """
+        join_labels, labels = _joint_labels(
+            [join_df, self.codes], list(join_df.columns)
+        )
+        size: int = int(max(join_labels.max(initial=-1), labels.max())) + 1
+        counts: np.ndarray = np.bincount(labels, minlength=size)
+        budget: np.ndarray = counts[join_labels]
+        return budget
+
+    def join_size(self, combination: tuple[int, ...]) -> int:
+        """The number of rows of the join of a connected combination, built
+        on the codes in join order, capped just above the rows of r.
+
+        The join starts from the largest cached join of a prefix of the
+        order, and every intermediate join is cached, see JoinCache. The
+        last component is counted rather than joined.
+
+        The starting join is extended in chunks of rows of growing size.
+        Every row of r extends the row of the starting join it agrees with,
+        so a chunk whose join has more rows than the rows of r that agree
+        with the chunk has a spurious row, and the join stops there. An
+        intermediate join can have more rows than r even if the join
+        dependency holds, so it does not stop the join on its own.
+
+        Args:
+            combination (tuple[int, ...]): The indices of the components.
+
+        Returns:
+            int: The number of rows of the join, or the rows of r plus one
+                if it has more.
+        """
+        order: list[int] = self._join_order(combination)
+        if len(order) == 1:
+            return len(self.frames[order[0]])
+        keys: list[int] = [1 << order[0]]
+        for component in order[1:]:
+            keys.append(keys[-1] | 1 << component)
+
+        joined: int = 1
+        join_df: pd.DataFrame = self.frames[order[0]]
+        for prefix in range(len(order) - 1, 1, -1):
+            cached: pd.DataFrame | None = self.joins.get(keys[prefix - 1])
+            if cached is not None:
+                joined, join_df = prefix, cached
+                break
+
+        last: pd.DataFrame = self.frames[order[-1]]
+        budget: np.ndarray = self._rows_of_r(join_df)
+        size: int = 0
+        start: int = 0
+        step: int = self.chunk_rows
+        while start < len(join_df):
+            stop: int = start + step
+            whole: bool = start == 0 and stop >= len(join_df)
+            chunk: pd.DataFrame = join_df.iloc[start:stop]
+            for prefix in range(joined, len(order) - 1):
+                table: pd.DataFrame = self.frames[order[prefix]]
+                chunk = pd.merge(
+                    chunk,
+                    table,
+                    on=sorted(set(chunk.columns) & set(table.columns)),
+                    how="inner",
+                )
+                count("merges")
+                count("join_rows", len(chunk))
+                if whole:
+                    self.joins.put(keys[prefix], chunk)
+
+            chunk_labels, last_labels = _joint_labels(
+                [chunk, last], sorted(set(chunk.columns) & set(last.columns))
+            )
+            matches: np.ndarray = np.bincount(
+                last_labels,
+                minlength=int(chunk_labels.max(initial=-1)) + 1,
+            )
+            chunk_size: int = int(matches[chunk_labels].sum())
+            count("join_rows", chunk_size)
+            if chunk_size > int(budget[start:stop].sum()):
+                return self.rows + 1
+            size += chunk_size
+            start, step = stop, 2 * step
+        return size
+
+    def holds(self, combination: tuple[int, ...]) -> bool:
+        """Test the join dependency of a connected combination that covers
+        every column.
+
+        Args:
+            combination (tuple[int, ...]): The indices of the components.
+
+        Returns:
+            bool: True if the join of the components is r.
+        """
+        size: int | None = self.acyclic_join_size(combination)
+        if size is not None:
+            return size == self.rows
+        if self.join_size_bound(combination) <= self.rows:
+            return True
+        return self.join_size(combination) == self.rows
+
+
+def find_join_dependencies(
+    data: EncodedData | None,
+    components: list[tuple[str, ...]],
+    executor: Executor | None = None,
+    max_join_bytes: int = 1 << 28,
+    implied: Callable[[list[tuple[str, ...]]], bool] | None = None,
+) -> list[tuple[tuple[str, ...], ...]]:
+    """Find the join dependencies *(R1, ..., Rn) over some candidate
+    components that hold on the data instances of a relation, with the least
+    total number of columns.
+
+    The combinations are searched in order of their total number of columns,
+    and the search stops after the first total with a join dependency. A
+    superset of a join dependency has more columns, so it is never reached.
+    Only the combinations that can be a decomposition are tested:
+
+        -   The components cover every column and form a connected join.
+        -   No component is a subset of another, which would not change the
+            join.
+
+    The combinations are generated lazily, screened in the calling process,
+    where the cache of the two-component splits is shared, and the rest are
+    tested in batches on the executor, see JoinDependencyChecker. A
+    combination whose join dependency is implied by the dependencies of the
+    relation, such as by a chase of its tableau (see chase_lossless()),
+    holds on any data that satisfies them, so it is found without testing.
+
+    If no join dependency holds, every combination is generated, which is
+    exponential in the number of candidate components.
+
+    Args:
+        data (EncodedData | None): The data instances of the relation, or
+            None to only find the implied join dependencies.
+        components (list[tuple[str, ...]]): The columns of every candidate
+            component.
+        executor (Executor | None, optional): The executor the combinations
+            are tested on. Defaults to None, which tests them serially.
+        max_join_bytes (int, optional): The budget of bytes for the
+            intermediate joins kept in memory, per worker of the executor.
+            Defaults to 256 MiB.
+        implied (Callable[[list[tuple[str, ...]]], bool] | None, optional):
+            Tests if the join dependency of the columns of some components is
+            implied, before the data is. Defaults to None.
+
+    Returns:
+        list[tuple[tuple[str, ...], ...]]: The columns of the components of
+            every join dependency with the least total number of columns, in
+            the order they were found.
+    """
+    executor = executor or SerialExecutor()
+
+    # Smaller components first, so that a combination runs out of columns as
+    # early as possible.
+    components = sorted(components, key=len)
+    universe = AttributeUniverse(
+        data.columns if data is not None else set().union(*components)
+    )
+    checker: JoinDependencyChecker | None = (
+        JoinDependencyChecker(data, components, max_join_bytes)
+        if data is not None
+        else None
+    )
+    masks: list[int] = [universe.mask(columns) for columns in components]
+    sizes: list[int] = [len(columns) for columns in components]
+    full_mask: int = universe.full_mask
+    n_components: int = len(components)
+    batch: int = 64 * executor.workers
+
+    # The columns covered by the components from every index onward.
+    reachable: list[int] = [0] * (n_components + 1)
+    for i in range(n_components - 1, -1, -1):
+        reachable[i] = reachable[i + 1] | masks[i]
+    if reachable[0] != full_mask:
+        return []
+
+    indices: dict[int, int] = {mask: i for i, mask in enumerate(masks)}
+
+    # The bitmask of the indices of the components that are a subset or a
+    # superset of each component.
+    nested: list[int] = [
+        sum(
+            1 << j
+            for j in range(n_components)
+            if is_subset(masks[i], masks[j]) or is_subset(masks[j], masks[i])
+        )
+        for i in range(n_components)
+    ]
+
+    def extend(
+        chosen: tuple[int, ...],
+        chosen_set: int,
+        covered: int,
+        columns: int,
+        total: int,
+    ) -> Iterator[tuple[int, ...]]:
+        """The candidate combinations with a total number of columns that
+        extend a combination with components of larger indices."""
+        start: int = chosen[-1] + 1 if chosen else 0
+        missing: int = full_mask & ~covered
+
+        # The last component has the missing columns and the rest of the
+        # total, so it is looked up rather than searched for.
+        extra: int = total - columns - missing.bit_count()
+        if chosen and extra >= 0:
+            bits: list[int] = [
+                1 << k
+                for k in range(full_mask.bit_length())
+                if covered >> k & 1
+            ]
+            for others in combinations(bits, extra):
+                i: int | None = indices.get(missing | sum(others))
+                if i is None or i < start or chosen_set & nested[i]:
+                    continue
+                if _connected([masks[j] for j in chosen + (i,)]):
+                    yield chosen + (i,)
+
+        # The columns in more than one component add up to total - |R|, and
+        # a connected join has at least one per component after the first,
+        # so there is room for one more component before the last only if
+        # there are enough of them.
+        repeats: int = total - full_mask.bit_count()
+        if len(chosen) + 1 > repeats:
+            return
+        for i in range(start, n_components):
+            if columns + sizes[i] + 2 > total:
+                break  # The sizes only grow from here.
+            if not is_subset(full_mask, covered | reachable[i]):
+                break
+            if chosen_set & nested[i]:
+                continue
+            if columns + sizes[i] - (covered | masks[i]).bit_count() > repeats:
+                continue
+            yield from extend(
+                chosen + (i,),
+                chosen_set | 1 << i,
+                covered | masks[i],
+                columns + sizes[i],
+                total,
+            )
+
+    def untested(
+        total: int, found: list[tuple[int, ...]]
+    ) -> Iterator[tuple[int, ...]]:
+        """The candidate combinations with a total number of columns that
+        pass the screen of the checker. The implied ones are found instead."""
+        for combination in extend((), 0, 0, 0, total):
+            if implied is not None and implied(
+                [components[i] for i in combination]
+            ):
+                found.append(combination)
+            elif checker is not None and checker.screen(combination):
+                yield combination
+
+    for total in range(full_mask.bit_count() + 1, sum(sizes) + 1):
+        found: list[tuple[int, ...]] = []
+        candidates: Iterator[tuple[int, ...]] = untested(total, found)
+        while level := list(islice(candidates, batch)):
+            assert checker is not None
+            found.extend(
+                combination
+                for combination, valid in zip(
+                    level, executor.map(checker.holds, level)
+                )
+                if valid
+            )
+        if found:
+            return [
+                tuple(components[i] for i in combination)
+                for combination in found
+            ]
+    return []
@@ -0,0 +1,84 @@
+from .attributes import is_subset
+from .closure import ClosureEngine
+
+
+def _minimize_key(
+    engine: ClosureEngine, superkey: int, columns_mask: int, core: int
+) -> int:
+    """Private function for reducing a superkey to a candidate key.
+
+    Args:
+        engine (ClosureEngine): The closure engine of the relation.
+        superkey (int): The bitmask of a superkey.
+        columns_mask (int): The bitmask of every column of the relation.
+        core (int): The bitmask of the attributes that belong to every
+            candidate key, which are never tried for removal.
+
+    Returns:
+        int: The bitmask of a candidate key that is a subset of the superkey.
+    """
+    removable: int = superkey & ~core
+    while removable:
+        low_bit: int = removable & -removable
+        removable ^= low_bit
+        if is_subset(columns_mask, engine.closure(superkey ^ low_bit)):
+            superkey ^= low_bit
+    return superkey
+
+
+def enumerate_candidate_keys(
+    dependencies: list[tuple[int, int]], columns_mask: int
+) -> list[int]:
+    """Enumerate every candidate key of a relation schema.
+
+    Every candidate key is found from a known key K and a functional
+    dependency X → Y: if no known key is a subset of X ∪ (K - Y), that set is
+    a superkey which is minimized into a new candidate key. The number of
+    closures is polynomial in the number of keys, dependencies and
+    attributes, rather than exponential in the number of attributes.
+
+    The search is pruned with the attributes that can be classified from the
+    dependencies alone:
+
+        -   Attributes that only appear on the right-hand side of a
+            dependency are never part of a candidate key.
+        -   Attributes that never appear on a right-hand side are part of
+            every candidate key.
+
+    Algorithm:
+        Lucchesi, C. L., Osborn, S. L. (1978). Candidate Keys for Relations.
+
+    Args:
+        dependencies (list[tuple[int, int]]): The bitmasks of the left-hand
+            side and right-hand side of every functional dependency.
+        columns_mask (int): The bitmask of every column of the relation.
+
+    Returns:
+        list[int]: The bitmasks of every candidate key, in the order they were
+            found.
+    """
+    dependencies = [
+        (lhs_mask & columns_mask, rhs_mask & columns_mask & ~lhs_mask)
+        for lhs_mask, rhs_mask in dependencies
+    ]  # Trivial parts of the right-hand side never contribute to a key.
+    engine = ClosureEngine(dependencies)
+
+    lhs_attributes: int = 0
+    rhs_attributes: int = 0
+    for lhs_mask, rhs_mask in dependencies:
+        lhs_attributes |= lhs_mask
+        rhs_attributes |= rhs_mask
+
+    rhs_only: int = rhs_attributes & ~lhs_attributes
+    core: int = columns_mask & ~rhs_attributes
+
+    keys: list[int] = [
+        _minimize_key(engine, columns_mask & ~rhs_only, columns_mask, core)
+    ]
+    for key in keys:  # The list grows while new keys are found.
+        for lhs_mask, rhs_mask in dependencies:
+            superkey: int = lhs_mask | (key & ~rhs_mask)
+            if any(is_subset(known_key, superkey) for known_key in keys):
+                continue
+            keys.append(_minimize_key(engine, superkey, columns_mask, core))
+    return keys
@@ -0,0 +1,98 @@
+import json
+import logging
+import sys
+from typing import Any, TextIO
+
+
+def log_event(
+    logger: logging.Logger,
+    level: int,
+    event: str,
+    message: str,
+    *args: object,
+    **fields: Any,
+) -> None:
+    """Log a structured event of the normalization.
+
+    The message is a %-format string, which is only formatted, and its
+    arguments only rendered, if a handler emits the record. So a relation
+    passed as an argument renders its data instances only when its level is
+    enabled. The name of the event and its fields are attached to the record
+    as record.event and record.fields, see JsonFormatter.
+
+    Args:
+        logger (logging.Logger): The logger of the calling module.
+        level (int): The level of the event, such as logging.INFO.
+        event (str): The name of the event.
+        message (str): The %-format message.
+        *args (object): The arguments of the message.
+        **fields (Any): The fields of the event.
+    """
+    if logger.isEnabledFor(level):
+        logger.log(
+            level,
+            message,
+            *args,
+            extra={"event": event, "fields": fields},
+            stacklevel=2,
+        )
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats every log record as a JSON object on a line of its own, with
+    the event and fields of log_event()."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record.
+
+        Args:
+            record (logging.LogRecord): The record.
+
+        Returns:
+            str: The JSON object of the record.
+        """
+        return json.dumps(
+            {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "event": getattr(record, "event", None),
+                "fields": getattr(record, "fields", {}),
+                "message": record.getMessage(),
+            },
+            default=lambda value: (
+                sorted(value)
+                if isinstance(value, (set, frozenset))
+                else str(value)
+            ),
+        )
+
+
+def configure_logging(
+    verbosity: int = 0, json_format: bool = False, stream: TextIO | None = None
+) -> None:
+    """Configure the logging of the command line. A library use of the
+    normalizer logs nothing unless its caller configures logging.
+
+    Args:
+        verbosity (int, optional): -1 (or less) only logs warnings, 0 also
+            logs the relations and their decompositions, and 1 (or more) also
+            logs every dependency the normalization acts on. Defaults to 0.
+        json_format (bool, optional): Log a JSON object per record, see
+            JsonFormatter, rather than the message. Defaults to False.
+        stream (TextIO | None, optional): The stream the log is written to.
+            Defaults to None, which is the standard output.
+    """
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(
+        JsonFormatter() if json_format else logging.Formatter("%(message)s")
+    )
+    logging.basicConfig(
+        level=(
+            logging.WARNING
+            if verbosity < 0
+            else logging.INFO if verbosity == 0 else logging.DEBUG
+        ),
+        handlers=[handler],
+        force=True,
+    )
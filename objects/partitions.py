@@ -0,0 +1,288 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+LABEL_DTYPE = np.int32
+
+_DENSE_KEYS: int = 8  # The largest key range per row that is counted directly.
+_EARLY_ROWS: int = 4096  # The rows a dependency is first tested on.
+
+
+class StrippedPartition:
+    """The partition of the rows of a relation by their values in a set of
+    attributes X, with the single-row classes stripped.
+
+    Two rows are in the same class when they agree on X. A single-row class
+    can never make a functional dependency fail, so only the rows that share
+    their values with another row are kept, which shrinks the partitions
+    quickly as X grows.
+
+    The error e(X), the number of rows minus the number of classes, decides
+    functional dependencies: X → A holds exactly when e(X) = e(X ∪ {A}), and
+    X is a superkey exactly when e(X) = 0.
+
+    Algorithm:
+        Huhtala, Y., Kärkkäinen, J., Porkka, P., Toivonen, H. (1999). TANE:
+        An Efficient Algorithm for Discovering Functional and Approximate
+        Dependencies.
+    """
+
+    __slots__ = ("rows", "labels", "classes")
+
+    def __init__(self, rows: np.ndarray, labels: np.ndarray, classes: int):
+        """The constructor for a stripped partition. See from_codes() for
+        building a partition from the codes of a column.
+
+        Args:
+            rows (np.ndarray): The rows that belong to a class with more than
+                one row.
+            labels (np.ndarray): The class of every kept row, numbered from 0
+                to classes - 1.
+            classes (int): The number of classes with more than one row.
+        """
+        self.rows: np.ndarray = rows
+        self.labels: np.ndarray = labels
+        self.classes: int = classes
+
+    @classmethod
+    def _stripped(
+        cls, rows: np.ndarray, keys: np.ndarray, key_range: int
+    ) -> "StrippedPartition":
+        """Private method for building a partition from a class key of every
+        row, dropping the single-row classes.
+
+        Args:
+            rows (np.ndarray): The rows.
+            keys (np.ndarray): The non-negative class key of every row.
+            key_range (int): An upper bound on the keys.
+
+        Returns:
+            StrippedPartition: The stripped partition.
+        """
+        if key_range > _DENSE_KEYS * len(keys):  # Too sparse to count.
+            keys, uniques = pd.factorize(keys)
+            key_range = len(uniques)
+
+        sizes: np.ndarray = np.bincount(keys, minlength=key_range)
+        shared_classes: np.ndarray = sizes >= 2
+        shared: np.ndarray = shared_classes[keys]
+        labels: np.ndarray = np.cumsum(shared_classes, dtype=LABEL_DTYPE) - 1
+        return cls(
+            rows[shared],
+            labels[keys[shared]],
+            int(labels[-1]) + 1 if key_range else 0,
+        )
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> "StrippedPartition":
+        """The stripped partition of a single attribute.
+
+        Args:
+            codes (np.ndarray): The non-negative integer code of every row's
+                value.
+
+        Returns:
+            StrippedPartition: The stripped partition of the attribute.
+        """
+        return cls._stripped(
+            np.arange(len(codes), dtype=LABEL_DTYPE),
+            codes,
+            int(codes.max()) + 1 if len(codes) else 0,
+        )
+
+    @property
+    def error(self) -> int:
+        """The number of rows that have to be removed to make X a key."""
+        return len(self.rows) - self.classes
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the partition's arrays."""
+        return self.rows.nbytes + self.labels.nbytes
+
+    def determines(self, codes: np.ndarray) -> bool:
+        """Whether X → A holds, from the codes of A.
+
+        X → A holds exactly when every class of X has a single value of A,
+        which is tested by writing the code of some row of every class, and
+        comparing every row against it. Unlike comparing e(X) with
+        e(X ∪ {A}), the partition of X ∪ {A} is never built.
+
+        Args:
+            codes (np.ndarray): The code of every row's value of A.
+
+        Returns:
+            bool: True if the functional dependency holds.
+        """
+        class_values: np.ndarray = np.empty(self.classes, dtype=codes.dtype)
+        # A dependency that fails mostly fails within the first rows
+        # already, so they are tested on their own before every row is.
+        for stop in (_EARLY_ROWS, len(self.rows)):
+            labels: np.ndarray = self.labels[:stop]
+            values: np.ndarray = codes[self.rows[:stop]]
+            class_values[labels] = values  # The last row of every class.
+            if not (class_values[labels] == values).all():
+                return False
+            if stop >= len(self.rows):
+                break
+        return True
+
+    def product(
+        self, other: "StrippedPartition", scratch: np.ndarray
+    ) -> "StrippedPartition":
+        """The stripped partition of X ∪ Y from the partitions of X and Y.
+
+        Two rows are in the same class of X ∪ Y exactly when they are in the
+        same class of X and of Y, so only the rows kept by both partitions
+        are visited.
+
+        Args:
+            other (StrippedPartition): The partition of Y.
+            scratch (np.ndarray): An int64 array with an entry of -1 for
+                every row of the relation. It is restored before returning.
+
+        Returns:
+            StrippedPartition: The stripped partition of X ∪ Y.
+        """
+        scratch[other.rows] = other.labels
+        other_labels: np.ndarray = scratch[self.rows]
+        scratch[other.rows] = -1
+
+        shared: np.ndarray = other_labels >= 0
+        keys: np.ndarray = (
+            self.labels[shared].astype(np.int64) * other.classes
+            + other_labels[shared]
+        )
+        return StrippedPartition._stripped(
+            self.rows[shared], keys, self.classes * other.classes
+        )
+
+    def refine(self, codes: np.ndarray, size: int) -> "StrippedPartition":
+        """The stripped partition of X ∪ {A} from the partition of X and the
+        codes of A.
+
+        Unlike product(), the codes of A cover every row, so the class of
+        every kept row is looked up directly instead of being scattered
+        through a scratch array first.
+
+        Args:
+            codes (np.ndarray): The non-negative integer code of every row's
+                value of A.
+            size (int): An upper bound on the codes.
+
+        Returns:
+            StrippedPartition: The stripped partition of X ∪ {A}.
+        """
+        keys: np.ndarray = (
+            self.labels.astype(np.int64) * size + codes[self.rows]
+        )
+        return StrippedPartition._stripped(
+            self.rows, keys, self.classes * size
+        )
+
+
+class PartitionCache:
+    """A memory-capped cache of the stripped partitions of attribute sets,
+    keyed by bitmask.
+
+    The partitions of the single attributes are always kept. Any other
+    partition is evicted in least recently used order once the cache holds
+    more than its budget of bytes, and is rebuilt from the single-attribute
+    partitions when it is needed again.
+    """
+
+    def __init__(
+        self, attributes: dict[int, np.ndarray], rows: int, max_bytes: int
+    ):
+        """The constructor for a partition cache.
+
+        Args:
+            attributes (dict[int, np.ndarray]): The codes of every row for
+                every single attribute, keyed by the attribute's bitmask.
+            rows (int): The number of rows of the relation.
+            max_bytes (int): The budget of bytes for the partitions of the
+                attribute sets with more than one attribute.
+        """
+        self._scratch: np.ndarray = np.full(rows, -1, dtype=np.int64)
+        self._codes: dict[int, tuple[np.ndarray, int]] = {
+            bit: (codes, int(codes.max()) + 1 if len(codes) else 0)
+            for bit, codes in attributes.items()
+        }
+        self._singles: dict[int, StrippedPartition] = {
+            bit: StrippedPartition.from_codes(codes)
+            for bit, codes in attributes.items()
+        }
+        self._cache: OrderedDict[int, StrippedPartition] = OrderedDict()
+        self._bytes: int = 0
+        self.max_bytes: int = max_bytes
+
+        # The partition of the empty set is a single class of every row.
+        self._empty = StrippedPartition._stripped(
+            np.arange(rows, dtype=LABEL_DTYPE),
+            np.zeros(rows, dtype=LABEL_DTYPE),
+            1,
+        )
+
+    def __contains__(self, mask: int) -> bool:
+        return mask in self._cache or mask in self._singles
+
+    def get(self, mask: int) -> StrippedPartition:
+        """The stripped partition of an attribute set.
+
+        Args:
+            mask (int): The bitmask of the attribute set.
+
+        Returns:
+            StrippedPartition: The partition, from the cache if present.
+        """
+        if mask in self._singles:
+            return self._singles[mask]
+        if not mask:
+            return self._empty
+        if mask in self._cache:
+            self._cache.move_to_end(mask)
+            return self._cache[mask]
+
+        low_bit: int = mask & -mask
+        return self.product(mask ^ low_bit, low_bit)
+
+    def product(self, lhs_mask: int, rhs_mask: int) -> StrippedPartition:
+        """The stripped partition of the union of two attribute sets, which
+        is cached. When the second set adds a single attribute to the first,
+        the partition of the first is refined by the attribute's codes.
+
+        Args:
+            lhs_mask (int): The bitmask of the first attribute set.
+            rhs_mask (int): The bitmask of the second attribute set.
+
+        Returns:
+            StrippedPartition: The partition of the union.
+        """
+        mask: int = lhs_mask | rhs_mask
+        if mask in self:
+            return self.get(mask)
+
+        added: int = rhs_mask & ~lhs_mask
+        partition: StrippedPartition = (
+            self.get(lhs_mask).refine(*self._codes[added])
+            if added in self._codes
+            else self.get(lhs_mask).product(self.get(rhs_mask), self._scratch)
+        )
+        self._cache[mask] = partition
+        self._bytes += partition.nbytes
+        while self._bytes > self.max_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= evicted.nbytes
+        return partition
+
+    def discard(self, mask: int) -> None:
+        """Remove the partition of an attribute set from the cache, if it is
+        cached and is not a single attribute.
+
+        Args:
+            mask (int): The bitmask of the attribute set.
+        """
+        partition: StrippedPartition | None = self._cache.pop(mask, None)
+        if partition is not None:
+            self._bytes -= partition.nbytes
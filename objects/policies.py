@@ -0,0 +1,136 @@
+from .relation import Relation
+
+
+class DecisionPolicy:
+    """Chooses one of the possible decompositions of a relation, at every
+    point of the normalization where more than one is valid, such as the
+    join dependencies of 5NF or the multivalued dependencies found from the
+    data.
+
+    This base class chooses the decomposition with the fewest columns in
+    total, and the first one of those. Subclasses change the cost of a
+    decomposition, or the choice itself:
+
+        relations = normalize_to_5NF(relation, policy=make_policy("saving"))
+    """
+
+    def cost(
+        self, relation: Relation, decomposition: list[set[str]]
+    ) -> tuple[int, ...]:
+        """The cost of a decomposition, the least of which is chosen.
+
+        Args:
+            relation (Relation): The relation being decomposed.
+            decomposition (list[set[str]]): The columns of every relation of
+                the decomposition.
+
+        Returns:
+            tuple[int, ...]: The total number of columns of the
+                decomposition.
+        """
+        return (sum(len(columns) for columns in decomposition),)
+
+    def choose(self, relation: Relation, options: list[list[set[str]]]) -> int:
+        """Choose a decomposition.
+
+        Args:
+            relation (Relation): The relation being decomposed.
+            options (list[list[set[str]]]): The columns of every relation of
+                every possible decomposition.
+
+        Returns:
+            int: The position of the chosen decomposition in the options.
+        """
+        assert options, "No decomposition to choose from"
+        costs: list[tuple[int, ...]] = [
+            self.cost(relation, decomposition) for decomposition in options
+        ]
+        return costs.index(min(costs))
+
+
+class FewestColumnsPolicy(DecisionPolicy):
+    """The default policy, which chooses the decomposition with the fewest
+    columns in total."""
+
+
+class FewestRelationsPolicy(DecisionPolicy):
+    """Chooses the decomposition into the fewest relations, then the one
+    with the fewest columns in total."""
+
+    def cost(
+        self, relation: Relation, decomposition: list[set[str]]
+    ) -> tuple[int, ...]:
+        """The cost of a decomposition, see DecisionPolicy.cost().
+
+        Returns:
+            tuple[int, ...]: The number of relations, then the total number
+                of columns.
+        """
+        return (len(decomposition),) + super().cost(relation, decomposition)
+
+
+class StorageSavingPolicy(DecisionPolicy):
+    """Chooses the decomposition that stores the fewest values of the data
+    instances, that is the largest saving over the relation: a relation of
+    the decomposition stores its distinct rows of the data once. Without
+    data, every relation is assumed to store as many rows as the original,
+    which chooses the fewest columns."""
+
+    def cost(
+        self, relation: Relation, decomposition: list[set[str]]
+    ) -> tuple[int, ...]:
+        """The cost of a decomposition, see DecisionPolicy.cost().
+
+        Returns:
+            tuple[int, ...]: The number of values the decomposition stores.
+        """
+        if relation.data is None:
+            return super().cost(relation, decomposition)
+        return (
+            sum(
+                len(relation.data.project(columns)) * len(columns)
+                for columns in decomposition
+            ),
+        )
+
+
+class PromptPolicy(DecisionPolicy):
+    """Lists the decompositions on the standard output and asks for one on
+    the standard input, for interactive use."""
+
+    def choose(self, relation: Relation, options: list[list[set[str]]]) -> int:
+        """Choose a decomposition, see DecisionPolicy.choose()."""
+        if len(options) == 1:
+            return 0
+        print(f"\nPOSSIBLE DECOMPOSITIONS OF {relation.name}:")
+        for i, decomposition in enumerate(options):
+            print(f"\t#{i}\t{[sorted(columns) for columns in decomposition]}")
+        selection: int = int(
+            input(f"Choose a decomposition (0-{len(options) - 1}): ")
+        )
+        assert 0 <= selection < len(options)
+        return selection
+
+
+def make_policy(kind: str = "fewest_columns") -> DecisionPolicy:
+    """Build a decision policy by name.
+
+    Args:
+        kind (str, optional): "fewest_columns", "fewest_relations", "saving"
+            or "prompt". Defaults to "fewest_columns".
+
+    Raises:
+        ValueError: If the kind of policy is unknown.
+
+    Returns:
+        DecisionPolicy: The decision policy.
+    """
+    if kind == "fewest_columns":
+        return FewestColumnsPolicy()
+    if kind == "fewest_relations":
+        return FewestRelationsPolicy()
+    if kind == "saving":
+        return StorageSavingPolicy()
+    if kind == "prompt":
+        return PromptPolicy()
+    raise ValueError(f"Invalid Policy Selection: {kind}")
@@ -1,8 +1,23 @@
-from itertools import combinations
+from typing import Any, Callable, Hashable, Iterable, TypeVar
 
+import numpy as np
 import pandas as pd
 
+from .attributes import AttributeUniverse, is_subset
+from .chase import chase_lossless
+from .closure import ClosureEngine
+from .cover import canonical_cover, minimal_cover
+from .discovery import (
+    discover_dependencies,
+    discover_multivalued_dependencies,
+)
+from .encoding import EncodedData, LazyProjection
+from .executor import Executor
 from .fd import FD, MVD, NonAtomic
+from .keys import enumerate_candidate_keys
+from .metrics import count
+
+T = TypeVar("T")
 
 
 class Relation:
@@ -12,7 +27,8 @@ class Relation:
         name (str): The name of the table/relation.
         columns (set[str]): The set of all of the column names.
         primary_key (set[str]): The set of all of the primary keys.
-        candidate_keys (set[set[str]]): The set of all the candidate keys.
+        candidate_keys (set[frozenset[str]]): The set of all the candidate
+            keys.
         non_atomic_columns (set[NonAtomic]): The set of all of the columns
             which hold multi-valued or non-atomic data.
         functional_dependencies (set[FD]): The set of the functional
@@ -21,6 +37,14 @@ class Relation:
             dependencies of the relation.
         data_instances (pd.DataFrame) | None: The data instances for the
             relation, used for 4NF and 5NF normalization. (Optional)
+            Decoded from the encoded data on first access.
+        data (EncodedData | None): The dictionary-encoded data instances,
+            which every projection and comparison of the data works on.
+            A lazy projection given as the data instances is resolved on
+            first access.
+        universe (AttributeUniverse): The interned mapping of the column
+            names to bit positions, used for the bitmask form of the
+            attribute sets and dependencies.
 
     TODO:
         Add representation for foreign keys.
@@ -31,11 +55,18 @@ class Relation:
         name: str,
         columns: set[str],
         primary_key: set[str],
-        candidate_keys: set[set[str]] = set(),
+        candidate_keys: set[frozenset[str]] = set(),
         non_atomic_columns: set[NonAtomic] = set(),
         functional_dependencies: set[FD] = set(),
         multivalued_dependencies: set[MVD] = set(),
-        data_instances: list[dict[str, str]] | pd.DataFrame | None = None,
+        data_instances: (
+            list[dict[str, str]]
+            | pd.DataFrame
+            | EncodedData
+            | LazyProjection
+            | None
+        ) = None,
+        universe: AttributeUniverse | None = None,
     ):
         """The constructor for Relation.
 
@@ -44,8 +75,8 @@ class Relation:
             columns (set[str]): The set of all of the column names.
             primary_key (set[str]): The set of all of the primary
                 keys.
-            candidate_keys (set[set[str]], optional): The set of all the
-                candidate keys. Defaults to set().
+            candidate_keys (set[frozenset[str]], optional): The set of all
+                the candidate keys. Defaults to set().
             non_atomic_columns (set[NonAtomic], optional): The set of all of
                 the columns which hold multi-valued or non-atomic data.
                 Defaults to set().
@@ -53,11 +84,18 @@ class Relation:
                 functional dependencies of the relation. Defaults to set().
             multivalued_dependencies (set[MVD], optional): The set of the
                 multivalued dependencies of the relation. Defaults to set().
-            data_instances (list[dict[str, str]] | pd.DataFrame | None,
-                optional): Optional parameter for specifying a list of data
-                instances, where each instance is a dictionary where the key
-                is the column name and the value is the column value for that
-                row. Defaults to None.
+            data_instances (list[dict[str, str]] | pd.DataFrame |
+                EncodedData | LazyProjection | None, optional): Optional
+                parameter for specifying a list of data instances, where each
+                instance is a dictionary where the key is the column name and
+                the value is the column value for that row. Encoded data,
+                such as a projection of another relation's data, is used as
+                is, and a lazy projection is only taken when the data is
+                read. Defaults to None.
+            universe (AttributeUniverse | None, optional): The attribute
+                universe of the relation, shared with the relation it was
+                decomposed from. Must contain every column. Defaults to None,
+                which builds a new universe from the columns.
         """
 
         # Data Validation
@@ -101,9 +139,17 @@ class Relation:
             if isinstance(data_instances, dict):
                 for row in data_instances:
                     assert set(row.keys()) == columns
-            elif isinstance(data_instances, pd.DataFrame):
+            elif isinstance(
+                data_instances, (pd.DataFrame, EncodedData, LazyProjection)
+            ):
                 assert set(data_instances.columns) == columns
 
+        if universe is not None:
+            for column in columns:
+                assert (
+                    column in universe
+                ), f"Column {column} not in attribute universe {universe}"
+
         # Add the Primary Key Functional Dependency
 
         # if columns:
@@ -114,9 +160,12 @@ class Relation:
         # Assign Values to Class Variables
 
         self.name: str = name
+        self.universe: AttributeUniverse = (
+            universe if universe is not None else AttributeUniverse(columns)
+        )
         self.columns: set[str] = columns.copy()
         self.primary_key: set[str] = primary_key.copy()
-        self.candidate_keys: set[set[str]] = candidate_keys.copy()
+        self.candidate_keys: set[frozenset[str]] = candidate_keys.copy()
         self.non_atomic_columns: set[NonAtomic] = {
             non_atomic
             for non_atomic in non_atomic_columns.copy()
@@ -130,16 +179,97 @@ class Relation:
             for mvd in multivalued_dependencies.copy()
             if mvd.lhs or mvd.rhs
         }
-        self.data_instances: pd.DataFrame = (
-            pd.DataFrame(data_instances)
-            if data_instances is not None
-            else None
+        self._data_frame: pd.DataFrame | None = None
+        self._data: EncodedData | None = None
+        self._projection: LazyProjection | None = None
+        if isinstance(data_instances, EncodedData):
+            self._data = data_instances
+        elif isinstance(data_instances, LazyProjection):
+            self._projection = data_instances
+        elif data_instances is not None:
+            self.data_instances = pd.DataFrame(data_instances)
+
+        # Memoized Derived Properties
+
+        self._dependency_cache: dict[Hashable, Any] = {}
+        self._key_cache: dict[Hashable, Any] = {}
+
+    @classmethod
+    def from_decomposition(
+        cls,
+        name: str,
+        columns: set[str],
+        primary_key: set[str],
+        universe: AttributeUniverse,
+        functional_dependencies: set[FD] | None = None,
+        multivalued_dependencies: set[MVD] | None = None,
+        data_instances: EncodedData | LazyProjection | None = None,
+    ) -> "Relation":
+        """The trusted constructor for a relation decomposed from another
+        one by the normalizer, which skips the validation and the copies of
+        the public constructor.
+
+        The sets are taken over by the relation, so the caller must build
+        them for it and not keep using them. The dependencies are shared with
+        the parent relation, which never mutates them, and the data instances
+        are referenced. The validation holds by construction: the columns are
+        in the universe of the parent, and the dependencies are the ones of
+        the parent within the columns, see functional_dependencies_within().
+
+        Args:
+            name (str): The name of the table/relation.
+            columns (set[str]): The set of all of the column names.
+            primary_key (set[str]): The primary key, a subset of the columns.
+            universe (AttributeUniverse): The attribute universe of the
+                parent relation.
+            functional_dependencies (set[FD] | None, optional): The
+                functional dependencies. Defaults to None, for none.
+            multivalued_dependencies (set[MVD] | None, optional): The
+                multivalued dependencies. Defaults to None, for none.
+            data_instances (EncodedData | LazyProjection | None, optional):
+                The data instances, a projection of the parent's. Defaults
+                to None.
+
+        Returns:
+            Relation: The relation, without candidate keys, see
+                update_candidate_keys().
+        """
+        relation: Relation = cls.__new__(cls)
+        relation.name = name
+        relation.universe = universe
+        relation.columns = columns
+        relation.primary_key = primary_key
+        relation.candidate_keys = set()
+        relation.non_atomic_columns = set()
+        relation.functional_dependencies = (
+            functional_dependencies
+            if functional_dependencies is not None
+            else set()
+        )
+        relation.multivalued_dependencies = (
+            multivalued_dependencies
+            if multivalued_dependencies is not None
+            else set()
         )
+        relation._data_frame = None
+        relation._data = None
+        relation._projection = None
+        if isinstance(data_instances, LazyProjection):
+            relation._projection = data_instances
+        else:
+            relation._data = data_instances
+        relation._dependency_cache = {}
+        relation._key_cache = {}
+        return relation
 
     def _repr_attribute_list(
         self,
         attribute: (
-            set[str] | set[set[str]] | set[NonAtomic] | set[FD] | set[MVD]
+            set[str]
+            | set[frozenset[str]]
+            | set[NonAtomic]
+            | set[FD]
+            | set[MVD]
         ),
         attribute_title: str,
     ) -> str:
@@ -155,7 +285,9 @@ class Relation:
         """
         attributes_info: list[str] = []
         for item in attribute:
-            attributes_info.append(f"\t\t{item},")
+            # Represent keys like the primary key.
+            shown = set(item) if isinstance(item, frozenset) else item
+            attributes_info.append(f"\t\t{shown},")
         attributes_info_str: str = "\n".join(attributes_info)
         return (
             f"{attribute_title}: "
@@ -200,6 +332,398 @@ class Relation:
             )
         )
 
+    @property
+    def data(self) -> EncodedData | None:
+        """The encoded data instances of the relation, resolved from its lazy
+        projection on first access."""
+        if self._projection is not None:
+            self._data = self._projection.resolve()
+            self._projection = None
+        return self._data
+
+    @data.setter
+    def data(self, data: EncodedData | None) -> None:
+        self._data = data
+        self._projection = None
+        self._data_frame = None
+
+    def project_data(self, columns: Iterable[str]) -> LazyProjection | None:
+        """The lazy projection of the data instances onto some columns, which
+        is taken from the parent data of a relation whose own data is still a
+        lazy projection, without resolving it.
+
+        Args:
+            columns (Iterable[str]): The columns of the projection.
+
+        Returns:
+            LazyProjection | None: The projection, or None if the relation
+                has no data instances.
+        """
+        if self._projection is not None:
+            return self._projection.project(columns)
+        if self._data is None:
+            return None
+        return LazyProjection(self._data, columns)
+
+    @property
+    def data_instances(self) -> pd.DataFrame | None:
+        """The decoded data instances of the relation."""
+        if self.data is None:
+            return None
+        if self._data_frame is None:
+            self._data_frame = self.data.to_frame()
+        return self._data_frame
+
+    @data_instances.setter
+    def data_instances(self, data_instances: pd.DataFrame | None) -> None:
+        self.data = (
+            EncodedData.from_frame(data_instances)
+            if data_instances is not None
+            else None
+        )
+        self._data_frame = None
+
+    @property
+    def columns_mask(self) -> int:
+        """The bitmask of the columns of the relation."""
+        return self.universe.mask(self.columns)
+
+    def attribute_mask(self, attributes: Iterable[str]) -> int:
+        """The bitmask of a set of attributes of the relation.
+
+        Args:
+            attributes (Iterable[str]): The attribute names.
+
+        Returns:
+            int: The bitmask of the attributes in the relation's universe.
+        """
+        return self.universe.mask(attributes)
+
+    def functional_dependencies_within(self, columns: set[str]) -> set[FD]:
+        """The functional dependencies that only involve the given columns.
+
+        Args:
+            columns (set[str]): The columns of a decomposition of the
+                relation.
+
+        Returns:
+            set[FD]: Every functional dependency of the relation whose LHS and
+                RHS are both subsets of the columns.
+        """
+        columns_mask: int = self.universe.mask(columns)
+        decomposition_fds: set[FD] = set()
+        for fd in self.functional_dependencies:
+            lhs_mask, rhs_mask = fd.masks(self.universe)
+            if is_subset(lhs_mask | rhs_mask, columns_mask):
+                decomposition_fds.add(fd)
+        return decomposition_fds
+
+    def multivalued_dependencies_within(self, columns: set[str]) -> set[MVD]:
+        """The multivalued dependencies that only involve the given columns.
+
+        Args:
+            columns (set[str]): The columns of a decomposition of the
+                relation.
+
+        Returns:
+            set[MVD]: Every multivalued dependency of the relation whose LHS
+                and RHS are all subsets of the columns.
+        """
+        columns_mask: int = self.universe.mask(columns)
+        decomposition_mvds: set[MVD] = set()
+        for mvd in self.multivalued_dependencies:
+            lhs_mask, y_mask, z_mask = mvd.masks(self.universe)
+            if is_subset(lhs_mask | y_mask | z_mask, columns_mask):
+                decomposition_mvds.add(mvd)
+        return decomposition_mvds
+
+    def invalidate_cache(self, keys_only: bool = False) -> None:
+        """Discard the memoized derived properties of the relation.
+
+        The mutator methods of the relation call this themselves. It only has
+        to be called after mutating the attributes of the relation directly.
+
+        Args:
+            keys_only (bool, optional): Only discard the properties derived
+                from the primary and candidate keys (prime attributes,
+                superkey tests and candidate keys), keeping the ones derived
+                from the functional dependencies alone (closures and covers).
+                Defaults to False.
+        """
+        self._key_cache.clear()
+        if not keys_only:
+            self._dependency_cache.clear()
+
+    def _cached(
+        self,
+        cache: dict[Hashable, Any],
+        key: Hashable,
+        compute: Callable[[], T],
+    ) -> T:
+        """Private method for memoizing a derived property.
+
+        Args:
+            cache (dict[Hashable, Any]): The cache the property belongs to.
+            key (Hashable): The key of the property within the cache.
+            compute (Callable[[], T]): Computes the property on a cache miss.
+
+        Returns:
+            T: The memoized value of the property.
+        """
+        if key not in cache:
+            cache[key] = compute()
+        value: T = cache[key]
+        return value
+
+    def _closure_engine(self, include_primary_key: bool) -> ClosureEngine:
+        """Private method for building the closure engine of the relation.
+
+        Args:
+            include_primary_key (bool): Also include the dependency of every
+                column on the primary key, PK → R.
+
+        Returns:
+            ClosureEngine: The closure engine over the functional
+                dependencies of the relation.
+        """
+
+        def build() -> ClosureEngine:
+            dependencies: list[tuple[int, int]] = [
+                fd.masks(self.universe) for fd in self.functional_dependencies
+            ]
+            if include_primary_key and self.primary_key:
+                dependencies.append(
+                    (self.attribute_mask(self.primary_key), self.columns_mask)
+                )
+            return ClosureEngine(dependencies)
+
+        if include_primary_key:
+            return self._cached(self._key_cache, "engine", build)
+        return self._cached(self._dependency_cache, "engine", build)
+
+    def _closure_mask(self, mask: int) -> int:
+        """Private method for the memoized closure of a bitmask.
+
+        Args:
+            mask (int): The bitmask of the attributes X.
+
+        Returns:
+            int: The bitmask of X+ under the functional dependencies.
+        """
+        closures: dict[int, int] = self._cached(
+            self._dependency_cache, "closures", dict
+        )
+        if mask not in closures:
+            closures[mask] = self._closure_engine(
+                include_primary_key=False
+            ).closure(mask)
+        return closures[mask]
+
+    def closure(self, attributes: set[str]) -> set[str]:
+        """The closure X+ of a set of attributes.
+
+        Definition:
+            The closure X+ of a set of attributes X under a set of functional
+            dependencies F is the set of all attributes that are functionally
+            determined by X based on F.
+
+        Args:
+            attributes (set[str]): The set of attributes X.
+
+        Returns:
+            set[str]: The closure of X under the functional dependencies of
+                the relation.
+        """
+        return self.universe.attributes(
+            self._closure_mask(self.attribute_mask(attributes))
+        )
+
+    def closures(self, attribute_sets: list[set[str]]) -> list[set[str]]:
+        """The closures of many sets of attributes in one pass.
+
+        Args:
+            attribute_sets (list[set[str]]): The sets of attributes.
+
+        Returns:
+            list[set[str]]: The closure of each set of attributes under the
+                functional dependencies of the relation, in the order of the
+                input.
+        """
+        return [
+            self.universe.attributes(
+                self._closure_mask(self.attribute_mask(attributes))
+            )
+            for attributes in attribute_sets
+        ]
+
+    def implies(self, fd: FD) -> bool:
+        """Test if a functional dependency is implied by the relation's
+        functional dependencies, i.e. if it is a member of F+.
+
+        Args:
+            fd (FD): The functional dependency X → Y.
+
+        Returns:
+            bool: True if Y is a subset of X+.
+        """
+        lhs_mask, rhs_mask = fd.masks(self.universe)
+        return is_subset(rhs_mask, self._closure_mask(lhs_mask))
+
+    def is_superkey(self, attributes: set[str]) -> bool:
+        """Test if a set of attributes is a superkey of the relation.
+
+        The primary key is a superkey by declaration, so the closure also
+        uses the dependency PK → R.
+
+        Args:
+            attributes (set[str]): The set of attributes X.
+
+        Returns:
+            bool: True if X+ contains every column of the relation.
+        """
+        mask: int = self.attribute_mask(attributes)
+        superkeys: dict[int, bool] = self._cached(
+            self._key_cache, "superkeys", dict
+        )
+        if mask not in superkeys:
+            superkeys[mask] = is_subset(
+                self.columns_mask,
+                self._closure_engine(include_primary_key=True).closure(mask),
+            )
+        return superkeys[mask]
+
+    def is_lossless_join(
+        self,
+        decomposition: Iterable[Iterable[str]],
+        multivalued: bool = True,
+        excluded: MVD | None = None,
+    ) -> bool:
+        """Test if a decomposition of the relation has a lossless join under
+        its dependencies alone, without its data instances, see
+        chase_lossless().
+
+        The dependency PK → R is included, as in is_superkey(). Multivalued
+        dependencies are only rules of the chase when they cover every
+        column.
+
+        Args:
+            decomposition (Iterable[Iterable[str]]): The columns of every
+                relation of the decomposition.
+            multivalued (bool, optional): Also use the multivalued
+                dependencies, which are otherwise only trusted once verified
+                on the data instances. Defaults to True.
+            excluded (MVD | None, optional): A multivalued dependency left out
+                of the chase, such as the one being verified, which would
+                otherwise imply itself. Defaults to None.
+
+        Returns:
+            bool: True if the join of the decomposition is the relation in
+                every state that satisfies the dependencies.
+        """
+        fds: list[tuple[int, int]] = [
+            fd.masks(self.universe) for fd in self.functional_dependencies
+        ]
+        if self.primary_key:
+            fds.append(
+                (self.attribute_mask(self.primary_key), self.columns_mask)
+            )
+        excluded_masks: tuple[int, frozenset[int]] | None = None
+        if excluded is not None:
+            lhs_mask, y_mask, z_mask = excluded.masks(self.universe)
+            excluded_masks = (lhs_mask, frozenset({y_mask, z_mask}))
+        mvds: list[tuple[int, int]] = []
+        if multivalued:
+            for mvd in self.multivalued_dependencies:
+                lhs_mask, y_mask, z_mask = mvd.masks(self.universe)
+                if (lhs_mask, frozenset({y_mask, z_mask})) == excluded_masks:
+                    continue  # X →→ Y | Z is X →→ Z | Y.
+                if lhs_mask | y_mask | z_mask == self.columns_mask:
+                    mvds.append((lhs_mask, y_mask))
+        return chase_lossless(
+            [self.attribute_mask(columns) for columns in decomposition],
+            fds,
+            mvds,
+            self.columns_mask,
+        )
+
+    def compute_candidate_keys(self) -> set[frozenset[str]]:
+        """Compute every candidate key of the relation.
+
+        Definition:
+            A superkey of a relation schema R is a set of attributes S with
+            the property that no two tuples t1 and t2 in any legal relation
+            state r of R will have t1[S] = t2[S]. A key K is a superkey with
+            the additional property that removal of any attribute from K will
+            cause K not to be a superkey any more. If a relation schema has
+            more than one key, each is called a candidate key.
+
+        The keys are derived from the functional dependencies of the relation
+        together with the dependency of every column on the primary key.
+
+        Returns:
+            set[frozenset[str]]: The set of every candidate key.
+        """
+
+        def compute() -> set[frozenset[str]]:
+            dependencies: list[tuple[int, int]] = [
+                fd.masks(self.universe) for fd in self.functional_dependencies
+            ]
+            if self.primary_key:
+                dependencies.append(
+                    (self.attribute_mask(self.primary_key), self.columns_mask)
+                )
+            return {
+                frozenset(self.universe.attributes(key_mask))
+                for key_mask in enumerate_candidate_keys(
+                    dependencies, self.columns_mask
+                )
+            }
+
+        return set(self._cached(self._key_cache, "candidate_keys", compute))
+
+    def update_candidate_keys(self) -> None:
+        """Replace the candidate keys of the relation with the ones computed
+        from its functional dependencies and primary key."""
+        self.candidate_keys = self.compute_candidate_keys()
+        self.invalidate_cache(keys_only=True)
+
+    def add_functional_dependency(self, fd: FD) -> None:
+        """Add a functional dependency to the relation.
+
+        Args:
+            fd (FD): The functional dependency.
+        """
+        for attribute in fd.lhs | fd.rhs:
+            assert (
+                attribute in self.columns
+            ), f"Attribute {attribute} from FD, {fd} not in columns"
+        self.functional_dependencies.add(fd)
+        self.invalidate_cache()
+
+    def add_multivalued_dependency(self, mvd: MVD) -> None:
+        """Add a multivalued dependency to the relation.
+
+        Args:
+            mvd (MVD): The multivalued dependency.
+        """
+        for attribute in mvd.lhs | mvd.rhs[0] | mvd.rhs[1]:
+            assert (
+                attribute in self.columns
+            ), f"Attribute {attribute} from MVD, {mvd} not in columns"
+        self.multivalued_dependencies.add(mvd)
+
+    def add_primary_key_attribute(self, attribute: str) -> None:
+        """Add an attribute to the primary key of the relation.
+
+        Args:
+            attribute (str): The attribute.
+        """
+        assert (
+            attribute in self.columns
+        ), f"Primary key {self.primary_key}, {attribute} not in columns"
+        self.primary_key.add(attribute)
+        self.invalidate_cache(keys_only=True)
+
     def remove_attribute(self, attribute: str) -> None:
         """Remove a given attribute from the relation.
 
@@ -282,10 +806,20 @@ class Relation:
                 updated_multivalued_dependencies.add(mvd)
         self.multivalued_dependencies = updated_multivalued_dependencies.copy()
 
-        if self.data_instances is not None:
-            self.data_instances = self.data_instances.drop(attribute, axis=1)
+        if self._projection is not None:
+            self._projection = self._projection.project(
+                [
+                    column
+                    for column in self._projection.columns
+                    if column != attribute
+                ]
+            )
+            self._data_frame = None
+        elif self._data is not None:
+            self.data = self._data.drop(attribute)
 
         self.columns.remove(attribute)
+        self.invalidate_cache()
 
         return
 
@@ -306,27 +840,44 @@ class Relation:
             dependencies that is equivalent to F.
         """
 
-        # Satisfy Step 1
-        minimal_functional_dependencies: set[FD] = set()
-        for fd in self.functional_dependencies:
-            for attribute in fd.rhs:
-                minimal_functional_dependencies.add(
-                    FD(lhs=fd.lhs, rhs={attribute})
+        def compute() -> set[FD]:
+            return {
+                FD(
+                    lhs=self.universe.attributes(lhs_mask),
+                    rhs=self.universe.attributes(rhs_mask),
+                )
+                for lhs_mask, rhs_mask in minimal_cover(
+                    [
+                        fd.masks(self.universe)
+                        for fd in self.functional_dependencies
+                    ]
                 )
+            }
 
-        # Satisfy Step 2
-        corrected_minimal_functional_dependencies: set[FD] = set()
-        for fd in minimal_functional_dependencies:
-            for lhs_attribute in fd.lhs:
-                lhs_subset_fd = FD(lhs=fd.lhs - {lhs_attribute}, rhs=fd.rhs)
-                if lhs_subset_fd in minimal_functional_dependencies:
-                    corrected_minimal_functional_dependencies.add(
-                        lhs_subset_fd
-                    )
-                else:
-                    corrected_minimal_functional_dependencies.add(fd)
+        return set(self._cached(self._dependency_cache, "minimal", compute))
 
-        return corrected_minimal_functional_dependencies
+    def canonical_cover(self) -> set[FD]:
+        """Canonical Cover of the Functional Dependencies for the Relation.
+
+        The minimal set of functional dependencies where the dependencies
+        which share a left-hand side are merged into a single dependency.
+        """
+
+        def compute() -> set[FD]:
+            return {
+                FD(
+                    lhs=self.universe.attributes(lhs_mask),
+                    rhs=self.universe.attributes(rhs_mask),
+                )
+                for lhs_mask, rhs_mask in canonical_cover(
+                    [
+                        fd.masks(self.universe)
+                        for fd in self.functional_dependencies
+                    ]
+                )
+            }
+
+        return set(self._cached(self._dependency_cache, "canonical", compute))
 
     def prime_attributes(self) -> set[str]:
         """Prime Attributes for the Relation.
@@ -337,16 +888,79 @@ class Relation:
             called nonprime if it is not a prime attribute — that is, if it is
             not a member of any candidate key.
         """
-        prime_attributes: set[str] = set()
 
-        # Include attributes from the primary key.
-        prime_attributes = prime_attributes | self.primary_key
+        def compute() -> set[str]:
+            prime_attributes: set[str] = set()
 
-        # Include attributes from every candidate key.
-        for candidate_key in self.candidate_keys:
-            prime_attributes = prime_attributes | candidate_key
+            # Include attributes from the primary key.
+            prime_attributes = prime_attributes | self.primary_key
+
+            # Include attributes from every candidate key.
+            for candidate_key in self.candidate_keys:
+                prime_attributes = prime_attributes | candidate_key
+
+            return prime_attributes
+
+        return set(self._cached(self._key_cache, "prime", compute))
+
+    def discover_fds(
+        self,
+        max_partition_bytes: int = 1 << 28,
+        max_lhs_size: int | None = None,
+    ) -> set[FD]:
+        """Discover the functional dependencies that hold on the data
+        instances.
+
+        Every minimal, non-trivial functional dependency X → A of the data
+        instances is found with a level-wise search over stripped partitions
+        (see objects/discovery.py), and the dependencies that share a
+        left-hand side are merged. The result can be passed as the
+        functional dependencies of a Relation:
+
+            Relation(..., functional_dependencies=relation.discover_fds())
 
-        return prime_attributes
+        The dependencies only describe the current data instances, which may
+        satisfy dependencies that do not hold for the schema in general.
+
+        The search is exponential in the number of columns: without a bound
+        on the left-hand side, the lattice of a wide relation with few
+        dependencies has up to 2^n attribute sets. For wide relations (tens
+        of columns over many rows), pass a small max_lhs_size k, such as 2
+        or 3, which bounds the search to O(n^k) attribute sets.
+
+        Args:
+            max_partition_bytes (int, optional): The budget of bytes for the
+                partitions kept in memory during the search. Defaults to
+                256 MiB.
+            max_lhs_size (int | None, optional): The largest left-hand side
+                searched for, which bounds the search on wide relations.
+                Defaults to None, which searches every left-hand side.
+
+        Returns:
+            set[FD]: The discovered functional dependencies. A constant column
+                A is reported as ∅ → A.
+        """
+        assert self.data is not None, "Relation has no data instances"
+
+        dependencies: dict[int, int] = {}
+        for lhs_mask, rhs_mask in discover_dependencies(
+            {
+                self.universe.bit(column): self.data.codes[column]
+                for column in self.data.columns
+            },
+            len(self.data),
+            max_partition_bytes,
+            max_lhs_size,
+        ):
+            dependencies[lhs_mask] = dependencies.get(lhs_mask, 0) | rhs_mask
+
+        return {
+            FD(
+                lhs=self.universe.attributes(lhs_mask),
+                rhs=self.universe.attributes(rhs_mask),
+            )
+            for lhs_mask, rhs_mask in dependencies.items()
+        }
 
     def verify_mvd(self, mvd: MVD) -> bool:
         """Definition of a Multivalued Dependency:
@@ -372,6 +986,7 @@ class Relation:
         assert (
             mvd.lhs | mvd.rhs[0] | mvd.rhs[1]
         ) <= self.columns, f"Attributes in MVD not in columns: {self.columns}"
+        count("verify_mvd")
 
         X, Y, Z = mvd.lhs, mvd.rhs[0], mvd.rhs[1]
 
@@ -382,78 +997,109 @@ class Relation:
         ):  # The primary key is a subset of any X, Y, or Z
             return False
 
-        X_cols, Y_cols, Z_cols = list(X), list(Y), list(Z)
+        # X →→ Y | Z holds exactly when (XY, XZ) is a lossless decomposition,
+        # so the dependencies are chased before the data is scanned.
+        decomposition: list[set[str]] = [X | Y, X | Z]
+        if self.is_lossless_join(decomposition, multivalued=False):
+            return True  # Implied by the functional dependencies
+        if self.data is None:  # Implied by the other dependencies.
+            return self.is_lossless_join(decomposition, excluded=mvd)
 
-        for _, group in self.data_instances.groupby(list(X_cols)):
-            if len(group) <= 1:
-                continue
+        return bool(self.mvd_violations(mvd).empty)
 
-            for i1, t1 in group.iterrows():  # Index 1, Tuple 1
-                for i2, t2 in group.iterrows():  # Index 2, Tuple 2
-                    if i1 == i2:
-                        continue
+    def mvd_violations(self, mvd: MVD) -> pd.DataFrame:
+        """The groups of the data instances that violate a multivalued
+        dependency X →→ Y | Z.
 
-                    y1 = tuple(t1[Y_cols])
-                    z1 = tuple(t1[Z_cols])
+        Within a group of tuples that agree on X, the definition requires a
+        tuple for every combination of a Y value and a Z value that occurs in
+        the group. So the group satisfies the dependency exactly when its
+        number of distinct (Y, Z) pairs equals its number of distinct Y
+        values times its number of distinct Z values. The counts are taken
+        on the encoded data, without comparing pairs of tuples.
 
-                    y2 = tuple(t2[Y_cols])
-                    z2 = tuple(t2[Z_cols])
+        Args:
+            mvd (MVD): The multivalued dependency X →→ Y | Z.
 
-                    if (
-                        y1 == y2 and z1 == z2
-                    ):  # t1 and t2 have the same values, skip
-                        continue
+        Returns:
+            pd.DataFrame: The distinct X values of every group that violates
+                the multivalued dependency. Empty if the dependency holds.
+        """
+        assert (
+            mvd.lhs | mvd.rhs[0] | mvd.rhs[1]
+        ) <= self.columns, f"Attributes in MVD not in columns: {self.columns}"
 
-                    # t3: should have X=t1[X], Y=t1[Y], Z=t2[Z]
-                    has_t3 = (
-                        (group[Y_cols].apply(tuple, axis=1) == y1)
-                        & (group[Z_cols].apply(tuple, axis=1) == z2)
-                    ).any()
+        assert self.data is not None, "Relation has no data instances"
+
+        X_cols: list[str] = sorted(mvd.lhs)
+        x_codes: np.ndarray = self.data.group_codes(X_cols)
+        codes = pd.DataFrame(
+            {
+                "X": x_codes,
+                "Y": self.data.row_keys(sorted(mvd.rhs[0])),
+                "Z": self.data.row_keys(sorted(mvd.rhs[1])),
+            }
+        ).drop_duplicates()  # One row per distinct (X, Y, Z)
+
+        groups = codes.groupby("X", sort=False)
+        distinct_pairs: pd.Series = groups.size()
+        distinct_y: pd.Series = groups["Y"].nunique()
+        distinct_z: pd.Series = groups["Z"].nunique()
+        violating_groups: np.ndarray = distinct_pairs.index[
+            distinct_pairs != distinct_y * distinct_z
+        ].to_numpy()
+
+        violating_rows: np.ndarray = np.isin(x_codes, violating_groups)
+        return self.data.take(violating_rows).project(X_cols).to_frame()
+
+    def determine_mvds(self, executor: Executor | None = None) -> set[MVD]:
+        """EXTRA CREDIT
 
-                    # t4: should have X=t1[X], Y=t2[Y], Z=t1[Z]
-                    has_t4 = (
-                        (group[Y_cols].apply(tuple, axis=1) == y2)
-                        & (group[Z_cols].apply(tuple, axis=1) == z1)
-                    ).any()
+        Discovers the multivalued dependencies X →→ Y | Z that hold on the
+        data instances with a level-wise search over the left-hand sides (see
+        objects/discovery.py). Superkeys are skipped, as are the dependencies
+        implied by the functional dependencies or by a dependency found for a
+        subset of X. Y may have more than one attribute, and every candidate
+        is verified once.
 
-                    if not (has_t3 or has_t4):
-                        return False
-        return True
+        Like verify_mvd(), dependencies where the primary key is a subset of
+        X, Y or Z are not returned.
 
-    def determine_mvds(self) -> set[MVD]:
-        """EXTRA CREDIT
+        Args:
+            executor (Executor | None, optional): The executor the left-hand
+                sides are checked on. Defaults to None, which checks them
+                serially.
 
-        Calculates a list of possible multivalued dependencies from the set of
-        columns. Then verifies each possible multivalued dependency and returns
-        the set of all valid multivalued dependencies.
+        Returns:
+            set[MVD]: The discovered multivalued dependencies, with the
+                right-hand sides in sorted order.
         """
-        # Get every combination of attributes
-        column_combinations = list()
-        columns_list = list(self.columns)
-        for i in range(1, len(columns_list) + 1):
-            for combination in combinations(columns_list, i):
-                column_combinations.append(set(combination))
-
-        possible_mvds: list[MVD] = list()
-        for X in column_combinations:
-            remaining_columns: set[str] = self.columns - X
-            for i in range(1, len(remaining_columns)):
-                for Y_list in combinations(remaining_columns, i):
-                    Y = {Y_list[0]}
-                    Z = remaining_columns - Y
-
-                    potential_mvd = MVD(
-                        lhs=X, rhs=(Y, Z) if sorted(Y) < sorted(Z) else (Z, Y)
-                    )  # Sort RHS to avoid duplicate MVDs
-
-                    if potential_mvd not in possible_mvds:
-                        # self.multivalued_dependencies.add(potential_mvd)
-                        possible_mvds.append(potential_mvd)
-
-        verified_mvds: set[MVD] = set()
-        for mvd in possible_mvds:
-            verified = self.verify_mvd(mvd)
-            if verified:
-                verified_mvds.add(mvd)
-
-        return verified_mvds
+        assert self.data is not None, "Relation has no data instances"
+
+        primary_key_mask: int = self.attribute_mask(self.primary_key)
+        columns_mask: int = self.columns_mask
+
+        mvds: set[MVD] = set()
+        for lhs_mask, y_mask in discover_multivalued_dependencies(
+            {
+                self.universe.bit(column): self.data.codes[column]
+                for column in self.data.columns
+            },
+            self._closure_mask,
+            lambda mask: self.is_superkey(self.universe.attributes(mask)),
+            executor,
+        ):
+            z_mask: int = columns_mask & ~lhs_mask & ~y_mask
+            if is_subset(primary_key_mask, y_mask) or is_subset(
+                primary_key_mask, z_mask
+            ):
+                continue
+            Y = self.universe.attributes(y_mask)
+            Z = self.universe.attributes(z_mask)
+            mvds.add(
+                MVD(
+                    lhs=self.universe.attributes(lhs_mask),
+                    rhs=(Y, Z) if sorted(Y) < sorted(Z) else (Z, Y),
+                )
+            )
+        return mvds
@@ -0,0 +1,88 @@
+from bisect import bisect_left, insort
+
+
+class SubsumptionIndex:
+    """An index of sets of attributes, in their bitmask form, that tests if a
+    set is a subset of a set in the index.
+
+    The sets are bucketed by their size, and every bucket is kept sorted, so
+    a set that is already in the index is found by a binary search. Every
+    attribute also keeps a bitset of the sets that contain it, so the sets
+    that contain a set are the intersection of the bitsets of its
+    attributes. A test costs one integer operation per attribute, instead of
+    a subset test against every set in the index.
+    """
+
+    def __init__(self) -> None:
+        """The constructor for an empty subsumption index."""
+        self._buckets: dict[int, list[int]] = {}
+        self._containing: dict[int, int] = {}
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, mask: object) -> bool:
+        if not isinstance(mask, int):
+            return False
+        bucket: list[int] = self._buckets.get(mask.bit_count(), [])
+        position: int = bisect_left(bucket, mask)
+        return position < len(bucket) and bucket[position] == mask
+
+    def add(self, mask: int) -> None:
+        """Add a set of attributes to the index.
+
+        Args:
+            mask (int): The bitmask of the attributes.
+        """
+        insort(self._buckets.setdefault(mask.bit_count(), []), mask)
+        entry: int = 1 << self._count
+        self._count += 1
+        while mask:
+            low_bit: int = mask & -mask
+            self._containing[low_bit] = self._containing.get(low_bit, 0) | (
+                entry
+            )
+            mask ^= low_bit
+
+    def subsumes(self, mask: int) -> bool:
+        """Test if a set of attributes is a subset of a set in the index.
+
+        Args:
+            mask (int): The bitmask of the attributes.
+
+        Returns:
+            bool: True if a set in the index contains every attribute.
+        """
+        if mask in self:
+            return True
+        entries: int = (1 << self._count) - 1
+        while mask and entries:
+            low_bit: int = mask & -mask
+            entries &= self._containing.get(low_bit, 0)
+            mask ^= low_bit
+        return entries != 0
+
+
+def remove_subsumed(masks: list[int]) -> list[int]:
+    """The positions of the sets of attributes that are not a subset of
+    another set, keeping the first of equal sets.
+
+    The sets are added to a subsumption index from the largest to the
+    smallest, so a set is only tested against the sets that can contain it.
+
+    Args:
+        masks (list[int]): The bitmasks of the sets of attributes.
+
+    Returns:
+        list[int]: The positions of the kept sets, in their original order.
+    """
+    index = SubsumptionIndex()
+    kept: list[int] = []
+    for position in sorted(
+        range(len(masks)), key=lambda i: (-masks[i].bit_count(), i)
+    ):
+        if not index.subsumes(masks[position]):
+            index.add(masks[position])
+            kept.append(position)
+    return sorted(kept)
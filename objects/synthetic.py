@@ -0,0 +1,421 @@
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from .attributes import AttributeUniverse
+from .closure import ClosureEngine
+from .fd import FD, MVD, NonAtomic
+from .relation import Relation
+
+
+class GroundTruth:
+    """The dependencies planted in a synthetic relation, see
+    generate_relation(). They hold on the data instances, except on the rows
+    changed by noise. Only the planted dependencies are listed, not every
+    dependency they imply, nor the ones the random values happen to satisfy.
+
+    Attributes:
+        primary_key (set[str]): A superkey of the relation without noise.
+        fds (set[FD]): The functional dependencies.
+        mvds (set[MVD]): The multivalued dependencies.
+        jds (list[list[set[str]]]): The components of every join dependency
+            that is not implied by the multivalued dependencies.
+        non_atomic_columns (set[NonAtomic]): The multi-valued columns.
+        noisy_rows (list[int]): The positions of the rows changed by noise.
+    """
+
+    def __init__(
+        self,
+        primary_key: set[str],
+        fds: set[FD],
+        mvds: set[MVD],
+        jds: list[list[set[str]]],
+        non_atomic_columns: set[NonAtomic],
+        noisy_rows: list[int],
+    ):
+        """The constructor for the ground truth of a synthetic relation.
+
+        Args:
+            primary_key (set[str]): A superkey of the relation without
+                noise.
+            fds (set[FD]): The functional dependencies.
+            mvds (set[MVD]): The multivalued dependencies.
+            jds (list[list[set[str]]]): The components of every join
+                dependency.
+            non_atomic_columns (set[NonAtomic]): The multi-valued columns.
+            noisy_rows (list[int]): The positions of the rows changed by
+                noise.
+        """
+        self.primary_key: set[str] = primary_key
+        self.fds: set[FD] = fds
+        self.mvds: set[MVD] = mvds
+        self.jds: list[list[set[str]]] = jds
+        self.non_atomic_columns: set[NonAtomic] = non_atomic_columns
+        self.noisy_rows: list[int] = noisy_rows
+
+    def __repr__(self) -> str:
+        """Representation method for the GroundTruth class.
+
+        Returns:
+            str: The string representation of the ground truth.
+        """
+        return (
+            f"PK: {sorted(self.primary_key)}\n"
+            f"FDs: {self.fds}\n"
+            f"MVDs: {self.mvds}\n"
+            f"JDs: {[[sorted(c) for c in jd] for jd in self.jds]}\n"
+            f"Non-atomic: {self.non_atomic_columns}\n"
+            f"Noisy rows: {len(self.noisy_rows)}"
+        )
+
+    def fd_recall(self, found: Iterable[FD]) -> float:
+        """The fraction of the planted functional dependencies that are
+        implied by the ones found, such as by Relation.discover_fds().
+
+        Args:
+            found (Iterable[FD]): The functional dependencies found.
+
+        Returns:
+            float: The recall, 1.0 if no FD is planted.
+        """
+        if not self.fds:
+            return 1.0
+        found = list(found)
+        universe = AttributeUniverse(
+            attribute
+            for fd in self.fds | set(found)
+            for attribute in fd.lhs | fd.rhs
+        )
+        engine = ClosureEngine(fd.masks(universe) for fd in found)
+        return sum(
+            engine.implies(*fd.masks(universe)) for fd in self.fds
+        ) / len(self.fds)
+
+    def mvd_recall(self, found: Iterable[MVD]) -> float:
+        """The fraction of the planted multivalued dependencies that were
+        found with the same split of the columns, such as by
+        Relation.determine_mvds().
+
+        Args:
+            found (Iterable[MVD]): The multivalued dependencies found.
+
+        Returns:
+            float: The recall, 1.0 if no MVD is planted.
+        """
+        if not self.mvds:
+            return 1.0
+        splits: set[tuple[frozenset[str], frozenset[frozenset[str]]]] = {
+            (
+                frozenset(mvd.lhs),
+                frozenset({frozenset(mvd.rhs[0]), frozenset(mvd.rhs[1])}),
+            )
+            for mvd in found
+        }
+        return sum(
+            (
+                frozenset(mvd.lhs),
+                frozenset({frozenset(mvd.rhs[0]), frozenset(mvd.rhs[1])}),
+            )
+            in splits
+            for mvd in self.mvds
+        ) / len(self.mvds)
+
+    def jd_recall(self, found: Iterable[Iterable[Iterable[str]]]) -> float:
+        """The fraction of the planted join dependencies that were found
+        with the same components, such as by find_join_dependencies().
+
+        Args:
+            found (Iterable[Iterable[Iterable[str]]]): The columns of the
+                components of every join dependency found.
+
+        Returns:
+            float: The recall, 1.0 if no JD is planted.
+        """
+        if not self.jds:
+            return 1.0
+        decompositions: set[frozenset[frozenset[str]]] = {
+            frozenset(frozenset(component) for component in jd) for jd in found
+        }
+        return sum(
+            frozenset(frozenset(component) for component in jd)
+            in decompositions
+            for jd in self.jds
+        ) / len(self.jds)
+
+    def to_dict(self) -> dict[str, Any]:
+        """The ground truth as a JSON-serializable dictionary.
+
+        Returns:
+            dict[str, Any]: The ground truth, with sorted attribute lists.
+        """
+        return {
+            "primary_key": sorted(self.primary_key),
+            "fds": sorted([sorted(fd.lhs), sorted(fd.rhs)] for fd in self.fds),
+            "mvds": sorted(
+                [sorted(mvd.lhs), sorted(mvd.rhs[0]), sorted(mvd.rhs[1])]
+                for mvd in self.mvds
+            ),
+            "jds": [
+                [sorted(component) for component in jd] for jd in self.jds
+            ],
+            "non_atomic_columns": sorted(
+                [sorted(column.lhs), sorted(column.rhs)]
+                for column in self.non_atomic_columns
+            ),
+            "noisy_rows": self.noisy_rows,
+        }
+
+
+def _draw(
+    generator: np.random.Generator,
+    distinct: int,
+    shape: int | tuple[int, ...],
+    skew: float,
+) -> np.ndarray:
+    """Private function for drawing random values, uniformly or with a Zipf
+    skew: the value of rank k is drawn with a probability proportional to
+    1 / k ** skew.
+
+    Args:
+        generator (np.random.Generator): The random generator.
+        distinct (int): The number of distinct values, 0 to distinct - 1.
+        shape (int | tuple[int, ...]): The shape of the values.
+        skew (float): The Zipf exponent, 0 for uniform values.
+
+    Returns:
+        np.ndarray: The values.
+    """
+    if skew == 0:
+        return generator.integers(0, distinct, shape)
+    weights: np.ndarray = 1.0 / np.arange(1, distinct + 1) ** skew
+    return generator.choice(distinct, shape, p=weights / weights.sum())
+
+
+def _strings(values: np.ndarray) -> np.ndarray:
+    """Private function for the string form of integer values, converting
+    every distinct value once.
+
+    Args:
+        values (np.ndarray): The non-negative integer values.
+
+    Returns:
+        np.ndarray: The values as Python strings.
+    """
+    strings: np.ndarray = (
+        np.arange(int(values.max(initial=0)) + 1).astype(str).astype(object)
+    )
+    labels: np.ndarray = strings[values]
+    return labels
+
+
+def generate_relation(
+    columns: int = 8,
+    rows: int = 1000,
+    fds: int = 2,
+    mvds: int = 1,
+    jds: int = 0,
+    non_atomic: int = 0,
+    distinct: int = 100,
+    fanout: int = 2,
+    skew: float = 0.0,
+    noise: float = 0.0,
+    declare: bool = True,
+    seed: int = 0,
+    name: str = "SyntheticData",
+) -> tuple[Relation, GroundTruth]:
+    """Generate a relation with planted dependencies, and its ground truth.
+
+    The rows are grouped by a key column K. Within a group, the other
+    columns are split into independent branches, and the rows of the group
+    are every combination of the tuples of its branches:
+
+        -   The first branch, and one more branch per MVD, have fanout random
+            tuples per group. Every branch B but the first plants the MVD
+            K →→ B | R - K - B.
+        -   Every JD branch has three columns A, B and C, and the four tuples
+            (a1, b1, c1), (a1, b1, c2), (a1, b2, c1) and (a2, b1, c1) per
+            group. It plants the JD (KAB, KBC, KAC, R - ABC), which implies
+            no MVD of A, B and C.
+        -   The FDs determine a column each, in turn from a branch column,
+            from K, or from the column determined by the FD before, which
+            makes it transitive. A column determined by K is the same in
+            the whole group, and one determined by a branch column is added
+            to its branch.
+        -   Every non-atomic column holds a set of values per group.
+
+    Noise then changes one random cell of a fraction of the rows, outside of
+    K and the non-atomic columns, which breaks the dependencies on those
+    rows.
+
+    Args:
+        columns (int, optional): The number of columns. Defaults to 8.
+        rows (int, optional): The approximate number of rows, rounded to
+            whole groups. Duplicate rows are dropped. Defaults to 1000.
+        fds (int, optional): The number of FDs. Defaults to 2.
+        mvds (int, optional): The number of MVDs. Defaults to 1.
+        jds (int, optional): The number of JDs. Defaults to 0.
+        non_atomic (int, optional): The number of non-atomic columns.
+            Defaults to 0.
+        distinct (int, optional): The number of distinct values of every
+            column but K, at least 2. Defaults to 100.
+        fanout (int, optional): The tuples per group of every branch.
+            Defaults to 2.
+        skew (float, optional): The Zipf exponent of the values, 0 for
+            uniform values. Defaults to 0.0.
+        noise (float, optional): The fraction of the rows with a changed
+            cell. Defaults to 0.0.
+        declare (bool, optional): Whether the relation declares its planted
+            FDs and MVDs, rather than only its data. The non-atomic columns
+            are always declared. Defaults to True.
+        seed (int, optional): The seed of the random values. Defaults to 0.
+        name (str, optional): The name of the relation. Defaults to
+            "SyntheticData".
+
+    Returns:
+        tuple[Relation, GroundTruth]: The relation, and its ground truth.
+    """
+    branches: int = mvds + 1
+    free: int = columns - 1 - 3 * jds - non_atomic - fds
+    assert free >= branches, (
+        f"{columns} columns cannot hold {branches} branches, {jds} JDs, "
+        f"{non_atomic} non-atomic columns and {fds} FDs"
+    )
+    assert distinct >= 2, "Every column needs at least 2 distinct values"
+    generator: np.random.Generator = np.random.default_rng(seed)
+
+    # The columns of every branch, and the tuples of every branch per group.
+    branch_columns: list[list[str]] = [[] for _ in range(branches)]
+    for i in range(free):
+        branch_columns[i % branches].append(f"B{i % branches}_{i // branches}")
+    sizes: list[int] = [fanout] * branches + [4] * jds
+    per_group: int = int(np.prod(sizes))
+    groups: int = max(1, -(-rows // per_group))
+
+    # The position of the tuple of every branch within its group, per row.
+    group: np.ndarray = np.repeat(np.arange(groups), per_group)
+    local: np.ndarray = np.tile(np.arange(per_group), groups)
+    positions: list[np.ndarray] = []
+    stride: int = per_group
+    for size in sizes:
+        stride //= size
+        positions.append((local // stride) % size)
+
+    values: dict[str, np.ndarray] = {"K": group}
+    for branch, branch_column_list in enumerate(branch_columns):
+        for column in branch_column_list:
+            tuples: np.ndarray = _draw(
+                generator, distinct, (groups, fanout), skew
+            )
+            values[column] = tuples[group, positions[branch]]
+
+    truth_jds: list[list[set[str]]] = []
+    for jd in range(jds):
+        position: np.ndarray = positions[branches + jd]
+        a, b, c = (f"J{jd}A", f"J{jd}B", f"J{jd}C")
+        for column, second in ((a, 3), (b, 2), (c, 1)):
+            first: np.ndarray = _draw(generator, distinct, groups, skew)
+            other: np.ndarray = (
+                first + 1 + _draw(generator, distinct - 1, groups, skew)
+            ) % distinct
+            values[column] = np.where(
+                position == second, other[group], first[group]
+            )
+        truth_jds.append([{"K", a, b}, {"K", b, c}, {"K", a, c}])
+
+    truth_fds: set[FD] = set()
+    placement: dict[str, int | None] = {"K": None}  # The branch of a column.
+    for branch, branch_column_list in enumerate(branch_columns):
+        for column in branch_column_list:
+            placement[column] = branch
+    sources: list[str] = [
+        column for branch in branch_columns for column in branch
+    ]
+    previous: str = "K"
+    for i in range(fds):
+        source: str = [sources[(i // 3) % len(sources)], "K", previous][i % 3]
+        column = f"D{i}"
+        lookup: np.ndarray = _draw(
+            generator, distinct, max(groups, distinct), skew
+        )
+        values[column] = lookup[values[source]]
+        truth_fds.add(FD(lhs={source}, rhs={column}))
+        branch_of_source: int | None = placement[source]
+        placement[column] = branch_of_source
+        if branch_of_source is not None:
+            branch_columns[branch_of_source].append(column)
+        previous = column
+
+    frame: pd.DataFrame = pd.DataFrame(
+        {
+            column: _strings(column_values)
+            for column, column_values in values.items()
+        }
+    )
+    truth_non_atomic: set[NonAtomic] = set()
+    for i in range(non_atomic):
+        column = f"N{i}"
+        cells: np.ndarray = np.empty(groups, dtype=object)
+        cells[:] = [
+            frozenset(
+                str(value)
+                for value in _draw(
+                    generator, distinct, int(generator.integers(1, 4)), skew
+                )
+            )
+            for _ in range(groups)
+        ]
+        frame[column] = cells[group]
+        truth_non_atomic.add(NonAtomic(lhs={"K"}, rhs={column}))
+    frame = frame.drop_duplicates(ignore_index=True)
+
+    noisy_rows: list[int] = []
+    noisy_columns: list[str] = [
+        column for column in frame.columns if column[0] not in "KN"
+    ]
+    if noise and noisy_columns:
+        noisy_rows = sorted(
+            generator.choice(
+                len(frame), int(noise * len(frame)), replace=False
+            ).tolist()
+        )
+        for row in noisy_rows:
+            noisy_column: str = noisy_columns[
+                int(generator.integers(len(noisy_columns)))
+            ]
+            frame.at[row, noisy_column] = str(
+                int(generator.integers(distinct, 2 * distinct))
+            )
+
+    everything: set[str] = set(frame.columns)
+    truth_mvds: set[MVD] = {
+        MVD(lhs={"K"}, rhs=(set(branch), everything - {"K"} - set(branch)))
+        for branch in branch_columns[1:]
+    }
+    for jd, components in enumerate(truth_jds):
+        components.append(everything - {f"J{jd}A", f"J{jd}B", f"J{jd}C"})
+    determined: set[str] = {column for fd in truth_fds for column in fd.rhs}
+    primary_key: set[str] = {
+        column
+        for column in everything
+        if column not in determined and column[0] != "N"
+    }
+
+    relation = Relation(
+        name=name,
+        columns=everything,
+        primary_key=primary_key,
+        non_atomic_columns=truth_non_atomic,
+        functional_dependencies=truth_fds if declare else set(),
+        multivalued_dependencies=truth_mvds if declare else set(),
+        data_instances=frame,
+    )
+    truth = GroundTruth(
+        primary_key=primary_key,
+        fds=truth_fds,
+        mvds=truth_mvds,
+        jds=truth_jds,
+        non_atomic_columns=truth_non_atomic,
+        noisy_rows=noisy_rows,
+    )
+    return relation, truth
@@ -6,16 +6,45 @@ Core Components:
 
 1. Input Parser -> The Relation class.
 2. Normalizer -> This module.
-3. Final Relation Generator -> See: main.py
+3. Final Relation Generator -> See: main.py and objects/ddl.py.
 
 """
 
+import logging
+from contextlib import contextmanager
+from functools import partial
 from itertools import combinations
+from traceback import format_exc, format_exception
+from typing import Callable, Iterable, Iterator
 
-import pandas as pd
-
+from objects.attributes import is_subset
+from objects.encoding import LazyProjection
+from objects.executor import Executor, ProcessExecutor, SerialExecutor
 from objects.fd import FD, MVD, NonAtomic
+from objects.joins import find_join_dependencies
+from objects.logs import log_event
+from objects.metrics import NormalizationReport, StageMetrics, count
+from objects.policies import DecisionPolicy
 from objects.relation import Relation
+from objects.subsumption import SubsumptionIndex, remove_subsumed
+
+NORMAL_FORMS: tuple[str, ...] = ("1NF", "2NF", "3NF", "BCNF", "4NF", "5NF")
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class _OptionList:
+    """Private class for the numbered list of the possible decompositions,
+    rendered only when it is logged."""
+
+    def __init__(self, options: list[tuple[tuple[str, ...], ...]]):
+        self.options: list[tuple[tuple[str, ...], ...]] = options
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"\t#{i}\t{option}" for i, option in enumerate(self.options)
+        )
 
 
 def normalize_to_1NF(relation: Relation) -> list[Relation]:
@@ -55,40 +84,34 @@ def normalize_to_1NF(relation: Relation) -> list[Relation]:
             if relation.name.endswith("Data")
             else ""
         )
-        decomposition_fds: set[FD] = {
-            FD(lhs=fd.lhs.copy(), rhs=fd.rhs.copy())
-            for fd in relation.functional_dependencies
-            if fd.lhs <= decomposition_columns
-            and fd.rhs <= decomposition_columns
-        }
-        decomposition_mvds: set[MVD] = {
-            MVD(lhs=mvd.lhs, rhs=mvd.rhs)
-            for mvd in relation.multivalued_dependencies
-            if (
-                mvd.lhs <= decomposition_columns
-                and mvd.rhs[0] | mvd.rhs[1] <= decomposition_columns
-            )
-        }
+        decomposition_fds: set[FD] = relation.functional_dependencies_within(
+            decomposition_columns
+        )
+        decomposition_mvds: set[MVD] = (
+            relation.multivalued_dependencies_within(decomposition_columns)
+        )
 
         # Decompose the Data Instance
+        projection: LazyProjection | None = relation.project_data(
+            decomposition_columns
+        )
         for attribute in non_atomic_dependency.rhs:
             decomposition_data_instances = (
-                relation.data_instances[list(decomposition_columns)]
-                .explode(attribute, ignore_index=True)
-                .drop_duplicates()
-                if relation.data_instances is not None
+                projection.explode(attribute)
+                if projection is not None
                 else None
             )
 
-        decomposed_relation = Relation(
+        decomposed_relation = Relation.from_decomposition(
             name=decomposition_name,
             columns=decomposition_columns,
-            primary_key=decomposition_columns,
-            # TODO: candidate keys
+            primary_key=decomposition_columns.copy(),
             functional_dependencies=decomposition_fds,
             multivalued_dependencies=decomposition_mvds,
             data_instances=decomposition_data_instances,
+            universe=relation.universe,
         )
+        decomposed_relation.update_candidate_keys()
         decomposition.append(decomposed_relation)
 
         relation.remove_attribute(attribute)
@@ -134,34 +157,56 @@ def normalize_to_2NF(relation: Relation) -> list[Relation]:
                 holds; that is, for some A ε X, (X - {A}) → Y.
     """
 
-    minimal_fds = relation.minimal_fd_set()
+    primary_key_mask: int = relation.attribute_mask(relation.primary_key)
 
-    pfds: set[FD] = set()
-    for fd in relation.functional_dependencies:
-        if (
-            relation.primary_key <= fd.lhs
+    partial_fds: list[FD] = []
+    closure_sets: list[set[str]] = []
+    for fd in relation.canonical_cover():
+        count("fd_checks")
+        lhs_mask, _ = fd.masks(relation.universe)
+        if is_subset(
+            primary_key_mask, lhs_mask
         ):  # Skip if the primary key is entirely present in the LHS of the FD.
             continue
-        if fd.lhs.isdisjoint(
-            relation.primary_key
+        if (
+            lhs_mask & primary_key_mask == 0
         ):  # Skip if LHS of the FD contains no attribute in the primary key.
             continue
 
-        for rhs_attribute in fd.rhs:  # Minimize each FD
-            for lhs_attribute in fd.lhs | {""}:  # For each A in X
-                reduced_fd = FD(
-                    lhs=fd.lhs - {lhs_attribute}, rhs={rhs_attribute}
-                )
-                if reduced_fd in minimal_fds:  # Test if (X - {A}) → Y holds.
-                    pfds.add(fd)
-                    break
+        partial_fds.append(fd)
+        closure_sets.append(fd.lhs)
+        for lhs_attribute in sorted(fd.lhs):  # For each A in X
+            closure_sets.append(fd.lhs - {lhs_attribute})
+
+    # The canonical cover has no extraneous LHS attributes, so each X → Y
+    # left is partial to the primary key. The decomposition takes every
+    # attribute fully functionally dependent on X: those in X+, but not in
+    # (X - {A})+ for any A in X. This keeps the attributes that the cover
+    # only reaches transitively through Y.
+    closures: Iterator[set[str]] = iter(relation.closures(closure_sets))
+    pfds: list[FD] = []
+    for fd in partial_fds:
+        fully_dependent: set[str] = next(closures) - fd.lhs
+        for _ in fd.lhs:
+            fully_dependent -= next(closures)  # (X - {A})+
+        if fully_dependent:
+            pfds.append(FD(lhs=fd.lhs, rhs=fully_dependent))
 
     if not pfds:  # No PFDs -> Already in 2NF
         return [relation]
 
     decomposition: list[Relation] = []
     for pfd in pfds:
-        print(f"PFD: {pfd}")
+        if not pfd.lhs <= relation.columns:
+            continue  # LHS already moved into an earlier decomposition
+        log_event(
+            logger,
+            logging.DEBUG,
+            "partial_dependency",
+            "PFD: %s",
+            pfd,
+            relation=relation.name,
+        )
         decomposition_pk: set[str] = (pfd.lhs | pfd.rhs).intersection(
             relation.primary_key
         )
@@ -180,37 +225,28 @@ def normalize_to_2NF(relation: Relation) -> list[Relation]:
             if relation.name.endswith("Data")
             else ""
         )  # All in one line!
-        decomposition_fds: set[FD] = {
-            fd
-            for fd in relation.functional_dependencies
-            if fd.lhs <= decomposition_columns
-            and fd.rhs <= decomposition_columns
-        }
-        decomposition_mvds: set[MVD] = {
-            mvd
-            for mvd in relation.multivalued_dependencies
-            if mvd.lhs <= decomposition_columns
-            and mvd.rhs[0] | mvd.rhs[1] <= decomposition_columns
-        }
+        decomposition_fds: set[FD] = relation.functional_dependencies_within(
+            decomposition_columns
+        )
+        decomposition_mvds: set[MVD] = (
+            relation.multivalued_dependencies_within(decomposition_columns)
+        )
 
         # Decompose the Data Instance
-        decomposition_data_instances = (
-            relation.data_instances[
-                list(decomposition_columns)
-            ].drop_duplicates()
-            if relation.data_instances is not None
-            else None
+        decomposition_data_instances = relation.project_data(
+            decomposition_columns
         )
 
-        decomposed_relation = Relation(
+        decomposed_relation = Relation.from_decomposition(
             name=decomposition_name,
             columns=decomposition_columns,
             primary_key=decomposition_pk,
-            # TODO: candidate keys
             functional_dependencies=({pfd} | decomposition_fds),
             multivalued_dependencies=decomposition_mvds,
             data_instances=decomposition_data_instances,
+            universe=relation.universe,
         )
+        decomposed_relation.update_candidate_keys()
         decomposition.append(decomposed_relation)
 
         for attribute in pfd.rhs:
@@ -260,27 +296,44 @@ def normalize_to_3NF(relation: Relation) -> list[Relation]:
                 and both X → Z and Z → Y hold.
     """
 
+    primary_key_mask: int = relation.attribute_mask(relation.primary_key)
+    candidate_key_masks: list[int] = [
+        relation.attribute_mask(candidate_key)
+        for candidate_key in relation.candidate_keys
+    ]
+    prime_attributes_mask: int = relation.attribute_mask(
+        relation.prime_attributes()
+    )
+
     tfd_violations: set[FD] = set()
     for fd in relation.functional_dependencies:
-        if (
-            relation.primary_key <= fd.lhs
+        count("fd_checks")
+        lhs_mask, rhs_mask = fd.masks(relation.universe)
+        if is_subset(
+            primary_key_mask, lhs_mask
         ):  # The primary key is a subset of the Left-Hand Side of the FD.
             continue  # not a violation of 3NF
-        for candidate_key in relation.candidate_keys:
-            if (
-                candidate_key <= fd.lhs
-            ):  # Any candidate key is a subset of the Left-Hand Side of the
-                # FD.
-                continue  # not a violation of 3NF
-        if (
-            not fd.rhs - relation.prime_attributes()
+        if any(
+            is_subset(candidate_key_mask, lhs_mask)
+            for candidate_key_mask in candidate_key_masks
+        ):  # Any candidate key is a subset of the Left-Hand Side of the FD.
+            continue  # not a violation of 3NF
+        if is_subset(
+            rhs_mask, prime_attributes_mask
         ):  # No attributes in the Right-Hand Side of the FD are nonprime.
             continue  # not a violation of 3NF
         tfd_violations.add(fd)
 
     decomposition: list[Relation] = []
     for tfd in tfd_violations:
-        print(f"TFD: {tfd}")
+        log_event(
+            logger,
+            logging.DEBUG,
+            "transitive_dependency",
+            "TFD: %s",
+            tfd,
+            relation=relation.name,
+        )
         decomposition_pk: set[str] = tfd.lhs.copy()
         decomposition_columns: set[str] = tfd.lhs | tfd.rhs
         decomposition_name: str = (
@@ -297,40 +350,31 @@ def normalize_to_3NF(relation: Relation) -> list[Relation]:
             if relation.name.endswith("Data")
             else ""
         )
-        decomposition_fds: set[FD] = {
-            fd
-            for fd in relation.functional_dependencies
-            if fd.lhs <= decomposition_columns
-            and fd.rhs <= decomposition_columns
-        }
-        decomposition_mvds: set[MVD] = {
-            mvd
-            for mvd in relation.multivalued_dependencies
-            if mvd.lhs <= decomposition_columns
-            and mvd.rhs[0] | mvd.rhs[1] <= decomposition_columns
-        }
+        decomposition_fds: set[FD] = relation.functional_dependencies_within(
+            decomposition_columns
+        )
+        decomposition_mvds: set[MVD] = (
+            relation.multivalued_dependencies_within(decomposition_columns)
+        )
 
         # Decompose the Data Instance
-        decomposition_data_instances = (
-            relation.data_instances[
-                list(decomposition_columns)
-            ].drop_duplicates()
-            if relation.data_instances is not None
-            else None
+        decomposition_data_instances = relation.project_data(
+            decomposition_columns
         )
 
         # if len(decomposition_columns) == 1:
         #     continue
 
-        decomposed_relation = Relation(
+        decomposed_relation = Relation.from_decomposition(
             name=decomposition_name,
             columns=decomposition_columns,
             primary_key=decomposition_pk,
-            # TODO: candidate keys
             functional_dependencies=decomposition_fds,
             multivalued_dependencies=decomposition_mvds,
             data_instances=decomposition_data_instances,
+            universe=relation.universe,
         )
+        decomposed_relation.update_candidate_keys()
         decomposition.append(decomposed_relation)
 
         for attribute in tfd.rhs:
@@ -372,24 +416,53 @@ def normalize_to_BCNF(relation: Relation) -> list[Relation]:
     """
 
     # # Determine FDs that are in violation of BCNF
-    bncf_violations: set[FD] = set()
-    for fd in relation.functional_dependencies:
-        if (
-            relation.primary_key <= fd.lhs
+    primary_key_mask: int = relation.attribute_mask(relation.primary_key)
+    candidate_key_masks: list[int] = [
+        relation.attribute_mask(candidate_key)
+        for candidate_key in relation.candidate_keys
+    ]
+
+    bncf_violations: list[FD] = []
+    for fd in relation.canonical_cover():
+        count("fd_checks")
+        lhs_mask, _ = fd.masks(relation.universe)
+        if is_subset(
+            primary_key_mask, lhs_mask
         ):  # The primary key is a subset of the Left-Hand Side of the FD.
             continue  # not a violation of 3NF
-        for candidate_key in relation.candidate_keys:
-            if (
-                candidate_key <= fd.lhs
-            ):  # Any candidate key is a subset of the Left-Hand Side of the
-                # FD.
-                continue  # not a violation of 3NF
-        bncf_violations.add(fd)
+        if any(
+            is_subset(candidate_key_mask, lhs_mask)
+            for candidate_key_mask in candidate_key_masks
+        ):  # Any candidate key is a subset of the Left-Hand Side of the FD.
+            continue  # not a violation of 3NF
+        bncf_violations.append(fd)
+
+    # Decompose X → A after A → B, so the LHS A is still part of R. If A → B
+    # holds then A+ is a subset of X+, so order the violations by closure.
+    violation_closures: list[set[str]] = relation.closures(
+        [bcnf_violation.lhs for bcnf_violation in bncf_violations]
+    )
+    bncf_violations = [
+        bcnf_violation
+        for _, bcnf_violation in sorted(
+            zip(violation_closures, bncf_violations),
+            key=lambda violation: len(violation[0]),
+        )
+    ]
 
     # Decompose the given relation so that BCNF is satisfied.
     decomposition: list[Relation] = []
     for bcnf_violation in bncf_violations:
-        print(f"BCNF Violation: {bcnf_violation}")
+        if not bcnf_violation.lhs <= relation.columns:
+            continue  # LHS already moved into an earlier decomposition
+        log_event(
+            logger,
+            logging.DEBUG,
+            "bcnf_violation",
+            "BCNF Violation: %s",
+            bcnf_violation,
+            relation=relation.name,
+        )
 
         decomposition_pk: set[str] = bcnf_violation.lhs.copy()
         decomposition_columns: set[str] = (
@@ -409,41 +482,32 @@ def normalize_to_BCNF(relation: Relation) -> list[Relation]:
             if relation.name.endswith("Data")
             else ""
         )
-        decomposition_fds: set[FD] = {
-            fd
-            for fd in relation.functional_dependencies
-            if fd.lhs <= decomposition_columns
-            and fd.rhs <= decomposition_columns
-        }
-        decomposition_mvds: set[MVD] = {
-            mvd
-            for mvd in relation.multivalued_dependencies
-            if mvd.lhs <= decomposition_columns
-            and mvd.rhs[0] | mvd.rhs[1] <= decomposition_columns
-        }
+        decomposition_fds: set[FD] = relation.functional_dependencies_within(
+            decomposition_columns
+        )
+        decomposition_mvds: set[MVD] = (
+            relation.multivalued_dependencies_within(decomposition_columns)
+        )
 
         # Decompose the Data Instance
-        decomposition_data_instances = (
-            relation.data_instances[
-                list(decomposition_columns)
-            ].drop_duplicates()
-            if relation.data_instances is not None
-            else None
+        decomposition_data_instances = relation.project_data(
+            decomposition_columns
         )
 
         # if len(decomposition_columns) == 1:
         #     continue
 
         # New relation XA
-        decomposed_relation = Relation(
+        decomposed_relation = Relation.from_decomposition(
             name=decomposition_name,
             columns=decomposition_columns,
             primary_key=decomposition_pk,
-            # TODO: candidate keys
             functional_dependencies=decomposition_fds,
             multivalued_dependencies=decomposition_mvds,
             data_instances=decomposition_data_instances,
+            universe=relation.universe,
         )
+        decomposed_relation.update_candidate_keys()
         decomposition.append(decomposed_relation)
 
         # R becomes R-A
@@ -456,19 +520,34 @@ def normalize_to_BCNF(relation: Relation) -> list[Relation]:
     for attribute in (
         relation.columns - relation.primary_key
     ):  # Current non-prime attributes
-        if (
-            FD(lhs=relation.primary_key, rhs={attribute})
-            not in relation.minimal_fd_set()
+        if attribute not in relation.closure(
+            relation.primary_key
         ):  # If the primary key cannot uniquely identify the attribute, add
             # it to the primary key.
-            relation.primary_key.add(attribute)
+            relation.add_primary_key_attribute(attribute)
 
     decomposition.append(relation)
 
     return decomposition
 
 
-def normalize_to_4NF(relation: Relation) -> list[Relation]:
+def _verify_mvd(relation: Relation, mvd: MVD) -> bool:
+    """Private function for verifying a multivalued dependency of a relation
+    on an executor. A module-level function, so that it can be pickled.
+
+    Args:
+        relation (Relation): The relation.
+        mvd (MVD): The multivalued dependency.
+
+    Returns:
+        bool: True if the multivalued dependency holds on the relation.
+    """
+    return relation.verify_mvd(mvd)
+
+
+def normalize_to_4NF(
+    relation: Relation, executor: Executor | None = None
+) -> list[Relation]:
     """Normalize a Relation into Fourth Normal Form (4NF).
 
     Fourth Normal Form:
@@ -505,6 +584,8 @@ def normalize_to_4NF(relation: Relation) -> list[Relation]:
     Args:
         relation (Relation): Relation that is being normalized into the Fourth
             Normal Form.
+        executor (Executor | None, optional): The executor the MVDs are
+            verified on. Defaults to None, which verifies them serially.
 
     Returns:
         list[Relation]: The decomposition of the original relation into a
@@ -518,14 +599,25 @@ def normalize_to_4NF(relation: Relation) -> list[Relation]:
     if not mvds:  # No MVDs -> Already in 4NF
         return [relation]
 
-    decomposition: list[Relation] = []
-    for mvd in mvds:
-        print(f"MVD: {mvd}")
+    mvds_list: list[MVD] = list(mvds)
+    verified: list[bool] = (executor or SerialExecutor()).map(
+        partial(_verify_mvd, relation), mvds_list
+    )
 
-        if not relation.verify_mvd(mvd):
-            print("\tMVD is invalid, skipping...")
+    decomposition: list[Relation] = []
+    for mvd, valid in zip(mvds_list, verified):
+        log_event(
+            logger,
+            logging.DEBUG,
+            "multivalued_dependency",
+            "MVD: %s\n\tMVD is %s",
+            mvd,
+            "valid, decomposing..." if valid else "invalid, skipping...",
+            relation=relation.name,
+            valid=valid,
+        )
+        if not valid:
             continue
-        print("\tMVD is valid, decomposing...")
 
         # Decompose the Relation
         for rhs_attribute in mvd.rhs[0] | mvd.rhs[1]:
@@ -540,47 +632,42 @@ def normalize_to_4NF(relation: Relation) -> list[Relation]:
                 if rhs_attribute not in relation.name
                 else relation.name
             )
-            decomposition_fds: set[FD] = {
-                fd
-                for fd in relation.functional_dependencies
-                if fd.lhs <= decomposition_columns
-                and fd.rhs <= decomposition_columns
-            }
-            decomposition_mvds: set[MVD] = {
-                mvd
-                for mvd in relation.multivalued_dependencies
-                if mvd.lhs <= decomposition_columns
-                and mvd.rhs[0] | mvd.rhs[1] <= decomposition_columns
-            }
+            decomposition_fds: set[FD] = (
+                relation.functional_dependencies_within(decomposition_columns)
+            )
+            decomposition_mvds: set[MVD] = (
+                relation.multivalued_dependencies_within(decomposition_columns)
+            )
 
             # Decompose the Data Instance
-            decomposition_data_instances = (
-                relation.data_instances[
-                    list(decomposition_columns)
-                ].drop_duplicates()
-                if relation.data_instances is not None
-                else None
+            decomposition_data_instances = relation.project_data(
+                decomposition_columns
             )
 
-            decomposed_relation = Relation(
+            decomposed_relation = Relation.from_decomposition(
                 name=decomposition_name,
                 columns=decomposition_columns,
                 primary_key=decomposition_pk,
-                # TODO: candidate keys
                 functional_dependencies=decomposition_fds,
                 multivalued_dependencies=decomposition_mvds,
-                data_instances=(decomposition_data_instances),
+                data_instances=decomposition_data_instances,
+                universe=relation.universe,
             )
+            decomposed_relation.update_candidate_keys()
             decomposition.append(decomposed_relation)
 
         #     relation.remove_attribute(rhs_attribute),
         # decomposition.append(relation)
 
+    if not decomposition:  # No MVD verified -> Already in 4NF
+        return [relation]
     return decomposition
 
 
 def normalize_to_5NF(
-    relation: Relation, select_decomposition: bool = False
+    relation: Relation,
+    policy: DecisionPolicy | None = None,
+    executor: Executor | None = None,
 ) -> list[Relation]:
     """Normalize a Relation into Fifth Normal Form (5NF).
 
@@ -612,6 +699,11 @@ def normalize_to_5NF(
     Args:
         relation (Relation): Relation that is being normalized into the Fifth
             Normal Form.
+        policy (DecisionPolicy | None, optional): Chooses the decomposition
+            when there is more than one. Defaults to None, which chooses the
+            first one with the fewest columns.
+        executor (Executor | None, optional): The executor the joins are
+            checked on. Defaults to None, which checks them serially.
 
     Returns:
         list[Relation]: The decomposition of the original relation into a
@@ -632,19 +724,16 @@ def normalize_to_5NF(
 
     # Get a list of the combination of every prime attribute
     prime_attribute_combinations = list()
-    prime_key_list = list(relation.primary_key)
+    prime_key_list = sorted(relation.primary_key)
     for i in range(2, len(prime_key_list) + 1):
         for combination in combinations(prime_key_list, i):
             prime_attribute_combinations.append(set(combination))
 
     # Get all unique decompositions
-    decompositions: list[pd.DataFrame] = []
+    decompositions: list[tuple[str, ...]] = []
     for prime_attribute_combination in prime_attribute_combinations:
-        r1_projection: pd.DataFrame = relation.data_instances[
-            list(prime_attribute_combination)
-        ].drop_duplicates()
-        r1_projection = r1_projection.reindex(
-            sorted(r1_projection.columns), axis=1
+        r1_columns: tuple[str, ...] = tuple(
+            sorted(prime_attribute_combination)
         )
 
         for prime_attribute in prime_attribute_combination:
@@ -659,65 +748,42 @@ def normalize_to_5NF(
             ):
                 continue  # Trivial
 
-            r2_projection: pd.DataFrame = relation.data_instances[
-                list(remainder)
-            ].drop_duplicates()
-            r2_projection = r2_projection.reindex(
-                sorted(r2_projection.columns), axis=1
-            )
+            r2_columns: tuple[str, ...] = tuple(sorted(remainder))
 
             # Check if the projection with the same columns is already in the
             # decompositions
-            if not any(
-                set(r1_projection.columns) == set(decomposition.columns)
-                for decomposition in decompositions
-            ):
-                decompositions.append(r1_projection)
-
-            if not any(
-                set(r2_projection.columns) == set(decomposition.columns)
-                for decomposition in decompositions
-            ):
-                decompositions.append(r2_projection)
-
-    # Check for Join Dependencies
-    original_df = relation.data_instances.reindex(
-        sorted(relation.data_instances.columns), axis=1
+            if r1_columns not in decompositions:
+                decompositions.append(r1_columns)
+            if r2_columns not in decompositions:
+                decompositions.append(r2_columns)
+
+    covered: set[str] = set().union(*decompositions)
+    if relation.data is None and covered != relation.columns:
+        return [relation]  # No decomposition has every column.
+
+    # Check for Join Dependencies, only over the combinations of projections
+    # that can be a decomposition (see find_join_dependencies()). The ones
+    # implied by the dependencies are found by a chase, before the data is
+    # joined. The MVDs are only trusted without data, as in verify_mvd().
+    log_event(
+        logger,
+        logging.DEBUG,
+        "join_dependencies",
+        "Verifying Join Dependencies....",
+        relation=relation.name,
+        components=len(decompositions),
+    )
+    decomposition_columns: list[tuple[tuple[str, ...], ...]] = (
+        find_join_dependencies(
+            relation.data,
+            decompositions,
+            executor,
+            implied=partial(
+                relation.is_lossless_join,
+                multivalued=relation.data is None,
+            ),
+        )
     )
-    original_df = original_df.sort_values(
-        by=list(original_df.columns)
-    ).reset_index(drop=True)
-    decomposition_columns: set[tuple[tuple[str, ...], ...]] = set()
-
-    print("Verifying Join Dependencies....")
-    for i in range(2, len(decompositions) + 1):
-        for combination in combinations(decompositions, i):
-
-            join_df: pd.DataFrame = combination[0]
-            for table in combination[1:]:
-                assert isinstance(table, pd.DataFrame)
-                common_columns = list(
-                    set(table.columns) & set(join_df.columns)
-                )
-                if common_columns:
-                    join_df = pd.merge(
-                        join_df, table, on=common_columns, how="inner"
-                    )
-
-            join_df = join_df.reindex(sorted(join_df.columns), axis=1)
-
-            join_df = join_df.sort_values(
-                by=list(join_df.columns)
-            ).reset_index(drop=True)
-
-            valid_join = original_df.equals(join_df)
-
-            if valid_join:
-                combination_columns: set[tuple[str, ...]] = set()
-                for table in combination:
-                    assert isinstance(table, pd.DataFrame)
-                    combination_columns.add(tuple(table.columns))
-                decomposition_columns.add(tuple(combination_columns))
 
     if len(decomposition_columns) == 0:
         return [relation]
@@ -733,25 +799,26 @@ def normalize_to_5NF(
         == least_number_columns
     ]
 
-    decomposition_columns_selection: list[tuple[str, ...]] = []
-    if select_decomposition:
-        print("\nPOSSIBLE DECOMPOSITIONS:")
-        for i, column_combination in enumerate(decomposition_options):
-            print(f"\t#{i}\t{column_combination}")
-
-        decomposition_selection_number: int = int(
-            input(
-                "Choose a decomposition "
-                + f"(0-{len(decomposition_options) - 1}): "
-            )
-        )
-        assert decomposition_selection_number < len(decomposition_options)
+    log_event(
+        logger,
+        logging.DEBUG,
+        "decomposition_options",
+        "\nPOSSIBLE DECOMPOSITIONS:\n%s",
+        _OptionList(decomposition_options),
+        relation=relation.name,
+        options=len(decomposition_options),
+    )
 
-        decomposition_columns_selection = list(
-            decomposition_options[decomposition_selection_number]
-        )
-    else:
-        decomposition_columns_selection = list(decomposition_options[-1])
+    decomposition_selection_number: int = (policy or DecisionPolicy()).choose(
+        relation,
+        [
+            [set(columns) for columns in decomposition]
+            for decomposition in decomposition_options
+        ],
+    )
+    decomposition_columns_selection: list[tuple[str, ...]] = list(
+        decomposition_options[decomposition_selection_number]
+    )
 
     relation_number: int = 1
     decomposition: list[Relation] = []
@@ -760,189 +827,451 @@ def normalize_to_5NF(
 
         decomposition_pk: set[str] = set(columns_selection)
         final_decomposition_columns: set[str] = set(columns_selection)
-        print("FINAL DECOMP COLS", final_decomposition_columns)
-        decomposition_fds: set[FD] = {
-            fd
-            for fd in relation.functional_dependencies
-            if fd.lhs <= final_decomposition_columns
-            and fd.rhs <= final_decomposition_columns
-        }
-        decomposition_mvds: set[MVD] = {
-            mvd
-            for mvd in relation.multivalued_dependencies
-            if mvd.lhs <= final_decomposition_columns
-            and mvd.rhs[0] | mvd.rhs[1] <= final_decomposition_columns
-        }
+        log_event(
+            logger,
+            logging.DEBUG,
+            "decomposition_columns",
+            "FINAL DECOMP COLS %s",
+            final_decomposition_columns,
+            relation=relation.name,
+        )
+        decomposition_fds: set[FD] = relation.functional_dependencies_within(
+            final_decomposition_columns
+        )
+        decomposition_mvds: set[MVD] = (
+            relation.multivalued_dependencies_within(
+                final_decomposition_columns
+            )
+        )
 
         # Decompose the Data Instance
-        decomposition_data_instances = (
-            relation.data_instances[
-                list(final_decomposition_columns)
-            ].drop_duplicates()
-            if relation.data_instances is not None
-            else None
+        decomposition_data_instances = relation.project_data(
+            final_decomposition_columns
         )
 
-        decomposed_relation = Relation(
+        decomposed_relation = Relation.from_decomposition(
             name=f"R{relation_number}",
             columns=final_decomposition_columns,
             primary_key=decomposition_pk,
-            # TODO: candidate keys
             functional_dependencies=decomposition_fds,
             multivalued_dependencies=decomposition_mvds,
             data_instances=decomposition_data_instances,
+            universe=relation.universe,
         )
         relation_number += 1
+        decomposed_relation.update_candidate_keys()
         decomposition.append(decomposed_relation)
 
     return decomposition
 
 
+def _log_decomposition(title: str, relations: list[Relation]) -> None:
+    """Private function for logging the decomposition of a normal form. A
+    relation is only rendered if the log emits it.
+
+    Args:
+        title (str): The title of the decomposition.
+        relations (list[Relation]): The relations of the decomposition.
+    """
+    log_event(
+        logger,
+        logging.INFO,
+        "decomposition",
+        "%s\n%s\n%s\n",
+        "=" * 40,
+        title,
+        "=" * 40,
+        relations=[relation.name for relation in relations],
+    )
+    for relation in relations:
+        log_event(
+            logger,
+            logging.INFO,
+            "relation",
+            "%s\n%s",
+            relation,
+            "-" * 40,
+            relation=relation.name,
+        )
+
+
+def _resolve(relations: list[Relation]) -> None:
+    """Private function for taking the lazy projections of the final
+    decomposition, so that the returned relations no longer keep the data of
+    the intermediate relations they were projected from.
+
+    Args:
+        relations (list[Relation]): The relations of the decomposition.
+    """
+    for relation in relations:
+        relation.data  # Resolves the lazy projection of the relation.
+
+
+def _remove_subsumed(relations: list[Relation]) -> list[Relation]:
+    """Private function for removing the relations whose columns are a
+    subset of the columns of another relation, see remove_subsumed().
+
+    Args:
+        relations (list[Relation]): The relations, which share a universe.
+
+    Returns:
+        list[Relation]: The remaining relations, in their original order.
+    """
+    return [
+        relations[i]
+        for i in remove_subsumed(
+            [relation.columns_mask for relation in relations]
+        )
+    ]
+
+
+@contextmanager
+def _stage(
+    report: NormalizationReport | None, name: str
+) -> Iterator[StageMetrics]:
+    """Private function for measuring a stage of Normalizer() in its report,
+    see NormalizationReport.stage(). Without a report, the stage is neither
+    timed nor counted.
+
+    Args:
+        report (NormalizationReport | None): The report of the normalization.
+        name (str): The name of the stage.
+
+    Yields:
+        Iterator[StageMetrics]: The measurements of the stage.
+    """
+    if report is None:
+        yield StageMetrics(name)
+        return
+    with report.stage(name) as metrics:
+        yield metrics
+
+
 def Normalizer(
-    relation_to_normalize: Relation, normalize_to: str
+    relation_to_normalize: Relation,
+    normalize_to: str,
+    executor: Executor | None = None,
+    policy: DecisionPolicy | None = None,
+    report: NormalizationReport | None = None,
 ) -> list[Relation]:
 
-    if normalize_to not in ("1NF", "2NF", "3NF", "BCNF", "4NF", "5NF"):
+    if normalize_to not in NORMAL_FORMS:
         raise ValueError(f"Invalid Normal Form Selection: {normalize_to}")
 
-    print("ORIGINAL RELATION:")
-    print("-" * 40)
-    print(relation_to_normalize)
-    print()
-    print("#" * 40)
-    print()
+    if report is not None:
+        report.relation = relation_to_normalize.name
+        report.normalize_to = normalize_to
+
+    log_event(
+        logger,
+        logging.INFO,
+        "original_relation",
+        "ORIGINAL RELATION:\n%s\n%s\n\n%s\n",
+        "-" * 40,
+        relation_to_normalize,
+        "#" * 40,
+        relation=relation_to_normalize.name,
+        normalize_to=normalize_to,
+    )
 
     # Normalize to First Normal Form
-    decomposition_1NF: list[Relation] = normalize_to_1NF(
-        relation=relation_to_normalize
-    )
+    with _stage(report, "1NF") as metrics:
+        decomposition_1NF: list[Relation] = normalize_to_1NF(
+            relation=relation_to_normalize
+        )
+        metrics.relations = len(decomposition_1NF)
+
     if normalize_to == "1NF":
-        print("=" * 40)
-        print("DECOMPOSITION FOR FIRST NORMAL FORM:")
-        print("=" * 40)
-        print()
-        for relation_1NF in decomposition_1NF:
-            print(relation_1NF)
-            print("-" * 40)
+        _resolve(decomposition_1NF)
+        _log_decomposition(
+            "DECOMPOSITION FOR FIRST NORMAL FORM:", decomposition_1NF
+        )
         return decomposition_1NF
 
     # Normalize to Second Normal Form
-    decomposition_2NF: list[Relation] = list()
-    for relation_1NF in decomposition_1NF:
-        decomposition_2NF.extend(normalize_to_2NF(relation_1NF))
-
-    # 2NF - Remove relations already represented by other relations.
-    for i, relation_2NF in enumerate(decomposition_2NF):
-        for j, other_relation_2NF in enumerate(decomposition_2NF):
-            if i == j:
-                continue
-            if relation_2NF.columns <= other_relation_2NF.columns:
-                decomposition_2NF.remove(relation_2NF)
-                break
+    with _stage(report, "2NF") as metrics:
+        decomposition_2NF: list[Relation] = list()
+        for relation_1NF in decomposition_1NF:
+            decomposition_2NF.extend(normalize_to_2NF(relation_1NF))
+
+        # 2NF - Remove relations already represented by other relations.
+        decomposition_2NF = _remove_subsumed(decomposition_2NF)
+        metrics.relations = len(decomposition_2NF)
 
     if normalize_to == "2NF":
-        print("=" * 40)
-        print("DECOMPOSITION FOR SECOND NORMAL FORM:")
-        print("=" * 40)
-        print()
-        for relation_2NF in decomposition_2NF:
-            print(relation_2NF)
-            print("-" * 40)
+        _resolve(decomposition_2NF)
+        _log_decomposition(
+            "DECOMPOSITION FOR SECOND NORMAL FORM:", decomposition_2NF
+        )
         return decomposition_2NF
 
     # Normalize to Third Normal Form
-    decomposition_3NF: list[Relation] = list()
-    for relation_2NF in decomposition_2NF:
-        decomposition_3NF_chunk = normalize_to_3NF(relation_2NF)
-        for relation_3NF in decomposition_3NF_chunk:
-            novel_relation = True
-            for existing_relation_3NF in decomposition_3NF:
-                if relation_3NF.columns <= existing_relation_3NF.columns:
-                    novel_relation = False
-                    break
-            if novel_relation:
-                decomposition_3NF.append(relation_3NF)
+    with _stage(report, "3NF") as metrics:
+        decomposition_3NF: list[Relation] = list()
+        index_3NF = SubsumptionIndex()
+        for relation_2NF in decomposition_2NF:
+            decomposition_3NF_chunk = normalize_to_3NF(relation_2NF)
+            for relation_3NF in decomposition_3NF_chunk:
+                if not index_3NF.subsumes(relation_3NF.columns_mask):
+                    index_3NF.add(relation_3NF.columns_mask)
+                    decomposition_3NF.append(relation_3NF)
+        metrics.relations = len(decomposition_3NF)
 
     if normalize_to == "3NF":
-        print("=" * 40)
-        print("DECOMPOSITION FOR THIRD NORMAL FORM:")
-        print("=" * 40)
-        print()
-        for relation_3NF in decomposition_3NF:
-            print(relation_3NF)
-            print("-" * 40)
+        _resolve(decomposition_3NF)
+        _log_decomposition(
+            "DECOMPOSITION FOR THIRD NORMAL FORM:", decomposition_3NF
+        )
         return decomposition_3NF
 
     # Normalize to Boyce-Codd Normal Form
-    decomposition_BCNF: list[Relation] = list()
-    for relation_3NF in decomposition_3NF:
-        decomposition_BCNF_chunk = normalize_to_BCNF(relation_3NF)
-        for relation_BCNF in decomposition_BCNF_chunk:
-            novel_relation = True
-            for existing_relation_BCNF in decomposition_BCNF:
-                if relation_BCNF.columns <= existing_relation_BCNF.columns:
-                    novel_relation = False
-                    break
-            if novel_relation:
-                decomposition_BCNF.append(relation_BCNF)
+    with _stage(report, "BCNF") as metrics:
+        decomposition_BCNF: list[Relation] = list()
+        index_BCNF = SubsumptionIndex()
+        for relation_3NF in decomposition_3NF:
+            decomposition_BCNF_chunk = normalize_to_BCNF(relation_3NF)
+            for relation_BCNF in decomposition_BCNF_chunk:
+                if not index_BCNF.subsumes(relation_BCNF.columns_mask):
+                    index_BCNF.add(relation_BCNF.columns_mask)
+                    decomposition_BCNF.append(relation_BCNF)
+        metrics.relations = len(decomposition_BCNF)
 
     if normalize_to == "BCNF":
-        print("=" * 40)
-        print("DECOMPOSITION FOR BOYCE-CODD NORMAL FORM:")
-        print("=" * 40)
-        print()
-        for relation_BCNF in decomposition_BCNF:
-            print(relation_BCNF)
-            print("-" * 40)
+        _resolve(decomposition_BCNF)
+        _log_decomposition(
+            "DECOMPOSITION FOR BOYCE-CODD NORMAL FORM:", decomposition_BCNF
+        )
         return decomposition_BCNF
 
     # Normalize to Fourth Normal Form
-    decomposition_4NF: list[Relation] = list()
-    for relation_BCNF in decomposition_BCNF:
-        decomposition_4NF_chunk = normalize_to_4NF(relation_BCNF)
-        for relation_4NF in decomposition_4NF_chunk:
-            novel_relation = True
-            for existing_relation_4NF in decomposition_4NF:
-                if relation_4NF.columns <= existing_relation_4NF.columns:
-                    novel_relation = False
-                    break
-            if novel_relation:
-                decomposition_4NF.append(relation_4NF)
-
-    # 4NF - Remove relations already represented by other relations.
-    for i, relation_4NF in enumerate(decomposition_4NF):
-        for j, other_relation_4NF in enumerate(decomposition_4NF):
-            if i == j:
-                continue
-            if relation_4NF.columns <= other_relation_4NF.columns:
-                decomposition_4NF.remove(relation_4NF)
-                break
+    with _stage(report, "4NF") as metrics:
+        decomposition_4NF: list[Relation] = list()
+        index_4NF = SubsumptionIndex()
+        for relation_BCNF in decomposition_BCNF:
+            decomposition_4NF_chunk = normalize_to_4NF(
+                relation_BCNF, executor=executor
+            )
+            for relation_4NF in decomposition_4NF_chunk:
+                if not index_4NF.subsumes(relation_4NF.columns_mask):
+                    index_4NF.add(relation_4NF.columns_mask)
+                    decomposition_4NF.append(relation_4NF)
+
+        # 4NF - Remove relations already represented by other relations.
+        decomposition_4NF = _remove_subsumed(decomposition_4NF)
+        metrics.relations = len(decomposition_4NF)
 
     if normalize_to == "4NF":
-        print("=" * 40)
-        print("DECOMPOSITION FOR FOURTH NORMAL FORM:")
-        print("=" * 40)
-        print()
-        for relation_4NF in decomposition_4NF:
-            print(relation_4NF)
-            print("-" * 40)
+        _resolve(decomposition_4NF)
+        _log_decomposition(
+            "DECOMPOSITION FOR FOURTH NORMAL FORM:", decomposition_4NF
+        )
         return decomposition_4NF
 
     # Normalize to Fourth Normal Form
-    decomposition_5NF: list[Relation] = list()
-    for relation_4NF in decomposition_4NF:
-        decomposition_5NF.extend(
-            normalize_to_5NF(relation_4NF, select_decomposition=True)
-        )
+    with _stage(report, "5NF") as metrics:
+        decomposition_5NF: list[Relation] = list()
+        for relation_4NF in decomposition_4NF:
+            decomposition_5NF.extend(
+                normalize_to_5NF(
+                    relation_4NF, policy=policy, executor=executor
+                )
+            )
+        metrics.relations = len(decomposition_5NF)
 
     if normalize_to == "5NF":
-        print("=" * 40)
-        print("DECOMPOSITION FOR FIFTH NORMAL FORM:")
-        print("=" * 40)
-        print()
-        for relation_5NF in decomposition_5NF:
-            print(relation_5NF)
-            print("-" * 40)
+        _resolve(decomposition_5NF)
+        _log_decomposition(
+            "DECOMPOSITION FOR FIFTH NORMAL FORM:", decomposition_5NF
+        )
         return decomposition_5NF
 
     return []
+
+
+class NormalizationResult:
+    """The outcome of normalizing one relation of a batch, see
+    normalize_many().
+
+    Attributes:
+        position (int): The position of the relation in the batch.
+        name (str): The name of the relation.
+        relations (list[Relation]): The decomposition of the relation. Empty
+            if the normalization failed.
+        error (str | None): The traceback of the exception the normalization
+            raised, or None if it succeeded.
+        report (NormalizationReport | None): The timing and operation counts
+            of the normalization, if they were asked for.
+    """
+
+    def __init__(
+        self,
+        position: int,
+        name: str,
+        relations: list[Relation],
+        error: str | None = None,
+        report: NormalizationReport | None = None,
+    ):
+        """The constructor for a normalization result.
+
+        Args:
+            position (int): The position of the relation in the batch.
+            name (str): The name of the relation.
+            relations (list[Relation]): The decomposition of the relation.
+            error (str | None, optional): The traceback of the exception the
+                normalization raised. Defaults to None.
+            report (NormalizationReport | None, optional): The timing and
+                operation counts of the normalization. Defaults to None.
+        """
+        self.position: int = position
+        self.name: str = name
+        self.relations: list[Relation] = relations
+        self.error: str | None = error
+        self.report: NormalizationReport | None = report
+
+    def __repr__(self) -> str:
+        """Representation method for the NormalizationResult class.
+
+        Returns:
+            str: The string representation of a normalization result.
+        """
+        outcome: str = (
+            f"{len(self.relations)} relations"
+            if self.error is None
+            else self.error.strip().splitlines()[-1]
+        )
+        return f"#{self.position} {self.name}: {outcome}"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the normalization succeeded."""
+        return self.error is None
+
+
+def _normalize_one(
+    normalize_to: str,
+    policy: DecisionPolicy | None,
+    measure: bool,
+    item: tuple[int, Relation],
+) -> NormalizationResult:
+    """Private function for normalizing one relation of a batch on an
+    executor, catching its exception. A module-level function, so that it
+    can be pickled.
+
+    Args:
+        normalize_to (str): The normal form, see Normalizer().
+        policy (DecisionPolicy | None): The decision policy, see Normalizer().
+        measure (bool): Whether the normalization is measured in a report.
+        item (tuple[int, Relation]): The position of the relation in the
+            batch, and the relation.
+
+    Returns:
+        NormalizationResult: The decomposition of the relation, or the
+            traceback of its exception.
+    """
+    position, relation = item
+    report: NormalizationReport | None = (
+        NormalizationReport() if measure else None
+    )
+    try:
+        return NormalizationResult(
+            position,
+            relation.name,
+            Normalizer(relation, normalize_to, policy=policy, report=report),
+            report=report,
+        )
+    except Exception:
+        return NormalizationResult(
+            position, relation.name, [], format_exc(), report
+        )
+
+
+def _failed(
+    item: tuple[int, Relation], error: Exception
+) -> NormalizationResult:
+    """Private function for the result of a relation of a batch whose
+    normalization never returned, such as when its worker process crashed.
+
+    Args:
+        item (tuple[int, Relation]): The position of the relation in the
+            batch, and the relation.
+        error (Exception): The exception of the normalization.
+
+    Returns:
+        NormalizationResult: The traceback of the exception.
+    """
+    position, relation = item
+    return NormalizationResult(
+        position, relation.name, [], "".join(format_exception(error))
+    )
+
+
+def normalize_many(
+    relations: Iterable[Relation],
+    normalize_to: str,
+    workers: int | None = None,
+    policy: DecisionPolicy | None = None,
+    measure: bool = False,
+) -> Iterator[NormalizationResult]:
+    """Normalize many independent relations on a pool of processes.
+
+    Every relation is normalized by Normalizer() in a worker process, with
+    its checks run serially within the worker. The results are yielded as
+    the relations finish, not in the order of the relations, see
+    NormalizationResult.position. A relation whose normalization raises, or
+    crashes its worker process, is reported in its result, and the rest of
+    the batch goes on, on a new pool if the worker crashed.
+
+        for result in normalize_many(relations, "BCNF", workers=16):
+            if not result.ok:
+                print(result)
+
+    Args:
+        relations (Iterable[Relation]): The relations.
+        normalize_to (str): The normal form, see Normalizer().
+        workers (int | None, optional): The number of worker processes.
+            Defaults to None, which uses every CPU. A single worker
+            normalizes the relations in the calling process.
+        policy (DecisionPolicy | None, optional): The decision policy, see
+            Normalizer(). It is pickled to the workers, so it must not
+            prompt. Defaults to None.
+        measure (bool, optional): Whether every result carries the report of
+            its normalization, see NormalizationReport. Defaults to False.
+
+    Raises:
+        ValueError: If the normal form is invalid.
+
+    Returns:
+        Iterator[NormalizationResult]: The result of every relation.
+    """
+    if normalize_to not in NORMAL_FORMS:
+        raise ValueError(f"Invalid Normal Form Selection: {normalize_to}")
+
+    executor: Executor = (
+        SerialExecutor() if workers == 1 else ProcessExecutor(workers)
+    )
+    return _stream(
+        executor,
+        partial(_normalize_one, normalize_to, policy, measure),
+        enumerate(relations),
+    )
+
+
+def _stream(
+    executor: Executor,
+    function: Callable[[tuple[int, Relation]], NormalizationResult],
+    items: Iterable[tuple[int, Relation]],
+) -> Iterator[NormalizationResult]:
+    """Private function for the results of a batch as they finish, shutting
+    the executor down once they are all yielded.
+
+    Args:
+        executor (Executor): The executor of the batch.
+        function (Callable[[tuple[int, Relation]], NormalizationResult]):
+            Normalizes one relation of the batch.
+        items (Iterable[tuple[int, Relation]]): The positions and relations.
+
+    Returns:
+        Iterator[NormalizationResult]: The result of every relation.
+    """
+    with executor:
+        yield from executor.map_unordered(function, items, on_error=_failed)
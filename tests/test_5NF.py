@@ -1,4 +1,5 @@
 from objects.fd import FD
+from objects.policies import make_policy
 from objects.relation import Relation
 from rdbms_normalizer import normalize_to_5NF
 
@@ -89,10 +90,34 @@ def test_5NF() -> None:
         print()
         print("DECOMPOSITION FOR FIFTH NORMAL FORM:")
         print()
-        for decomposed_relation in normalize_to_5NF(
-            relation, select_decomposition=True
-        ):
+        for decomposed_relation in normalize_to_5NF(relation):
             print()
             print(decomposed_relation)
             print(".." * 20)
         print()
+
+
+def test_5NF_policies() -> None:
+    # The few data instances have four join dependencies with 5 columns.
+    expected: dict[str, list[set[str]]] = {
+        "fewest_columns": [
+            {"CustomerID", "DrinkID"},
+            {"DrinkID", "Milk", "OrderID"},
+        ],
+        "fewest_relations": [
+            {"CustomerID", "DrinkID"},
+            {"DrinkID", "Milk", "OrderID"},
+        ],
+        "saving": [
+            {"CustomerID", "OrderID"},
+            {"DrinkID", "Milk", "OrderID"},
+        ],  # 3 + 6 rows of 2 and 3 values, rather than 4 + 6 of them.
+    }
+    for kind, columns in expected.items():
+        decomposition = normalize_to_5NF(
+            CoffeeShopDrinksOrderData, policy=make_policy(kind)
+        )
+        assert [relation.columns for relation in decomposition] == columns
+    assert normalize_to_5NF(CoffeeShopOrderSummaryData) == [
+        CoffeeShopOrderSummaryData
+    ]
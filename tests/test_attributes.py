@@ -0,0 +1,44 @@
+from objects.attributes import AttributeUniverse, is_subset
+from objects.fd import FD, MVD
+from objects.relation import Relation
+
+Emp_Proj = Relation(
+    name="EMP_PROJ",
+    columns={"Ssn", "Pnumber", "Hours", "Ename", "Pname", "Plocation"},
+    primary_key={"Ssn", "Pnumber"},
+    functional_dependencies={
+        FD(lhs={"Ssn", "Pnumber"}, rhs={"Hours"}),
+        FD(lhs={"Ssn"}, rhs={"Ename"}),
+        FD(lhs={"Pnumber"}, rhs={"Pname", "Plocation"}),
+    },
+)  # Figure 14.11(a), Page 482
+
+
+def test_attributes() -> None:
+    universe = AttributeUniverse(Emp_Proj.columns)
+    assert len(universe) == len(Emp_Proj.columns)
+    for attribute in Emp_Proj.columns:
+        assert universe.attributes(universe.bit(attribute)) == {attribute}
+    assert universe.attributes(universe.full_mask) == Emp_Proj.columns
+
+    key_mask = universe.mask({"Ssn", "Pnumber"})
+    assert is_subset(universe.mask({"Ssn"}), key_mask)
+    assert not is_subset(universe.mask({"Ssn", "Hours"}), key_mask)
+
+    fd = FD(lhs={"Ssn"}, rhs={"Ename"})
+    assert fd.masks(universe) == (
+        universe.bit("Ssn"),
+        universe.bit("Ename"),
+    )
+
+    mvd = MVD(lhs={"Ssn"}, rhs=({"Pnumber"}, {"Hours"}))
+    assert mvd.masks(universe) == (
+        universe.bit("Ssn"),
+        universe.bit("Pnumber"),
+        universe.bit("Hours"),
+    )
+
+    assert Emp_Proj.functional_dependencies_within(
+        {"Pnumber", "Pname", "Plocation"}
+    ) == {FD(lhs={"Pnumber"}, rhs={"Pname", "Plocation"})}
+    assert Emp_Proj.functional_dependencies_within({"Ssn", "Pname"}) == set()
@@ -0,0 +1,34 @@
+import json
+from pathlib import Path
+
+from benchmark import BENCHMARKS, Size, compare, main, run_benchmark
+
+
+def test_run_benchmark() -> None:
+    size = Size(5, 2, 50, 5)
+    for name in BENCHMARKS:
+        result = run_benchmark(name, size, repeat=1)
+        assert result["benchmark"] == name
+        assert result["size"] == "c5-f2-r50-d5"
+        assert result["parameters"]["rows"] == 50
+        assert result["time"] > 0
+        assert result["peak_memory"] > 0
+
+
+def test_compare(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    arguments = ["--columns", "5", "--rows", "20", "--repeat", "1"]
+    arguments += ["--benchmarks", "normalize_to_1NF", "verify_mvd"]
+    assert main(arguments + ["--save", str(baseline)]) == 0
+    saved = json.loads(baseline.read_text())
+    assert [result["benchmark"] for result in saved] == [
+        "normalize_to_1NF",
+        "verify_mvd",
+    ]
+
+    slower = [dict(result, time=result["time"] * 2) for result in saved]
+    regressions = compare(slower, saved, tolerance=0.5)
+    assert len(regressions) == 2
+    assert "time" in regressions[0]
+    assert compare(saved, saved) == []
+    assert compare(slower, [], tolerance=0.5) == []
@@ -0,0 +1,111 @@
+from itertools import combinations
+
+import numpy as np
+
+from objects.attributes import is_subset
+from objects.chase import chase_lossless
+from objects.closure import ClosureEngine
+from objects.fd import FD, MVD
+from objects.joins import find_join_dependencies
+from objects.relation import Relation
+from rdbms_normalizer import normalize_to_4NF
+
+Emp_Proj = Relation(
+    name="EMP_PROJ",
+    columns={"Ssn", "Ename", "Pnumber", "Pname", "Plocation", "Hours"},
+    primary_key={"Ssn", "Pnumber"},
+    functional_dependencies={
+        FD(lhs={"Ssn"}, rhs={"Ename"}),
+        FD(lhs={"Pnumber"}, rhs={"Pname", "Plocation"}),
+        FD(lhs={"Ssn", "Pnumber"}, rhs={"Hours"}),
+    },
+)  # Figure 15.1, Page 528
+
+
+def test_chase_lossless() -> None:
+    assert Emp_Proj.is_lossless_join(
+        [
+            {"Ssn", "Ename"},
+            {"Pnumber", "Pname", "Plocation"},
+            {"Ssn", "Pnumber", "Hours"},
+        ]
+    )
+    assert not Emp_Proj.is_lossless_join(
+        [
+            {"Ename", "Plocation"},
+            {"Ssn", "Pnumber", "Hours", "Pname", "Plocation"},
+        ]
+    )
+    assert Emp_Proj.is_lossless_join([Emp_Proj.columns])
+
+
+def test_chase_multivalued() -> None:
+    Emp = Relation(
+        name="EMP",
+        columns={"Ename", "Pname", "Dname"},
+        primary_key={"Ename", "Pname", "Dname"},
+        multivalued_dependencies={
+            MVD(lhs={"Ename"}, rhs=({"Pname"}, {"Dname"}))
+        },
+    )
+    decomposition: list[set[str]] = [{"Ename", "Pname"}, {"Ename", "Dname"}]
+    assert Emp.is_lossless_join(decomposition)
+    assert not Emp.is_lossless_join(decomposition, multivalued=False)
+    assert not Emp.is_lossless_join([{"Ename", "Pname"}, {"Pname", "Dname"}])
+
+    # Without data, an MVD holds when the other dependencies imply it. A
+    # declared MVD does not verify itself.
+    mvd = MVD(lhs={"Ename"}, rhs=({"Pname"}, {"Dname"}))
+    assert not Emp.verify_mvd(mvd)
+    assert not Emp.verify_mvd(MVD(lhs={"Ename"}, rhs=({"Dname"}, {"Pname"})))
+    assert not Emp.verify_mvd(MVD(lhs={"Pname"}, rhs=({"Ename"}, {"Dname"})))
+    Emp.add_functional_dependency(FD(lhs={"Ename"}, rhs={"Dname"}))
+    assert Emp.verify_mvd(mvd)
+
+
+def test_verify_declared_mvd_without_data() -> None:
+    RData = Relation(
+        name="RData",
+        columns={"A", "B", "C"},
+        primary_key={"A", "B", "C"},
+        multivalued_dependencies={MVD(lhs={"A"}, rhs=({"B"}, {"C"}))},
+    )
+    assert not RData.verify_mvd(MVD(lhs={"A"}, rhs=({"B"}, {"C"})))
+    assert normalize_to_4NF(RData) == [RData]
+
+
+def test_chase_binary() -> None:
+    # A decomposition (R1, R2) is lossless exactly when R1 ∩ R2 determines
+    # R1 or R2.
+    generator = np.random.default_rng(5300)
+    full_mask: int = 0b11111
+    masks: list[int] = list(range(1, full_mask))
+    for _ in range(50):
+        fds: list[tuple[int, int]] = [
+            (int(lhs), int(rhs))
+            for lhs, rhs in generator.choice(masks, size=(3, 2))
+        ]
+        engine = ClosureEngine(fds)
+        for first, second in combinations(masks, 2):
+            if first | second != full_mask:
+                continue
+            closure: int = engine.closure(first & second)
+            expected: bool = is_subset(first, closure) or is_subset(
+                second, closure
+            )
+            assert chase_lossless([first, second], fds, [], full_mask) == (
+                expected
+            )
+
+
+def test_implied_join_dependencies() -> None:
+    R = Relation(
+        name="R",
+        columns={"A", "B", "C"},
+        primary_key={"A", "B", "C"},
+        functional_dependencies={FD(lhs={"B"}, rhs={"C"})},
+    )
+    components: list[tuple[str, ...]] = [("A", "B"), ("A", "C"), ("B", "C")]
+    assert find_join_dependencies(
+        None, components, implied=R.is_lossless_join
+    ) == [(("A", "B"), ("B", "C"))]
@@ -0,0 +1,70 @@
+from objects.closure import ClosureEngine
+from objects.fd import FD
+from objects.relation import Relation
+
+Emp_Dept = Relation(
+    name="EMP_DEPT",
+    columns={
+        "Ename",
+        "Ssn",
+        "Bdate",
+        "Address",
+        "Dnumber",
+        "Dname",
+        "Dmgr_ssn",
+    },
+    primary_key={"Ssn"},
+    functional_dependencies={
+        FD(lhs={"Ssn"}, rhs={"Ename", "Bdate", "Address", "Dnumber"}),
+        FD(lhs={"Dnumber"}, rhs={"Dname", "Dmgr_ssn"}),
+    },
+)  # Figure 14.11(b), Page 482
+
+
+def test_closure() -> None:
+    assert Emp_Dept.closure({"Ssn"}) == Emp_Dept.columns
+    assert Emp_Dept.closure({"Dnumber"}) == {"Dnumber", "Dname", "Dmgr_ssn"}
+    assert Emp_Dept.closure({"Ename"}) == {"Ename"}
+    assert Emp_Dept.closures([{"Dnumber"}, {"Ename"}, {"Dnumber"}]) == [
+        {"Dnumber", "Dname", "Dmgr_ssn"},
+        {"Ename"},
+        {"Dnumber", "Dname", "Dmgr_ssn"},
+    ]
+
+    assert Emp_Dept.implies(FD(lhs={"Ssn"}, rhs={"Dmgr_ssn"}))
+    assert not Emp_Dept.implies(FD(lhs={"Dnumber"}, rhs={"Ssn"}))
+
+    assert Emp_Dept.is_superkey({"Ssn"})
+    assert Emp_Dept.is_superkey({"Ssn", "Dname"})
+    assert not Emp_Dept.is_superkey({"Dnumber", "Ename"})
+
+    # A → B, BC → D, D → E with an empty-LHS dependency ∅ → F
+    engine = ClosureEngine([(0b1, 0b10), (0b110, 0b1000), (0b1000, 0b10000)])
+    assert engine.closure(0b1) == 0b11
+    assert engine.closure(0b101) == 0b11111
+    assert ClosureEngine([(0, 0b100000)]).closure(0b1) == 0b100001
+
+
+def test_cache() -> None:
+    relation = Relation(
+        name="EMP_DEPT",
+        columns=Emp_Dept.columns,
+        primary_key=Emp_Dept.primary_key,
+        functional_dependencies=Emp_Dept.functional_dependencies,
+    )
+    assert relation.closure({"Dnumber"}) == {"Dnumber", "Dname", "Dmgr_ssn"}
+    assert relation.prime_attributes() == {"Ssn"}
+
+    relation.remove_attribute("Dname")
+    assert relation.closure({"Dnumber"}) == {"Dnumber", "Dmgr_ssn"}
+
+    relation.add_functional_dependency(FD(lhs={"Dmgr_ssn"}, rhs={"Ename"}))
+    assert relation.closure({"Dnumber"}) == {"Dnumber", "Dmgr_ssn", "Ename"}
+    assert not relation.is_superkey({"Dnumber"})
+
+    relation.add_primary_key_attribute("Bdate")
+    assert relation.prime_attributes() == {"Ssn", "Bdate"}
+
+    relation.update_candidate_keys()
+    assert relation.candidate_keys == {frozenset({"Ssn"})}
+    assert relation.prime_attributes() == {"Ssn", "Bdate"}
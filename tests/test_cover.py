@@ -0,0 +1,42 @@
+from objects.fd import FD
+from objects.relation import Relation
+
+R = Relation(
+    name="R",
+    columns={"A", "B", "D"},
+    primary_key={"B"},
+    functional_dependencies={
+        FD(lhs={"B"}, rhs={"A"}),
+        FD(lhs={"D"}, rhs={"A"}),
+        FD(lhs={"A", "B"}, rhs={"D"}),
+    },
+)  # Minimal cover: {B → D, D → A}
+
+S = Relation(
+    name="S",
+    columns={"A", "B", "C", "D"},
+    primary_key={"A"},
+    functional_dependencies={
+        FD(lhs={"A"}, rhs={"B", "C"}),
+        FD(lhs={"A", "B"}, rhs={"C", "D"}),
+        FD(lhs={"B"}, rhs={"C"}),
+        FD(lhs={"A"}, rhs={"A"}),
+    },
+)
+
+
+def test_cover() -> None:
+    assert R.minimal_fd_set() == {
+        FD(lhs={"B"}, rhs={"D"}),
+        FD(lhs={"D"}, rhs={"A"}),
+    }
+
+    assert S.minimal_fd_set() == {
+        FD(lhs={"A"}, rhs={"B"}),
+        FD(lhs={"A"}, rhs={"D"}),
+        FD(lhs={"B"}, rhs={"C"}),
+    }
+    assert S.canonical_cover() == {
+        FD(lhs={"A"}, rhs={"B", "D"}),
+        FD(lhs={"B"}, rhs={"C"}),
+    }
@@ -0,0 +1,91 @@
+import copy
+import io
+import re
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from main import CoffeeShopDataStandard
+from objects.ddl import foreign_keys, iter_ddl, write_ddl
+from objects.fd import FD
+from objects.relation import Relation
+from rdbms_normalizer import Normalizer
+
+
+def test_sqlite_ddl(tmp_path: Path) -> None:
+    relations = Normalizer(copy.deepcopy(CoffeeShopDataStandard), "BCNF")
+    path: Path = tmp_path / "schema.sql"
+    statements: int = write_ddl(relations, path)
+    assert statements == len(relations)
+
+    connection = sqlite3.connect(":memory:")
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(path.read_text(encoding="utf-8"))
+    tables: list[str] = [
+        name
+        for (name,) in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )
+    ]
+    assert sorted(tables) == sorted(relation.name for relation in relations)
+
+    for relation in relations:
+        info = connection.execute(f'PRAGMA table_info("{relation.name}")')
+        assert {
+            column for _, column, _, _, _, pk in info if pk
+        } == relation.primary_key
+    order: dict[str, int] = {table: i for i, table in enumerate(tables)}
+    references: set[tuple[str, str]] = set()
+    for table in tables:
+        for row in connection.execute(f'PRAGMA foreign_key_list("{table}")'):
+            assert order[row[2]] < order[table]  # Created first.
+            references.add((table, row[2]))
+    assert ("CoffeeShopOrderData", "CoffeeShopOrderCustomerData") in (
+        references
+    )
+
+    # The data instances satisfy the keys in creation order.
+    by_name: dict[str, Relation] = {r.name: r for r in relations}
+    for table in tables:
+        frame = by_name[table].data_instances
+        assert frame is not None
+        connection.executemany(
+            f'INSERT INTO "{table}" ({", ".join(frame.columns)}) '
+            f"VALUES ({', '.join('?' * len(frame.columns))})",
+            frame.itertuples(index=False, name=None),
+        )
+    assert connection.execute(
+        'SELECT "CustomerName" FROM "CoffeeShopOrderCustomerData" '
+        'WHERE "CustomerID" = 2'
+    ).fetchone() == ("David Miller",)
+
+
+def test_postgresql_ddl() -> None:
+    left = Relation(
+        name="R",
+        columns={"A", "B"},
+        primary_key={"A"},
+        candidate_keys={frozenset({"A"}), frozenset({"B"})},
+        functional_dependencies={FD({"A"}, {"B"}), FD({"B"}, {"A"})},
+    )
+    right = Relation(name="R", columns={"A", "B", "C"}, primary_key={"B"})
+    assert foreign_keys([left, right]) == [[1], [0]]
+
+    stream = io.StringIO()
+    assert write_ddl([left, right], stream, dialect="postgresql") == 3
+    statements: list[str] = stream.getvalue().strip().split("\n\n")
+    assert statements[0].startswith('CREATE TABLE "R_2" (')
+    assert '"B" TEXT NOT NULL' in statements[0]
+    assert statements[1].startswith('CREATE TABLE "R" (')
+    assert 'UNIQUE ("B")' in statements[1]
+    assert re.search(r'FOREIGN KEY \("B"\) REFERENCES "R_2"', statements[1])
+    # The cycle of references is closed once both tables exist.
+    assert statements[2] == (
+        'ALTER TABLE "R_2" ADD FOREIGN KEY ("A") REFERENCES "R" ("A");'
+    )
+
+    sqlite: list[str] = list(iter_ddl([left, right]))
+    assert len(sqlite) == 2 and 'REFERENCES "R" ("A")' in sqlite[0]
+    with pytest.raises(ValueError):
+        list(iter_ddl([left], dialect="mysql"))
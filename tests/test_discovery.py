@@ -0,0 +1,101 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from objects.discovery import discover_dependencies
+from objects.fd import FD
+from objects.relation import Relation
+
+Teach = Relation(
+    name="TEACH",
+    columns={"Student", "Course", "Instructor"},
+    primary_key={"Student", "Course"},
+    data_instances=[
+        {"Student": "Narayan", "Course": "Database", "Instructor": "Mark"},
+        {"Student": "Smith", "Course": "Database", "Instructor": "Navathe"},
+        {"Student": "Smith", "Course": "Operating", "Instructor": "Ammar"},
+        {"Student": "Smith", "Course": "Theory", "Instructor": "Schulman"},
+        {"Student": "Wallace", "Course": "Database", "Instructor": "Mark"},
+        {"Student": "Wallace", "Course": "Operating", "Instructor": "Ahamad"},
+        {"Student": "Wong", "Course": "Database", "Instructor": "Omiecinski"},
+        {"Student": "Zelaya", "Course": "Database", "Instructor": "Navathe"},
+        {"Student": "Narayan", "Course": "Operating", "Instructor": "Ammar"},
+    ],
+)  # Figure 14.13, Page 490
+
+
+def brute_force(frame: pd.DataFrame) -> set[tuple[int, int]]:
+    columns: list[str] = list(frame.columns)
+    dependencies: set[tuple[int, int]] = set()
+    for rhs in range(len(columns)):
+        others = [lhs for lhs in range(len(columns)) if lhs != rhs]
+        found: list[set[int]] = []
+        for size in range(len(columns)):
+            for lhs in combinations(others, size):
+                if any(smaller <= set(lhs) for smaller in found):
+                    continue
+                if (
+                    frame[columns[rhs]].nunique() <= 1
+                    if not lhs
+                    else (
+                        frame.groupby([columns[i] for i in lhs])[
+                            columns[rhs]
+                        ].nunique()
+                        <= 1
+                    ).all()
+                ):
+                    found.append(set(lhs))
+        dependencies |= {(sum(1 << i for i in lhs), 1 << rhs) for lhs in found}
+    return dependencies
+
+
+def test_discover_fds() -> None:
+    assert Teach.discover_fds() == {
+        FD(lhs={"Instructor"}, rhs={"Course"}),
+        FD(lhs={"Student", "Course"}, rhs={"Instructor"}),
+    }
+
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        rows = int(rng.integers(1, 12))
+        frame = pd.DataFrame(
+            {
+                f"C{i}": rng.integers(0, rng.integers(1, 4), rows)
+                for i in range(int(rng.integers(1, 6)))
+            }
+        )
+        attributes = {
+            1 << i: pd.factorize(frame[column])[0].astype(np.int32)
+            for i, column in enumerate(frame.columns)
+        }
+        for max_bytes in (0, 1 << 20):
+            assert set(
+                discover_dependencies(attributes, rows, max_bytes)
+            ) == brute_force(frame)
+
+
+def test_discover_bounded() -> None:
+    rng = np.random.default_rng(0)
+    rows: int = 6000  # More than the rows a dependency is first tested on.
+    frame = pd.DataFrame(
+        {f"C{i}": rng.integers(0, 3 + 2 * i, rows) for i in range(4)}
+    )
+    frame["C4"] = frame["C0"] * 11 + frame["C1"]  # C0, C1 → C4
+    frame["C5"] = frame["C2"] % 2  # C2 → C5
+    attributes = {
+        1 << i: pd.factorize(frame[column])[0].astype(np.int32)
+        for i, column in enumerate(frame.columns)
+    }
+    expected: set[tuple[int, int]] = brute_force(frame)
+    for max_lhs_size in range(4):
+        for max_bytes in (0, 1 << 20):
+            assert set(
+                discover_dependencies(
+                    attributes, rows, max_bytes, max_lhs_size
+                )
+            ) == {
+                (lhs, rhs)
+                for lhs, rhs in expected
+                if lhs.bit_count() <= max_lhs_size
+            }
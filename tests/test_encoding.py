@@ -0,0 +1,113 @@
+import pandas as pd
+
+from objects.encoding import EncodedData, LazyProjection
+from objects.metrics import NormalizationReport
+from objects.relation import Relation
+
+Drink_Data = Relation(
+    name="DrinkData",
+    columns={"DrinkID", "DrinkName", "DrinkIngredient"},
+    primary_key={"DrinkID"},
+    data_instances=[
+        {
+            "DrinkID": "1",
+            "DrinkName": "Caffe Latte",
+            "DrinkIngredient": {"Espresso", "Oat Milk"},
+        },
+        {
+            "DrinkID": "2",
+            "DrinkName": "Iced Caramel Macchiato",
+            "DrinkIngredient": {"Espresso", "Caramel Syrup"},
+        },
+        {
+            "DrinkID": "1",
+            "DrinkName": "Caffe Latte",
+            "DrinkIngredient": {"Espresso", "Oat Milk"},
+        },
+    ],
+)
+
+
+def test_encoding() -> None:
+    data = Drink_Data.data
+    assert data is not None
+    assert len(data) == 3
+    assert data.codes["DrinkID"].tolist() == [0, 1, 0]
+    assert Drink_Data.data_instances is not None
+    assert Drink_Data.data_instances.loc[0, "DrinkIngredient"] == {
+        "Espresso",
+        "Oat Milk",
+    }
+
+    # Projections share the dictionaries and keep the first occurrences.
+    projection = data.project(["DrinkID", "DrinkName"])
+    assert projection.dictionaries["DrinkID"] is data.dictionaries["DrinkID"]
+    assert projection.index.tolist() == [0, 1]
+    assert projection.to_frame().equals(
+        pd.DataFrame(
+            {
+                "DrinkID": ["1", "2"],
+                "DrinkName": ["Caffe Latte", "Iced Caramel Macchiato"],
+            }
+        )
+    )
+
+    exploded = data.project(["DrinkID", "DrinkIngredient"]).explode(
+        "DrinkIngredient"
+    )
+    assert len(exploded) == 4
+    assert set(exploded.to_frame().itertuples(index=False, name=None)) == {
+        ("1", "Espresso"),
+        ("1", "Oat Milk"),
+        ("2", "Espresso"),
+        ("2", "Caramel Syrup"),
+    }
+
+    Drink_Data_Copy = Relation(
+        name="DrinkData",
+        columns=Drink_Data.columns,
+        primary_key=Drink_Data.primary_key,
+        data_instances=data,
+    )
+    Drink_Data_Copy.remove_attribute("DrinkIngredient")
+    assert Drink_Data_Copy.data_instances is not None
+    assert list(Drink_Data_Copy.data_instances.columns) == [
+        column for column in data.columns if column != "DrinkIngredient"
+    ]
+    assert EncodedData.from_frame(pd.DataFrame()).to_frame().empty
+
+
+def test_lazy_projection() -> None:
+    data = Drink_Data.data
+    assert data is not None
+    report = NormalizationReport()
+    with report.stage("lazy"):
+        projection = Drink_Data.project_data(["DrinkID", "DrinkIngredient"])
+        assert projection is not None
+        exploded = projection.explode("DrinkIngredient")
+        decomposed = Relation(
+            name="DrinkIngredientData",
+            columns={"DrinkID", "DrinkIngredient"},
+            primary_key={"DrinkID", "DrinkIngredient"},
+            data_instances=exploded,
+        )
+        # A projection of a lazy projection is taken from the same data.
+        ids = decomposed.project_data(["DrinkID"])
+        assert ids is not None and ids.data is data
+        assert ids.exploded is None
+        decomposed.remove_attribute("DrinkID")
+    assert report.stages[0].counters["projections"] == 0
+
+    with report.stage("resolve"):
+        assert decomposed.data is not None
+        assert sorted(decomposed.data.to_frame()["DrinkIngredient"]) == [
+            "Caramel Syrup",
+            "Espresso",
+            "Oat Milk",
+        ]
+        assert len(ids.resolve()) == 2
+    assert report.stages[1].counters["projections"] == 2
+    assert report.stages[1].counters["rows_exploded"] == 4
+
+    other = LazyProjection(data, data.columns, "DrinkIngredient")
+    assert other.explode("DrinkName").data is not data
@@ -0,0 +1,68 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from objects.executor import make_executor
+from objects.fd import MVD
+from objects.relation import Relation
+from rdbms_normalizer import normalize_to_4NF
+from tests.test_mvd import Emp
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+@pytest.mark.parametrize("kind", ["serial", "thread", "process"])
+def test_executor(kind: str) -> None:
+    with make_executor(kind, workers=2) as executor:
+        assert executor.map(square, range(50)) == [
+            value * value for value in range(50)
+        ]
+        assert sorted(executor.map_unordered(square, range(50))) == [
+            value * value for value in range(50)
+        ]
+
+        assert Emp.determine_mvds(executor=executor) == Emp.determine_mvds()
+
+        emp = Relation(
+            name="EMP",
+            columns=Emp.columns,
+            primary_key=Emp.primary_key,
+            multivalued_dependencies={
+                MVD(lhs={"Ename"}, rhs=({"Pname"}, {"Dname"})),
+                MVD(lhs={"Pname"}, rhs=({"Ename"}, {"Dname"})),  # Invalid
+            },
+            data_instances=Emp.data_instances,
+        )
+        assert {
+            frozenset(decomposed.columns)
+            for decomposed in normalize_to_4NF(emp, executor=executor)
+        } == {frozenset({"Ename", "Pname"}), frozenset({"Ename", "Dname"})}
+
+
+def crash(value: int) -> int:
+    if value == 3:
+        os._exit(1)  # A worker killed mid-task, as by the OOM killer.
+    return value * value
+
+
+def test_executor_crash() -> None:
+    with make_executor("process", workers=2) as executor:
+        results = executor.map_unordered(
+            crash, range(20), on_error=lambda value, error: -value
+        )
+        assert sorted(results) == sorted(
+            -value if value == 3 else value * value for value in range(20)
+        )
+        # The pool is rebuilt for the next items.
+        assert executor.map(square, range(5)) == [0, 1, 4, 9, 16]
+
+        with pytest.raises(BrokenProcessPool):
+            list(executor.map_unordered(crash, range(5)))
+
+
+def test_make_executor() -> None:
+    with pytest.raises(ValueError):
+        make_executor("gpu")
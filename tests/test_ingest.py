@@ -0,0 +1,181 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from objects.fd import FD, MVD, NonAtomic
+from objects.ingest import (
+    Schema,
+    load_relation,
+    read_csv,
+    read_jsonl,
+    read_xlsx,
+)
+from objects.policies import make_policy
+from rdbms_normalizer import normalize_to_1NF, normalize_to_5NF
+from tests.test_5NF import CoffeeShopDrinksOrderData
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+def test_schema_statements() -> None:
+    schema = Schema.from_statements(
+        [
+            "Primary Key: {OrderID, DrinkID, FoodID} ",
+            "Candidate Keys: {InvoiceID}, {OrderID, Date}",
+            "Original FD Set: ",
+            "FD1) OrderID -->> DrinkID | FoodID (a MVD) ",
+            "FD2) {OrderID, DrinkID} --> {DrinkSize, Milk}",
+            "CustomerID -> CustomerName",
+            "FD3) DrinkID --> DrinkIngredient (a non-atomic attribute)",
+        ]
+    )
+    assert schema.primary_key == {"OrderID", "DrinkID", "FoodID"}
+    assert schema.candidate_keys == {
+        frozenset({"InvoiceID"}),
+        frozenset({"OrderID", "Date"}),
+    }
+    assert schema.multivalued_dependencies == {
+        MVD(lhs={"OrderID"}, rhs=({"DrinkID"}, {"FoodID"}))
+    }
+    assert schema.functional_dependencies == {
+        FD(lhs={"OrderID", "DrinkID"}, rhs={"DrinkSize", "Milk"}),
+        FD(lhs={"CustomerID"}, rhs={"CustomerName"}),
+    }
+    assert schema.non_atomic_columns == {
+        NonAtomic(lhs={"DrinkID"}, rhs={"DrinkIngredient"})
+    }
+    assert (
+        Schema.from_statements(["Unique Keys: None"]).candidate_keys == set()
+    )
+
+
+def test_read_xlsx() -> None:
+    relation = read_xlsx(
+        ROOT / "TestingData (1NF-5NF) Standard 1NF Processing.xlsx"
+    )
+    assert relation.name == "CoffeeShopData"
+    assert len(relation.columns) == 20
+    assert relation.primary_key == {"OrderID", "DrinkID", "FoodID"}
+    assert len(relation.functional_dependencies) == 6
+    assert relation.multivalued_dependencies == {
+        MVD(lhs={"OrderID"}, rhs=({"DrinkID"}, {"FoodID"}))
+    }
+    # Standard 1NF processing: every multi-valued column depends on the key.
+    assert {
+        column
+        for non_atomic in relation.non_atomic_columns
+        if non_atomic.lhs == relation.primary_key
+        for column in non_atomic.rhs
+    } == {
+        "PromocodeUsed",
+        "DrinkIngredient",
+        "DrinkAllergen",
+        "FoodIngredient",
+        "FoodAllergen",
+    }
+
+    frame: pd.DataFrame | None = relation.data_instances
+    assert frame is not None and len(frame) == 4
+    assert frame["DrinkIngredient"][0] == {"Espresso", "Oat Milk"}
+    assert frame["DrinkAllergen"][0] == {"Oat"}  # Stripped of "\xa0".
+    assert frame["PromocodeUsed"][0] == "NONE"
+    assert frame["TotalFoodCost"][0] == "0"
+    assert list(frame["OrderID"]) == ["1001", "1002", "1002", "1003"]
+
+    first, *_ = normalize_to_1NF(relation)
+    assert first.data is not None and len(first.data) > 0
+
+    special = read_xlsx(
+        ROOT / "TestingData (1NF-5NF) Special 1NF Processing.xlsx",
+        chunk_size=1,
+    )
+    assert NonAtomic(lhs={"OrderID"}, rhs={"PromocodeUsed"}) in (
+        special.non_atomic_columns
+    )
+    assert len(special.non_atomic_columns) == 5
+    assert special.data_instances is not None
+    assert special.data_instances.equals(frame)
+
+
+def test_read_xlsx_5NF() -> None:
+    relation = load_relation(ROOT / "TestingData (5NF violation).xlsx")
+    assert relation.name == "CoffeeShopDrinksOrderData"
+    assert relation.primary_key == CoffeeShopDrinksOrderData.primary_key
+    assert relation.data_instances is not None
+    assert CoffeeShopDrinksOrderData.data_instances is not None
+    assert relation.data_instances.equals(
+        CoffeeShopDrinksOrderData.data_instances
+    )
+    policy = make_policy("fewest_relations")
+    assert [r.columns for r in normalize_to_5NF(relation, policy)] == [
+        r.columns for r in normalize_to_5NF(CoffeeShopDrinksOrderData, policy)
+    ]
+
+
+def test_read_csv(tmp_path: Path) -> None:
+    path: Path = tmp_path / "orders.csv"
+    path.write_text(
+        "OrderID,DrinkID,Quantity,Ingredients\n"
+        "1001,1,2,Espresso; Oat Milk\n"
+        "1001,2,1,Matcha\n"
+        "1002,1,,{Espresso; Oat Milk}\n"
+        "1003,3,1,Ice;Milk\n"
+        "1003,3,1,Ice;Milk\n"
+    )
+    (tmp_path / "orders.schema").write_text(
+        "Primary Key: {OrderID, DrinkID}\n"
+        "DrinkID --> Ingredients (a non-atomic attribute)\n"
+    )
+    relation = read_csv(
+        path, dtypes={"Quantity": "Int64"}, separator=";", chunk_size=2
+    )
+    assert relation.name == "orders"
+    assert relation.primary_key == {"OrderID", "DrinkID"}
+    assert relation.non_atomic_columns == {
+        NonAtomic(lhs={"DrinkID"}, rhs={"Ingredients"})
+    }
+    assert relation.data is not None and len(relation.data) == 5
+    # The dictionaries hold the distinct values of every chunk once.
+    assert list(relation.data.dictionaries["Ingredients"]) == [
+        frozenset({"Espresso", "Oat Milk"}),
+        "Matcha",
+        frozenset({"Ice", "Milk"}),
+    ]
+    frame: pd.DataFrame | None = relation.data_instances
+    assert frame is not None
+    assert list(frame["OrderID"]) == ["1001", "1001", "1002", "1003", "1003"]
+    assert frame["Quantity"][0] == 2 and frame["Quantity"][2] is None
+
+    exploded, *_ = normalize_to_1NF(relation)
+    assert exploded.data is not None
+    assert len(exploded.data.drop_duplicates()) == 5
+
+
+def test_read_jsonl(tmp_path: Path) -> None:
+    path: Path = tmp_path / "drinks.jsonl"
+    rows: list[dict[str, object]] = [
+        {"DrinkID": 1, "Milk": "ND", "Allergens": ["Oat"]},
+        {"DrinkID": 2, "Milk": "D", "Allergens": ["Dairy", "Nuts"]},
+        {"DrinkID": 3, "Milk": "D"},
+    ]
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+    relation = read_jsonl(
+        path,
+        name="Drinks",
+        schema=Schema(primary_key={"DrinkID"}),
+        chunk_size=2,
+    )
+    assert relation.name == "Drinks"
+    assert relation.non_atomic_columns == {
+        NonAtomic(lhs={"DrinkID"}, rhs={"Allergens"})
+    }
+    frame: pd.DataFrame | None = relation.data_instances
+    assert frame is not None
+    assert list(frame["DrinkID"]) == ["1", "2", "3"]
+    assert frame["Allergens"][1] == {"Dairy", "Nuts"}
+    assert frame["Allergens"][2] is None
+
+    with pytest.raises(ValueError):
+        load_relation(tmp_path / "drinks.parquet")
@@ -0,0 +1,116 @@
+import pickle
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from objects.encoding import EncodedData
+from objects.executor import make_executor
+from objects.joins import (
+    JoinCache,
+    JoinDependencyChecker,
+    find_join_dependencies,
+)
+from tests.test_5NF import CoffeeShopDrinksOrderData
+
+
+def joins_to(data: EncodedData, components: list[tuple[str, ...]]) -> bool:
+    join_df: pd.DataFrame = data.project(components[0]).codes_frame()
+    remaining: list[tuple[str, ...]] = components[1:]
+    while remaining:
+        columns = next(c for c in remaining if set(c) & set(join_df.columns))
+        remaining.remove(columns)
+        join_df = pd.merge(join_df, data.project(columns).codes_frame())
+    join_df = join_df[data.columns].sort_values(by=data.columns)
+
+    original_df: pd.DataFrame = data.drop_duplicates().codes_frame()
+    original_df = original_df.sort_values(by=data.columns)
+    return bool(join_df.to_numpy().tolist() == original_df.to_numpy().tolist())
+
+
+def test_join_dependency_checker() -> None:
+    generator = np.random.default_rng(5300)
+    columns: list[str] = ["A", "B", "C", "D"]
+    components: list[tuple[str, ...]] = [
+        tuple(sorted(subset))
+        for size in (2, 3)
+        for subset in combinations(columns, size)
+    ]
+    for _ in range(20):
+        data = EncodedData.from_frame(
+            pd.DataFrame(
+                generator.integers(0, 3, size=(12, 4)), columns=columns
+            )
+        )
+        checker = JoinDependencyChecker(data, components)
+        uncached = JoinDependencyChecker(data, components, max_join_bytes=0)
+        uncached.chunk_rows = 1
+        for size in (2, 3):
+            for combination in combinations(range(len(components)), size):
+                if not checker.connected(combination):
+                    continue
+                covered: set[str] = set().union(
+                    *(components[i] for i in combination)
+                )
+                if covered != set(columns):
+                    continue
+                valid: bool = joins_to(
+                    data, [components[i] for i in combination]
+                )
+                assert checker.holds(combination) == valid
+                assert checker.screen(combination) or not valid
+                rows: int = checker.join_size(combination)
+                assert (rows == checker.rows) == valid
+                assert rows == uncached.join_size(combination)
+        assert len(checker.joins) > 0 and len(uncached.joins) == 0
+
+
+def test_join_cache() -> None:
+    frame = pd.DataFrame({"A": np.arange(100, dtype=np.int32)})
+    size: int = int(frame.memory_usage(index=True).sum())
+    joins = JoinCache(max_bytes=2 * size)
+    joins.put(0b01, frame)
+    joins.put(0b10, frame)
+    assert joins.get(0b01) is frame  # Now the most recently used.
+    joins.put(0b11, frame)
+    assert joins.get(0b10) is None and joins.get(0b01) is frame
+    assert len(joins) == 2
+
+    copy: JoinCache = pickle.loads(pickle.dumps(joins))
+    assert copy.max_bytes == joins.max_bytes and len(copy) == 0
+
+
+@pytest.mark.parametrize("kind", ["serial", "process"])
+def test_find_join_dependencies(kind: str) -> None:
+    assert CoffeeShopDrinksOrderData.data is not None
+    components: list[tuple[str, ...]] = [
+        ("DrinkID", "Milk"),
+        ("CustomerID", "DrinkID", "OrderID"),
+        ("CustomerID", "OrderID"),
+        ("DrinkID", "OrderID"),
+        ("CustomerID", "Milk"),
+    ]
+    with make_executor(kind, workers=2) as executor:
+        assert find_join_dependencies(
+            CoffeeShopDrinksOrderData.data, components, executor
+        ) == [(("DrinkID", "Milk"), ("CustomerID", "DrinkID", "OrderID"))]
+
+
+def test_cyclic_join_dependency() -> None:
+    # The join of every pair of columns is r, but no join of two of them.
+    data = EncodedData.from_frame(
+        pd.DataFrame(
+            [
+                ("a1", "b1", "c2"),
+                ("a1", "b2", "c1"),
+                ("a2", "b1", "c1"),
+                ("a1", "b1", "c1"),
+            ],
+            columns=["A", "B", "C"],
+        )
+    )
+    assert find_join_dependencies(data, [("A", "B"), ("B", "C")]) == []
+    assert find_join_dependencies(
+        data, [("A", "B"), ("B", "C"), ("A", "C")]
+    ) == [(("A", "B"), ("B", "C"), ("A", "C"))]
@@ -0,0 +1,38 @@
+from objects.fd import FD
+from objects.relation import Relation
+
+Teach = Relation(
+    name="TEACH",
+    columns={"Student", "Course", "Instructor"},
+    primary_key={"Student", "Course"},
+    functional_dependencies={
+        FD(lhs={"Student", "Course"}, rhs={"Instructor"}),
+        FD(lhs={"Instructor"}, rhs={"Course"}),
+    },
+)  # Figure 14.14, Page 490
+
+# 30 attribute pairs where A_i → B_i, and B_i → A_i for the first 3 pairs
+# only, so either attribute of those 3 pairs can be in a key: 2^3 candidate
+# keys, among a far larger number of superkeys.
+Chain = Relation(
+    name="CHAIN",
+    columns={f"A{i}" for i in range(30)} | {f"B{i}" for i in range(30)},
+    primary_key={f"A{i}" for i in range(30)},
+    functional_dependencies={
+        FD(lhs={f"A{i}"}, rhs={f"B{i}"}) for i in range(30)
+    }
+    | {FD(lhs={f"B{i}"}, rhs={f"A{i}"}) for i in range(3)},
+)
+
+
+def test_candidate_keys() -> None:
+    assert Teach.compute_candidate_keys() == {
+        frozenset({"Student", "Course"}),
+        frozenset({"Student", "Instructor"}),
+    }
+
+    chain_keys = Chain.compute_candidate_keys()
+    assert len(chain_keys) == 2**3
+    for key in chain_keys:
+        assert Chain.is_superkey(set(key))
+        assert {f"A{i}" for i in range(3, 30)} <= key
@@ -0,0 +1,62 @@
+import io
+import json
+import logging
+from typing import Iterator
+
+import pytest
+
+from objects.fd import FD
+from objects.logs import configure_logging, log_event
+from objects.relation import Relation
+from rdbms_normalizer import normalize_to_2NF
+
+
+class Rendered:
+    count: int = 0
+
+    def __str__(self) -> str:
+        Rendered.count += 1
+        return "rendered"
+
+
+@pytest.fixture
+def stream() -> Iterator[io.StringIO]:
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield io.StringIO()
+    root.handlers[:], root.level = handlers, level
+
+
+def test_log_event(stream: io.StringIO) -> None:
+    logger = logging.getLogger("tests.test_logs")
+    configure_logging(verbosity=0, stream=stream)
+    log_event(logger, logging.DEBUG, "hidden", "%s", Rendered())
+    log_event(logger, logging.INFO, "shown", "%s", Rendered())
+    assert Rendered.count == 1
+    assert stream.getvalue() == "rendered\n"
+
+    configure_logging(verbosity=-1, stream=stream)
+    log_event(logger, logging.INFO, "hidden", "%s", Rendered())
+    assert Rendered.count == 1
+
+
+def test_json_format(stream: io.StringIO) -> None:
+    emp_proj = Relation(
+        name="EMP_PROJ",
+        columns={"Ssn", "Pnumber", "Hours", "Ename"},
+        primary_key={"Ssn", "Pnumber"},
+        functional_dependencies={
+            FD(lhs={"Ssn", "Pnumber"}, rhs={"Hours"}),
+            FD(lhs={"Ssn"}, rhs={"Ename"}),
+        },
+    )
+    configure_logging(verbosity=1, json_format=True, stream=stream)
+    normalize_to_2NF(emp_proj)
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records
+    assert {record["event"] for record in records} == {"partial_dependency"}
+    assert all(
+        record["fields"]["relation"] == "EMP_PROJ"
+        and record["message"].startswith("PFD: ")
+        for record in records
+    )
@@ -0,0 +1,72 @@
+import copy
+import io
+import json
+
+from main import CoffeeShopDataStandard
+from objects.fd import MVD
+from objects.metrics import COUNTERS, NormalizationReport, count
+from rdbms_normalizer import NORMAL_FORMS, Normalizer, normalize_many
+from tests.test_5NF import CoffeeShopDrinksOrderData
+from tests.test_mvd import Emp
+
+
+def test_report() -> None:
+    report = NormalizationReport()
+    Normalizer(copy.deepcopy(CoffeeShopDataStandard), "5NF", report=report)
+    assert report.relation == "CoffeeShopData"
+    assert report.normalize_to == "5NF"
+    assert [stage.name for stage in report.stages] == list(NORMAL_FORMS)
+    assert all(stage.relations > 0 for stage in report.stages)
+    assert report.wall_time == sum(stage.wall_time for stage in report.stages)
+
+    # The decompositions are lazy projections, taken when they are read.
+    first = report.stages[0]
+    assert first.counters["rows_exploded"] == 0
+    assert report.counters["rows_exploded"] > 0
+    assert report.stages[1].counters["fd_checks"] > 0
+    assert report.stages[1].counters["closures"] > 0
+    assert report.counters["projections"] == sum(
+        stage.counters["projections"] for stage in report.stages
+    )
+
+    stream = io.StringIO()
+    document = json.loads(report.to_json(stream))
+    assert json.loads(stream.getvalue()) == document
+    assert set(document["counters"]) == set(COUNTERS)
+    assert [stage["stage"] for stage in document["stages"]] == list(
+        NORMAL_FORMS
+    )
+
+
+def test_report_counts_stage() -> None:
+    report = NormalizationReport()
+    count("verify_mvd")  # Outside of a stage, nothing is counted.
+    with report.stage("4NF"):
+        Emp.verify_mvd(MVD(lhs={"Ename"}, rhs=({"Pname"}, {"Dname"})))
+    with report.stage("5NF"):
+        Normalizer(copy.deepcopy(CoffeeShopDrinksOrderData), "5NF")
+    assert report.stages[0].counters["verify_mvd"] == 1
+    assert report.stages[1].counters["verify_mvd"] == 0
+    assert report.stages[1].counters["join_rows"] > 0
+
+
+def test_normalize_many_report() -> None:
+    results = list(
+        normalize_many(
+            [copy.deepcopy(CoffeeShopDrinksOrderData)],
+            "BCNF",
+            workers=1,
+            measure=True,
+        )
+    )
+    assert results[0].report is not None
+    assert [stage.name for stage in results[0].report.stages] == [
+        "1NF",
+        "2NF",
+        "3NF",
+        "BCNF",
+    ]
+    assert (
+        list(normalize_many([CoffeeShopDrinksOrderData], "1NF", 1))[0].report
+        is None
+    )
@@ -0,0 +1,71 @@
+from objects.fd import MVD
+from objects.relation import Relation
+
+Emp = Relation(
+    name="EMP",
+    columns={"Ename", "Pname", "Dname"},
+    primary_key={"Ename", "Pname", "Dname"},
+    data_instances=[
+        {"Ename": "Smith", "Pname": "X", "Dname": "John"},
+        {"Ename": "Smith", "Pname": "Y", "Dname": "Anna"},
+        {"Ename": "Smith", "Pname": "X", "Dname": "Anna"},
+        {"Ename": "Smith", "Pname": "Y", "Dname": "John"},
+        {"Ename": "Brown", "Pname": "W", "Dname": "Jim"},
+        {"Ename": "Brown", "Pname": "X", "Dname": "Jim"},
+        {"Ename": "Brown", "Pname": "W", "Dname": "Joan"},
+        {"Ename": "Brown", "Pname": "X", "Dname": "Joan"},
+        {"Ename": "Jones", "Pname": "Z", "Dname": "Bob"},
+    ],
+)  # Figure 15.4, Page 529
+
+Emp_Violating = Relation(
+    name="EMP",
+    columns={"Ename", "Pname", "Dname"},
+    primary_key={"Ename", "Pname", "Dname"},
+    data_instances=[
+        {"Ename": "Smith", "Pname": "X", "Dname": "John"},
+        {"Ename": "Smith", "Pname": "Y", "Dname": "Anna"},
+        {"Ename": "Smith", "Pname": "X", "Dname": "Anna"},
+        {"Ename": "Brown", "Pname": "W", "Dname": "Jim"},
+    ],
+)  # Missing the tuple (Smith, Y, John)
+
+
+def test_mvd() -> None:
+    mvd = MVD(lhs={"Ename"}, rhs=({"Pname"}, {"Dname"}))
+
+    assert Emp.verify_mvd(mvd)
+    assert Emp.mvd_violations(mvd).empty
+
+    assert not Emp_Violating.verify_mvd(mvd)
+    violations = Emp_Violating.mvd_violations(mvd)
+    assert list(violations["Ename"]) == ["Smith"]
+
+    assert not Emp.verify_mvd(MVD(lhs={"Pname"}, rhs=({"Ename"}, {"Dname"})))
+
+
+def test_determine_mvds() -> None:
+    assert Emp.determine_mvds() == {
+        MVD(lhs={"Ename"}, rhs=({"Dname"}, {"Pname"})),
+        MVD(lhs={"Dname"}, rhs=({"Ename"}, {"Pname"})),  # Dname → Ename
+    }
+    assert (
+        MVD(lhs={"Ename"}, rhs=({"Dname"}, {"Pname"}))
+        not in Emp_Violating.determine_mvds()
+    )
+
+    # Y with more than one attribute: Ename ->> Pname,Budget | Dname
+    assert Emp.data_instances is not None
+    emp_budget = Relation(
+        name="EMP",
+        columns={"Ename", "Pname", "Budget", "Dname"},
+        primary_key={"Ename", "Pname", "Dname"},
+        data_instances=[
+            {**row, "Budget": "100" if row["Pname"] in "XW" else "200"}
+            for row in Emp.data_instances.to_dict("records")
+        ],
+    )
+    mvds = emp_budget.determine_mvds()
+    assert MVD(lhs={"Ename"}, rhs=({"Budget", "Pname"}, {"Dname"})) in mvds
+    for mvd in mvds:
+        assert emp_budget.verify_mvd(mvd)
@@ -0,0 +1,97 @@
+import copy
+import os
+
+import pytest
+
+from objects.fd import FD
+from objects.policies import DecisionPolicy
+from objects.relation import Relation
+from rdbms_normalizer import normalize_many, normalize_to_3NF
+from tests.test_5NF import (
+    CoffeeShopDrinksOrderData,
+    CoffeeShopOrderSummaryData,
+)
+
+
+class FailingPolicy(DecisionPolicy):
+    def choose(self, relation: Relation, options: list[list[set[str]]]) -> int:
+        if relation.columns == CoffeeShopDrinksOrderData.columns:
+            raise RuntimeError(f"No choice for {relation.name}")
+        return super().choose(relation, options)
+
+
+class CrashingPolicy(DecisionPolicy):
+    def choose(self, relation: Relation, options: list[list[set[str]]]) -> int:
+        if relation.columns == CoffeeShopDrinksOrderData.columns:
+            os._exit(1)
+        return super().choose(relation, options)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_normalize_many(workers: int) -> None:
+    relations: list[Relation] = [
+        CoffeeShopOrderSummaryData,
+        CoffeeShopDrinksOrderData,
+        CoffeeShopOrderSummaryData,
+    ]
+    results = sorted(
+        normalize_many(relations, "5NF", workers, FailingPolicy()),
+        key=lambda result: result.position,
+    )
+    assert [result.position for result in results] == [0, 1, 2]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].relations and results[2].relations
+    assert results[1].relations == []
+    assert results[1].error is not None
+    assert "RuntimeError: No choice for" in results[1].error
+
+
+def test_normalize_many_crash() -> None:
+    relations: list[Relation] = [CoffeeShopOrderSummaryData] * 3
+    relations.insert(1, CoffeeShopDrinksOrderData)
+    results = sorted(
+        normalize_many(relations, "5NF", 2, CrashingPolicy()),
+        key=lambda result: result.position,
+    )
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert results[1].error is not None
+    assert "BrokenProcessPool" in results[1].error
+    assert all(result.relations for result in results if result.ok)
+
+
+def test_normalize_many_normal_form() -> None:
+    with pytest.raises(ValueError):
+        normalize_many([], "6NF")
+
+
+def test_decomposition_shares_dependencies() -> None:
+    transitive = FD({"B"}, {"C"})
+    relation = Relation(
+        name="Data",
+        columns={"A", "B", "C"},
+        primary_key={"A"},
+        functional_dependencies={FD({"A"}, {"B"}), transitive},
+    )
+    decomposed, base = normalize_to_3NF(relation)
+    assert decomposed.columns == {"B", "C"}
+    assert decomposed.universe is relation.universe
+    (fd,) = decomposed.functional_dependencies
+    assert fd is transitive
+    assert decomposed.candidate_keys == {frozenset({"B"})}
+    assert base.columns == {"A", "B"}
+
+    parent = copy.deepcopy(CoffeeShopDrinksOrderData)
+    assert parent.data is not None
+    drinks = Relation.from_decomposition(
+        name="Drinks",
+        columns={"DrinkID", "Milk"},
+        primary_key={"DrinkID", "Milk"},
+        universe=parent.universe,
+        data_instances=parent.data,
+    )
+    assert drinks.data is parent.data
+    assert drinks.functional_dependencies == set()
+    drinks.add_functional_dependency(FD({"DrinkID"}, {"Milk"}))
+    assert drinks.candidate_keys == set()
+    drinks.update_candidate_keys()
+    assert drinks.candidate_keys == {frozenset({"DrinkID"})}
@@ -0,0 +1,27 @@
+import pytest
+
+from objects.policies import PromptPolicy, make_policy
+from tests.test_mvd import Emp
+
+OPTIONS: list[list[set[str]]] = [
+    [{"Ename", "Pname"}, {"Ename", "Dname"}],
+    [{"Ename", "Pname", "Dname"}],
+    [{"Ename"}, {"Pname"}, {"Dname"}],
+]
+
+
+def test_policies() -> None:
+    assert make_policy().choose(Emp, OPTIONS) == 1  # The first of 3 columns
+    assert make_policy("fewest_relations").choose(Emp, OPTIONS) == 1
+    # The 9 rows of 3 values are stored as 5 + 5 rows of 2 values.
+    assert make_policy("saving").cost(Emp, OPTIONS[0]) == (20,)
+    assert make_policy("saving").cost(Emp, OPTIONS[1]) == (27,)
+    assert make_policy("saving").choose(Emp, OPTIONS) == 2
+    with pytest.raises(ValueError):
+        make_policy("random")
+
+
+def test_prompt_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("builtins.input", lambda prompt: "1")
+    assert PromptPolicy().choose(Emp, OPTIONS) == 1
+    assert PromptPolicy().choose(Emp, OPTIONS[:1]) == 0
@@ -0,0 +1,35 @@
+import numpy as np
+
+from objects.attributes import is_subset
+from objects.subsumption import SubsumptionIndex, remove_subsumed
+
+
+def test_subsumption_index() -> None:
+    index = SubsumptionIndex()
+    index.add(0b0111)
+    index.add(0b1100)
+    assert len(index) == 2
+    assert 0b0111 in index and 0b0011 not in index
+    assert index.subsumes(0b0011)
+    assert index.subsumes(0b1100)
+    assert index.subsumes(0)
+    assert not index.subsumes(0b1001)
+    assert not SubsumptionIndex().subsumes(0)
+
+
+def test_remove_subsumed() -> None:
+    generator = np.random.default_rng(5300)
+    for _ in range(50):
+        masks: list[int] = [
+            int(mask) for mask in generator.integers(0, 64, size=12)
+        ]
+        expected: list[int] = [
+            i
+            for i, mask in enumerate(masks)
+            if not any(
+                is_subset(mask, other) and (mask != other or j < i)
+                for j, other in enumerate(masks)
+                if j != i
+            )
+        ]
+        assert remove_subsumed(masks) == expected
@@ -0,0 +1,96 @@
+import json
+from functools import reduce
+
+import pandas as pd
+
+from objects.fd import FD, MVD
+from objects.synthetic import generate_relation
+
+
+def test_planted_dependencies() -> None:
+    relation, truth = generate_relation(
+        columns=12, rows=2000, fds=3, mvds=2, jds=1, distinct=50, seed=1
+    )
+    assert relation.data is not None and len(relation.data) > 1500
+    assert len(relation.columns) == 12
+    assert relation.functional_dependencies == truth.fds
+    assert relation.multivalued_dependencies == truth.mvds
+    assert len(truth.fds) == 3 and len(truth.mvds) == 2
+    assert truth.noisy_rows == []
+
+    frame: pd.DataFrame = relation.data.to_frame()
+    for fd in truth.fds:
+        (rhs,) = fd.rhs
+        assert frame.groupby(sorted(fd.lhs))[rhs].nunique().max() == 1
+    for mvd in truth.mvds:
+        assert relation.verify_mvd(mvd)
+    assert not frame.duplicated(sorted(truth.primary_key)).any()
+
+    (jd,) = truth.jds
+    joined: pd.DataFrame = reduce(
+        lambda left, right: left.merge(right),
+        (frame[sorted(component)].drop_duplicates() for component in jd),
+    )
+    assert len(joined) == len(frame)
+    # The JD implies no MVD of its columns on their own.
+    assert not relation.verify_mvd(
+        MVD(lhs={"K", "J0A"}, rhs=({"J0B"}, {"J0C"}))
+    )
+
+    assert json.loads(json.dumps(truth.to_dict()))["jds"] == [
+        [sorted(component) for component in jd]
+    ]
+
+
+def test_non_atomic_and_noise() -> None:
+    relation, truth = generate_relation(
+        columns=6,
+        rows=1000,
+        fds=1,
+        mvds=0,
+        non_atomic=1,
+        noise=0.05,
+        declare=False,
+    )
+    assert relation.functional_dependencies == set()
+    assert relation.non_atomic_columns == truth.non_atomic_columns
+    assert relation.data is not None
+    assert len(truth.noisy_rows) == int(0.05 * len(relation.data))
+    assert truth.primary_key == {"K", "B0_0", "B0_1", "B0_2"}
+    frame: pd.DataFrame = relation.data.to_frame()
+    assert all(isinstance(cell, set) for cell in frame["N0"])
+
+
+def test_skew() -> None:
+    frequencies: list[float] = []
+    for skew in (0.0, 2.0):
+        relation, _ = generate_relation(
+            columns=4, rows=1000, fds=0, mvds=0, skew=skew
+        )
+        assert relation.data is not None
+        frame: pd.DataFrame = relation.data.to_frame()
+        frequencies.append(frame["B0_0"].value_counts(normalize=True).max())
+    assert frequencies[1] > 4 * frequencies[0]
+
+
+def test_recall() -> None:
+    relation, truth = generate_relation(
+        columns=8, rows=400, fds=2, mvds=1, distinct=30, declare=False
+    )
+    assert truth.fd_recall(relation.discover_fds()) == 1.0
+    assert truth.mvd_recall(relation.determine_mvds()) == 1.0
+    assert truth.fd_recall([]) == 0.0
+    fd_1, fd_2 = sorted(truth.fds, key=lambda fd: sorted(fd.lhs))
+    assert truth.fd_recall([fd_1]) == 0.5
+    assert truth.fd_recall([FD(fd_1.lhs, fd_1.rhs | fd_2.lhs), fd_2]) == 1.0
+
+    (mvd,) = truth.mvds
+    assert truth.mvd_recall([MVD(mvd.lhs, (mvd.rhs[1], mvd.rhs[0]))]) == 1.0
+    assert truth.jd_recall([]) == 1.0  # No JD is planted.
+
+
+def test_jd_recall() -> None:
+    _, truth = generate_relation(columns=6, fds=0, mvds=0, jds=1)
+    (jd,) = truth.jds
+    assert truth.jd_recall([reversed(jd)]) == 1.0
+    assert truth.jd_recall([jd[:2]]) == 0.0